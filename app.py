@@ -1,12 +1,12 @@
 from __future__ import annotations
 
 from config import AppConfig, ResolvedSecrets
-from ui.tui_app import TinyMoltyApp, _TextualUIAdapter
-from ui.telegram_ui import TelegramUI
-from ui.multi import MultiUI
 
 
 def build_ui(config: AppConfig, secrets: ResolvedSecrets):
+    # Textual is imported only here so headless runs never load it.
+    from ui.tui_app import TinyMoltyApp
+
     # Check if Telegram is enabled
     if config.telegram.enabled and secrets.telegram_token:
         print("[App] 🔧 Telegram enabled, setting up MultiUI...")
@@ -2,8 +2,10 @@ from __future__ import annotations
 
 import asyncio
 import json
-import random
-from datetime import datetime
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
 from typing import Iterable
 
 import httpx
@@ -13,11 +15,100 @@ from command_router import CommandRouter
 from config import AppConfig
 from llm.base import LLMProvider
 from moltbook.client import MoltbookClient
-from moltbook.models import FeedResponse, Post
+from moltbook.models import AgentProfile, Post
+from observability import metrics, profiling, quantiles, tracing
+from observability.activity_log import ActivityLog
+from pipeline import Pipeline, Stage
 from scheduler import Scheduler
+from storage import FollowCache, InteractionJournal, SeenIndex
 from ui.base import UserInterface
 
 
+# Actions that _tick starts on its own; comment/upvote/follow happen inside a browse.
+TICK_ACTIONS = ("heartbeat", "browse", "post")
+
+# Feeds ordered newest-first, where a high-water mark can cut off old posts.
+CHRONOLOGICAL_FEEDS = {"new"}
+
+LLM_WARMUP_TIMEOUT_SECONDS = 10.0
+
+# Default capture windows for /profile cpu and /profile mem.
+PROFILE_SECONDS = {"cpu": 10.0, "mem": 30.0}
+
+TICK_SECONDS = metrics.histogram(
+    "tinymolty_engine_tick_seconds", "Time an engine tick spends working, excluding the sleep that follows"
+)
+FEED_PAGES = metrics.counter("tinymolty_feed_pages", "Feed pages fetched, by sort", ["agent", "sort"])
+FEED_PAGES_UNCHANGED = metrics.counter(
+    "tinymolty_feed_pages_unchanged",
+    "Feed pages identical to the last fetch, so scoring was skipped",
+    ["agent", "sort"],
+)
+SEEN_CHECKS = metrics.counter("tinymolty_seen_index_checks", "Fetched posts looked up in the seen index", ["agent"])
+SEEN_HITS = metrics.counter("tinymolty_seen_index_hits", "Fetched posts the seen index already knew", ["agent"])
+
+
+def _as_utc(value: datetime | None) -> datetime | None:
+    if value is None or value.tzinfo is not None:
+        return value
+    return value.replace(tzinfo=timezone.utc)
+
+
+@dataclass(slots=True)
+class _Watermark:
+    """Newest post seen on a chronological feed."""
+
+    # Every post seen at ``created_at``: timestamps have second precision, so ties happen.
+    post_ids: set[str]
+    created_at: datetime | None = None
+
+    def is_newer(self, post: Post) -> bool:
+        if post.id in self.post_ids:
+            return False
+        created_at = _as_utc(post.created_at)
+        if self.created_at is not None and created_at is not None:
+            return created_at >= self.created_at
+        return True
+
+    def is_below(self, post: Post) -> bool:
+        """Whether a newest-first page has moved past the mark, so the rest is old."""
+        created_at = _as_utc(post.created_at)
+        if self.created_at is not None and created_at is not None:
+            return created_at < self.created_at
+        return post.id in self.post_ids
+
+
+@dataclass(slots=True)
+class _Batch:
+    """Posts from one feed page on their way to the scorer."""
+
+    sort: str
+    fingerprint: str
+    posts: list[Post]
+    # Set when the page was unchanged and the previous ranking is reused.
+    ranked: list[Post] | None = None
+
+
+@dataclass(slots=True)
+class _BrowsePass:
+    """State shared by the pipeline stages of a single browse."""
+
+    seen_ids: set[str] = field(default_factory=set)
+    fetched_posts: int = 0
+    # Authors of interesting posts, candidates for following.
+    authors: dict[str, AgentProfile] = field(default_factory=dict)
+    # LLM interest score per post id, used by quota pacing.
+    scores: dict[str, float] = field(default_factory=dict)
+    total_posts: int = 0
+    # Posts never seen before, as opposed to reused or already-seen ones.
+    new_posts: int = 0
+    interesting_posts: int = 0
+    interacted: bool = False
+    details: dict = field(
+        default_factory=lambda: {"comments": [], "upvotes": [], "follows": [], "failures": []}
+    )
+
+
 class BotEngine:
     def __init__(
         self,
@@ -26,31 +117,72 @@ class BotEngine:
         llm: LLMProvider,
         scheduler: Scheduler,
         ui: UserInterface,
+        seen_index: SeenIndex | None = None,
+        journal: InteractionJournal | None = None,
+        follow_cache: FollowCache | None = None,
+        activity: ActivityLog | None = None,
     ) -> None:
         self.config = config
         self.client = client
         self.llm = llm
         self.scheduler = scheduler
+        # Time and randomness come from the scheduler so simulations can swap both.
+        self.clock = scheduler.clock
         self.ui = ui
+        self.seen_index = seen_index
+        self.journal = journal
+        self.follow_cache = follow_cache
+        self.activity = activity
         self._command_router = CommandRouter(self.llm)
         self._running = False
         self._paused = False
         self._post_failures = 0
         self._command_task: asyncio.Task | None = None
+        self._profile_task: asyncio.Task | None = None
+        self._watermarks: dict[str, _Watermark] = {}
+        # Last ranking per feed, keyed by the fingerprint of the page it came from.
+        self._rankings: dict[str, tuple[str, list[Post]]] = {}
+        self._fingerprint_checks = 0
+        self._fingerprint_hits = 0
+        # Posts looked up in the seen index, and how many were already there.
+        self._seen_checks = 0
+        self._seen_hits = 0
+        self._prepared = False
+        self._started_at: float | None = None
+        self.time_to_first_browse: float | None = None
 
     async def run(self) -> None:
         self._running = True
-        await self.ui.start()
+        await asyncio.gather(self.ui.start(), self.prepare())
         try:
             await self.run_loop()
         finally:
             await self.ui.stop()
 
-    async def run_loop(self) -> None:
-        self._running = True
+    async def prepare(self) -> None:
+        """Check the account and warm up the LLM connection, concurrently.
+
+        run_loop calls this itself; callers may run it alongside ``ui.start()``
+        so Telegram setup, the account check and the LLM handshake overlap.
+        """
+        if self._prepared:
+            return
+        self._prepared = True
+        self._started_at = self.clock.monotonic()
+        self._activity("start")
         await self.ui.send_status("🦀 TinyMolty started.")
+        await asyncio.gather(self._check_account(), self._warm_up_llm())
+
+    async def _warm_up_llm(self) -> None:
+        try:
+            await asyncio.wait_for(self.llm.warmup(), timeout=LLM_WARMUP_TIMEOUT_SECONDS)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # Only an optimization: the first real call will connect instead.
+            pass
 
-        # Check account status
+    async def _check_account(self) -> None:
         try:
             response = await self.client.get_me()
             # API returns {"success": true, "agent": {...}}
@@ -106,39 +238,57 @@ class BotEngine:
                 await self.ui.send_status(f"⚠️  Could not verify account: {type(e).__name__}: {error_msg[:80]}")
             await self.ui.send_status(f"   Continuing anyway - browse should work with valid API key")
 
-        while self._running:
-            # Always handle commands, even when paused (so /resume and /quit work)
-            try:
-                await self._handle_commands()
-            except Exception as exc:
-                try:
-                    await self.ui.send_status(f"⚠️ Command handler error: {type(exc).__name__}")
-                except Exception:
-                    pass
+    async def run_loop(self) -> None:
+        self._running = True
+        await self.prepare()
 
-            if self._paused:
-                await asyncio.sleep(0.2)
-                continue
+        # Commands arrive on their own task so /resume and /quit work while paused or sleeping.
+        self._command_task = asyncio.create_task(self._command_pump())
+        try:
+            while self._running:
+                if self._paused:
+                    # Sleep until /resume or /quit wakes the scheduler.
+                    await self.scheduler.wait()
+                    continue
 
+                try:
+                    await self._tick()
+                except asyncio.CancelledError:
+                    raise
+                except Exception as exc:
+                    self._activity("tick", outcome="error", error=f"{type(exc).__name__}: {str(exc)[:200]}")
+                    try:
+                        await self.ui.send_status(
+                            f"❌ Engine loop error: {type(exc).__name__}: {str(exc)[:200]}"
+                        )
+                    except Exception:
+                        pass
+                    await asyncio.sleep(5)
+        finally:
+            self._command_task.cancel()
+            try:
+                await self._command_task
+            except asyncio.CancelledError:
+                pass
+            self._command_task = None
+            if self._profile_task is not None:
+                self._profile_task.cancel()
+            self._activity("stop")
+
+    async def _command_pump(self) -> None:
+        while self._running:
+            raw = await self.ui.wait_command()
             try:
-                await self._tick()
+                await self.handle_command(raw)
             except asyncio.CancelledError:
                 raise
             except Exception as exc:
                 try:
-                    await self.ui.send_status(
-                        f"❌ Engine loop error: {type(exc).__name__}: {str(exc)[:200]}"
-                    )
+                    await self.ui.send_status(f"⚠️ Command handler error: {type(exc).__name__}")
                 except Exception:
                     pass
-                await asyncio.sleep(5)
-
-    async def _handle_commands(self) -> None:
-        # Kept for compatibility with older call sites; command_pump is the primary mechanism.
-        raw = await self.ui.get_command()
-        if not raw:
-            return
-        await self.handle_command(raw)
+            # Let the loop re-evaluate right away instead of at the end of its sleep.
+            self.scheduler.wake()
 
     async def handle_command(self, raw: str) -> None:
         text = raw.strip()
@@ -171,16 +321,19 @@ class BotEngine:
             return
         if result.source == "llm":
             await self.ui.send_status(f"🦀 Interpreted as /{result.command}")
+        self._activity("command", command=result.command, source=result.source)
         await self._run_command(result.command, raw=text)
 
     async def _run_command(self, command: str, raw: str) -> None:
         if command == "pause":
             self._paused = True
+            self.scheduler.wake()
             msg = "⏸️  Paused."
             await self.ui.send_status(msg)
             await self.ui.send_summary(msg)
         elif command == "resume":
             self._paused = False
+            self.scheduler.wake()
             msg = "▶️  Resumed."
             await self.ui.send_status(msg)
             await self.ui.send_summary(msg)
@@ -189,21 +342,52 @@ class BotEngine:
             await self.ui.send_status(f"{state}")
             # Show next action times (detailed, for terminal only)
             next_actions = []
-            for action in ["browse", "post", "comment", "heartbeat"]:
-                wait = self.scheduler.next_available_in(action)
+            for action, wait in self.status_snapshot()["next"].items():
                 if wait > 0:
                     next_actions.append(f"{action}={int(wait)}s")
                 else:
                     next_actions.append(f"{action}=ready")
             await self.ui.send_status(f"   Next: {', '.join(next_actions)}")
+            if self.time_to_first_browse is not None:
+                await self.ui.send_status(f"   Startup: first browse {self.time_to_first_browse:.1f}s after start")
+            if self.scheduler.arrival_rate is not None:
+                await self.ui.send_status(
+                    f"   Feed velocity: {self.scheduler.arrival_rate:.2f} new posts/min, "
+                    f"browsing every {self.scheduler.browse_interval_seconds() / 60:.0f} min "
+                    f"for up to {self.scheduler.feed_limit()} posts"
+                )
+            if self._fingerprint_checks:
+                await self.ui.send_status(
+                    f"   Feed cache: {self._fingerprint_hits}/{self._fingerprint_checks} pages unchanged "
+                    f"({self.feed_skip_rate:.0%} scoring skipped)"
+                )
+            if self._seen_checks:
+                await self.ui.send_status(
+                    f"   Seen index: {self._seen_hits}/{self._seen_checks} posts already seen "
+                    f"({self._seen_hits / self._seen_checks:.0%} hit rate)"
+                )
+            for line in self._latency_lines():
+                await self.ui.send_status(line)
+            if self.journal is not None:
+                midnight = self.clock.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+                since = midnight.replace(tzinfo=timezone.utc).timestamp()
+                counts = await asyncio.to_thread(self.journal.counts_since, since)
+                await self.ui.send_status(
+                    "   Today: "
+                    f"{counts['seen']} seen, {counts['comment']} comments, {counts['upvote']} upvotes, "
+                    f"{counts['follow']} follows, {counts['post']} posts, {counts['failure']} failures"
+                )
             # Send concise summary to Telegram
             await self.ui.send_summary(f"{state}")
         elif command == "help":
-            msg = "⌨️ Commands: /pause /resume /status /quit /help"
+            msg = "⌨️ Commands: /pause /resume /status /quit /help /profile cpu|mem [seconds]"
             await self.ui.send_status(msg)
             await self.ui.send_summary(msg)
+        elif command == "profile":
+            await self._start_profile(raw)
         elif command == "quit":
             self._running = False
+            self.scheduler.wake()
             msg = "👋 Shutting down."
             await self.ui.send_status(msg)
             await self.ui.send_summary(msg)
@@ -212,105 +396,418 @@ class BotEngine:
             await self.ui.send_status(msg)
             await self.ui.send_summary(msg)
 
+    async def _start_profile(self, raw: str) -> None:
+        # Arguments only come with the slash form; an LLM-interpreted request gets the defaults.
+        args = raw.split()[1:] if raw.startswith("/") else []
+        kind = args[0].lower() if args else "cpu"
+        try:
+            seconds = float(args[1]) if len(args) > 1 else PROFILE_SECONDS.get(kind, 0.0)
+        except ValueError:
+            seconds = 0.0
+        if kind not in PROFILE_SECONDS or seconds <= 0:
+            msg = "⌨️ Usage: /profile cpu [seconds] or /profile mem [seconds]"
+            await self.ui.send_status(msg)
+            await self.ui.send_summary(msg)
+            return
+        # Capture on its own task so the command pump stays free for /pause or /quit.
+        self._profile_task = asyncio.create_task(self._profile(kind, seconds))
+        msg = f"🔬 Profiling {'CPU' if kind == 'cpu' else 'memory'} for {seconds:g}s, the bot keeps running"
+        await self.ui.send_status(msg)
+        await self.ui.send_summary(msg)
+
+    async def _profile(self, kind: str, seconds: float) -> None:
+        suffix = ".pstats" if kind == "cpu" else ".tracemalloc"
+        name = f"{self.config.bot.name}-{kind}-{self.clock.utcnow():%Y%m%d-%H%M%S}{suffix}"
+        path = Path(self.config.storage.data_dir).expanduser() / "profiles" / name
+        capture = profiling.profile_cpu if kind == "cpu" else profiling.profile_memory
+        try:
+            report = await capture(seconds, path)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            msg = f"⚠️ Profile failed: {type(exc).__name__}: {exc}"
+            await self.ui.send_status(msg)
+            await self.ui.send_summary(msg)
+            return
+        if kind == "cpu":
+            title = f"🔬 CPU profile ({report.seconds:g}s), top by self time:"
+        elif report.seconds:
+            title = f"🔬 Memory allocated in {report.seconds:g}s and still held:"
+        else:
+            title = "🔬 Memory held, top source lines:"
+        msg = "\n".join([title, *(f"   {line}" for line in report.lines), f"   Saved to {report.path}"])
+        await self.ui.send_status(msg)
+        await self.ui.send_summary(msg)
+
+    def _latency_lines(self) -> list[str]:
+        """Recent latency percentiles, rate-limiter waits and daily quota use for /status."""
+        lines = []
+        for group, title in (("moltbook", "Moltbook latency"), ("llm", "LLM latency")):
+            sketches = quantiles.LATENCIES.group(group)
+            if sketches:
+                lines.append(f"   {title} (last 1-2h):")
+                lines.extend(f"      {quantiles.percentile_line(label, sketch)}" for label, sketch in sketches.items())
+        wait = quantiles.LATENCIES.group("rate_limit").get("wait")
+        if wait is not None:
+            lines.append(
+                f"   {quantiles.percentile_line('Rate limiter wait', wait)}, {quantiles.format_seconds(wait.sum)} total"
+            )
+        usage = self.scheduler.daily_usage()
+        if usage:
+            lines.append(
+                "   Daily quota: " + ", ".join(f"{action} {used}/{cap}" for action, (used, cap) in usage.items())
+            )
+        return lines
+
+    def apply_config(self, config: AppConfig) -> None:
+        """Switch to a reloaded config.
+
+        Behavior, personality and pipeline settings take effect on the next
+        tick; LLM, credential and storage changes need a restart.
+        """
+        self.config = config
+        self.scheduler.update_config(config.behavior, config.advanced)
+
+    def stop(self) -> None:
+        """Ask run_loop to finish after the current step."""
+        self._running = False
+        self.scheduler.wake()
+
+    def status_snapshot(self) -> dict:
+        """Plain-data view of the engine state, for aggregated status across agents."""
+        return {
+            "running": self._running,
+            "paused": self._paused,
+            "next": {
+                action: self.scheduler.next_available_in(action)
+                for action in ("browse", "post", "comment", "heartbeat")
+            },
+            "feed_skip_rate": self.feed_skip_rate,
+            "time_to_first_browse": self.time_to_first_browse,
+        }
+
     async def _tick(self) -> None:
         if not self._running:
             return
-        await self._maybe_heartbeat()
-        await self._maybe_browse()
-        await self._maybe_post()
-        next_wait = min(
-            [
-                self.scheduler.next_available_in("browse"),
-                self.scheduler.next_available_in("comment"),
-                self.scheduler.next_available_in("post"),
-                self.scheduler.next_available_in("heartbeat"),
-            ]
-        )
+        started = time.perf_counter()
+        with tracing.span("tick", agent=self.config.bot.name) as span:
+            await self._maybe_heartbeat()
+            await self._maybe_browse()
+            await self._maybe_post()
+        TICK_SECONDS.observe(time.perf_counter() - started)
+        await self._report_slow_tick(span)
+        action, next_wait = self.scheduler.next_due(TICK_ACTIONS)
         # CRITICAL: Always yield control, even if actions are ready.
         # This prevents tight loops that starve the event loop.
         if next_wait <= 0:
             # Small yield to let other tasks (command handler, UI) run
             await asyncio.sleep(0.1)
             return
+        if action is None:
+            # Nothing is enabled; sleep until a command wakes us.
+            await self.ui.update_activity("⏱️ Idle (no scheduled actions)")
+            await self.scheduler.wait()
+            return
         # Show what we're waiting for
-        await self.ui.update_activity(f"⏱️ Next action in {int(next_wait)}s")
+        await self.ui.update_activity(f"⏱️ Next action ({action}) in {int(next_wait)}s")
         await self._sleep_interruptible(next_wait)
 
+    async def _report_slow_tick(self, span: tracing.Span | None) -> None:
+        threshold = self.config.observability.trace_summary_seconds
+        if span is None or not threshold or not span.children or span.duration < threshold:
+            return
+        lines = tracing.flame_lines(span)
+        await self.ui.send_status("🔥 Slow tick:\n" + "\n".join(f"   {line}" for line in lines))
+
     async def _sleep_interruptible(self, base_seconds: float) -> None:
-        remaining = max(0.0, base_seconds) + self.scheduler.jitter()
-        remaining = max(0.0, remaining)
-        while remaining > 0 and self._running:
-            if self._paused:
-                break
-            # Avoid waking too frequently during long backoffs; keep commands responsive.
-            step = 0.5 if remaining < 30 else 2.0
-            step = min(step, remaining)
-            await asyncio.sleep(step)
-            remaining -= step
+        """Sleep until the next deadline, waking early for commands, pause/resume or backoff changes."""
+        remaining = max(0.0, max(0.0, base_seconds) + self.scheduler.jitter())
+        if remaining > 0 and self._running and not self._paused:
+            await self.scheduler.wait(remaining)
 
     async def _maybe_heartbeat(self) -> None:
         if not self.scheduler.can_do("heartbeat"):
             return
-        try:
-            await self.ui.update_activity("🦀 Sending heartbeat")
-            await self.client.heartbeat()
-            self.scheduler.record_action("heartbeat")
-            await self.ui.send_status("💓 Heartbeat sent successfully")
-            # No summary for heartbeat - too frequent
-        except Exception as e:
-            error_msg = f"❌ Heartbeat failed: {type(e).__name__}: {str(e)}"
-            await self.ui.send_status(error_msg)
-            await self.ui.send_summary(error_msg)
+        with tracing.span("heartbeat"):
+            started = self.clock.monotonic()
+            try:
+                await self.ui.update_activity("🦀 Sending heartbeat")
+                await self.client.heartbeat()
+                self.scheduler.record_action("heartbeat")
+                self._activity("heartbeat", started=started)
+                await self.ui.send_status("💓 Heartbeat sent successfully")
+                # No summary for heartbeat - too frequent
+            except Exception as e:
+                self._activity("heartbeat", outcome="error", started=started, error=f"{type(e).__name__}: {e}")
+                error_msg = f"❌ Heartbeat failed: {type(e).__name__}: {str(e)}"
+                await self.ui.send_status(error_msg)
+                await self.ui.send_summary(error_msg)
 
     async def _maybe_browse(self) -> None:
         if not self.scheduler.can_do("browse"):
             return
+        with tracing.span("browse"):
+            await self._browse()
+
+    async def _browse(self) -> None:
+        started = self.clock.monotonic()
+        browse = _BrowsePass()
+        error: str | None = None
         try:
             await self.ui.update_activity("🦀 Browsing feed")
-            feed_sort = self.config.behavior.feed_sort
-            feed_limit = self.config.behavior.feed_limit
-            if feed_sort == "both":
-                new_limit = (feed_limit + 1) // 2
-                hot_limit = feed_limit // 2
-                new_feed = await self.client.get_feed(sort="new", limit=new_limit)
-                hot_feed = await self.client.get_feed(sort="hot", limit=hot_limit)
-                seen_ids: set[str] = set()
-                combined: list[Post] = []
-                for post in list(new_feed.posts) + list(hot_feed.posts):
-                    if post.id in seen_ids:
-                        continue
-                    seen_ids.add(post.id)
-                    combined.append(post)
-                feed = FeedResponse(posts=combined)
-            else:
-                feed = await self.client.get_feed(sort=feed_sort, limit=feed_limit)
-            self.scheduler.record_action("browse")
+            await self._refresh_follow_cache()
+            settings = self.config.pipeline
+            pipeline = Pipeline(
+                [
+                    Stage("fetcher", lambda page, emit: self._fetch_stage(browse, page, emit)),
+                    Stage(
+                        "scorer",
+                        lambda batch, emit: self._score_stage(browse, batch, emit),
+                        concurrency=settings.scorer_concurrency,
+                    ),
+                    Stage(
+                        "drafter",
+                        lambda post, emit: self._draft_stage(browse, post, emit),
+                        concurrency=settings.drafter_concurrency,
+                    ),
+                    Stage(
+                        "actor",
+                        lambda candidate, emit: self._act_stage(browse, candidate),
+                        concurrency=settings.actor_concurrency,
+                    ),
+                ],
+                queue_size=settings.queue_size,
+            )
+            await pipeline.run(self._feed_pages())
+            if self.time_to_first_browse is None and self._started_at is not None:
+                self.time_to_first_browse = self.clock.monotonic() - self._started_at
+                await self.ui.send_status(f"⏱️  First browse done {self.time_to_first_browse:.1f}s after start")
+            if browse.fetched_posts:
+                self.scheduler.record_feed_arrivals(browse.new_posts)
 
-            # Show feed stats
-            post_count = len(feed.posts)
-            if not feed.posts:
-                await self.ui.send_status(f"📭 Feed is empty (0 posts)")
+            if not browse.total_posts:
+                if browse.fetched_posts:
+                    await self.ui.send_status(f"🆕 No new posts since last browse")
+                else:
+                    await self.ui.send_status(f"📭 Feed is empty (0 posts)")
                 return
 
-            await self.ui.send_status(f"📬 Fetched {post_count} posts from feed")
-
-            # Score and filter posts
-            await self.ui.update_activity(f"🦀 Scoring {post_count} posts")
-            scored = await self._score_posts(feed.posts)
-
-            if scored:
-                await self.ui.send_status(f"🎯 Found {len(scored)} interesting posts")
-                details = await self._maybe_interact(scored)
+            if browse.interesting_posts:
+                if not browse.interacted:
+                    await self.ui.send_status(f"⏭️  Skipped interactions (cooldowns active)")
                 # Send summary to Telegram
-                await self._send_browse_summary(post_count, len(scored), details)
+                await self._send_browse_summary(
+                    browse.total_posts, browse.interesting_posts, browse.details
+                )
             else:
                 await self.ui.send_status(f"😴 No interesting posts found")
                 # Send summary to Telegram
-                await self.ui.send_summary(f"📭 Browsed {post_count} posts, none interesting")
+                await self.ui.send_summary(f"📭 Browsed {browse.total_posts} posts, none interesting")
         except Exception as e:
+            error = f"{type(e).__name__}: {e}"
             error_msg = f"❌ Browse failed: {type(e).__name__}: {str(e)}"
             await self.ui.send_status(error_msg)
             await self.ui.send_summary(error_msg)
+        finally:
+            # Drop claims left behind by a browse that was cut short.
+            for action in ("comment", "upvote", "follow"):
+                self.scheduler.release(action)
+            await self._save_follow_cache()
+            self._activity(
+                "browse",
+                outcome="error" if error else "ok",
+                started=started,
+                error=error,
+                fetched=browse.fetched_posts,
+                new=browse.new_posts,
+                interesting=browse.interesting_posts,
+            )
+
+    async def _refresh_follow_cache(self) -> None:
+        cache = self.follow_cache
+        if cache is None or not cache.needs_revalidation():
+            return
+        try:
+            following = await self.client.get_following()
+        except Exception:
+            following = []
+        if following:
+            cache.seed(following)
+            await self.ui.send_status(f"➕ Follow cache refreshed ({len(cache)} followed)")
+        else:
+            # No following endpoint, or an empty list that cannot be told apart
+            # from a broken one; fall back to our own history.
+            if self.journal is not None:
+                for author_id in await asyncio.to_thread(self.journal.authors, "follow"):
+                    cache.add_following(author_id)
+            cache.mark_validated()
+
+    async def _save_follow_cache(self) -> None:
+        if self.follow_cache is None:
+            return
+        try:
+            await asyncio.to_thread(self.follow_cache.write, self.follow_cache.snapshot())
+        except Exception as e:
+            await self.ui.send_status(f"⚠️  Could not save follow cache: {type(e).__name__}: {e}")
+
+    def _feed_pages(self) -> list[tuple[str, int]]:
+        feed_sort = self.config.behavior.feed_sort
+        feed_limit = self.scheduler.feed_limit()
+        if feed_sort == "both":
+            return [("new", (feed_limit + 1) // 2), ("hot", feed_limit // 2)]
+        return [(feed_sort, feed_limit)]
+
+    async def _fetch_stage(self, browse: _BrowsePass, page: tuple[str, int], emit) -> None:
+        sort, limit = page
+        if limit <= 0:
+            return
+        feed = await self.client.get_feed(sort=sort, limit=limit)
+        self.scheduler.record_action("browse")
+        browse.fetched_posts += len(feed.posts)
+        fingerprint = feed.fingerprint()
+        self._fingerprint_checks += 1
+        FEED_PAGES.labels(agent=self.config.bot.name, sort=sort).inc()
+        previous = self._rankings.get(sort)
+        if previous is not None and previous[0] == fingerprint:
+            self._fingerprint_hits += 1
+            FEED_PAGES_UNCHANGED.labels(agent=self.config.bot.name, sort=sort).inc()
+            ranked = [post for post in previous[1] if post.id not in browse.seen_ids]
+            ranked = await self._not_interacted(ranked)
+            browse.seen_ids.update(post.id for post in ranked)
+            if ranked:
+                browse.total_posts += len(ranked)
+                await self.ui.send_status(f"♻️  Feed unchanged, reusing last ranking ({len(ranked)} posts)")
+                await emit(_Batch(sort, fingerprint, [], ranked))
+            return
+        posts = self._since_watermark(sort, feed.posts)
+        batch: list[Post] = []
+        for post in posts:
+            if post.id in browse.seen_ids:
+                continue
+            browse.seen_ids.add(post.id)
+            batch.append(post)
+        if not batch:
+            # Nothing on this page needs scoring, which is a complete (empty) ranking.
+            self._rankings[sort] = (fingerprint, [])
+            return
+        browse.total_posts += len(batch)
+        await self.ui.send_status(f"📬 Fetched {len(batch)} posts from feed")
+        if self.seen_index is not None:
+            unseen = set(await asyncio.to_thread(self.seen_index.unseen, [post.id for post in batch]))
+            skipped = len(batch) - len(unseen)
+            self._seen_checks += len(batch)
+            self._seen_hits += skipped
+            SEEN_CHECKS.labels(agent=self.config.bot.name).inc(len(batch))
+            SEEN_HITS.labels(agent=self.config.bot.name).inc(skipped)
+            batch = [post for post in batch if post.id in unseen]
+            if skipped:
+                await self.ui.send_status(f"🔁 Skipped {skipped} already-seen posts")
+            if not batch:
+                self._rankings[sort] = (fingerprint, [])
+                return
+        browse.new_posts += len(batch)
+        for post in batch:
+            self._journal("seen", post_id=post.id, author_id=post.author.id if post.author else None)
+        await emit(_Batch(sort, fingerprint, batch))
+
+    async def _not_interacted(self, posts: list[Post]) -> list[Post]:
+        if self.seen_index is None or not posts:
+            return posts
+        actions = await asyncio.to_thread(self.seen_index.actions_many, [post.id for post in posts])
+        return [post for post in posts if actions[post.id] <= {"scored"}]
+
+    @property
+    def feed_skip_rate(self) -> float:
+        """Share of fetched feed pages whose fingerprint matched the previous browse."""
+        if not self._fingerprint_checks:
+            return 0.0
+        return self._fingerprint_hits / self._fingerprint_checks
+
+    def _since_watermark(self, sort: str, posts: list[Post]) -> list[Post]:
+        """Cut a newest-first page at the last browse's newest post and advance the mark.
+
+        The feed API has no since/cursor parameter, so the cut happens client-side.
+        """
+        if sort not in CHRONOLOGICAL_FEEDS or not posts:
+            return posts
+        watermark = self._watermarks.get(sort)
+        fresh: list[Post] = []
+        for post in posts:
+            if watermark is not None:
+                if watermark.is_below(post):
+                    break
+                if not watermark.is_newer(post):
+                    # Seen at the mark's own timestamp; unseen ties may still follow.
+                    continue
+            fresh.append(post)
+        if fresh:
+            newest = max(
+                fresh,
+                key=lambda post: _as_utc(post.created_at) or datetime.min.replace(tzinfo=timezone.utc),
+            )
+            created_at = _as_utc(newest.created_at)
+            if created_at is None:
+                self._watermarks[sort] = _Watermark({fresh[0].id})
+            else:
+                tied = {post.id for post in fresh if _as_utc(post.created_at) == created_at}
+                if watermark is not None and watermark.created_at == created_at:
+                    tied |= watermark.post_ids
+                self._watermarks[sort] = _Watermark(tied, created_at)
+        return fresh
+
+    async def _score_stage(self, browse: _BrowsePass, page: _Batch, emit) -> None:
+        if page.ranked is not None:
+            browse.interesting_posts += len(page.ranked)
+            for post in page.ranked:
+                await emit(post)
+            return
+        batch = page.posts
+        await self.ui.update_activity(f"🦀 Scoring {len(batch)} posts")
+        with tracing.span("score", posts=len(batch)):
+            scored, scores = await self._rank_posts(batch)
+        if scores:
+            # Without scores the LLM call failed. The fallback ranking is not cached and
+            # the batch is not marked seen, so the next browse scores the page again.
+            self._rankings[page.sort] = (page.fingerprint, scored)
+            await self._mark_seen([post.id for post in batch], "scored")
+            for post in batch:
+                self._journal(
+                    "scored",
+                    post_id=post.id,
+                    author_id=post.author.id if post.author else None,
+                    score=scores.get(post.id),
+                )
+        if not scored:
+            return
+        browse.scores.update(scores)
+        browse.interesting_posts += len(scored)
+        for post in scored:
+            if post.author and post.author.id:
+                browse.authors.setdefault(post.author.id, post.author)
+                if self.follow_cache is not None:
+                    self.follow_cache.add_interest(post.author.id, scores.get(post.id, 0.0))
+        await self.ui.send_status(f"🎯 Found {len(scored)} interesting posts")
+        for post in scored:
+            await emit(post)
+
+    async def _draft_stage(self, browse: _BrowsePass, post: Post, emit) -> None:
+        comment: str | None = None
+        # The reservation keeps other candidates from drafting until this comment
+        # is posted (record_action) or fails (release).
+        if not browse.interacted and self.scheduler.reserve("comment", browse.scores.get(post.id)):
+            await self.ui.update_activity(f"🦀 Generating comment for post")
+            comment = await self._generate_comment(post)
+        await emit((post, comment))
+
+    async def _act_stage(self, browse: _BrowsePass, candidate: tuple[Post, str | None]) -> None:
+        post, comment = candidate
+        if browse.interacted:
+            if comment is not None:
+                self.scheduler.release("comment")
+            # Keep draining so upstream stages never block on a full queue.
+            return
+        if await self._interact_with(post, comment, browse.details, browse.authors):
+            browse.interacted = True
 
     async def _send_browse_summary(self, total_posts: int, interesting_posts: int, details: dict) -> None:
         """Send complete browse summary to Telegram with full interaction details"""
@@ -339,93 +836,193 @@ class BotEngine:
         if not details.get("comments") and not details.get("upvotes") and not details.get("follows") and not details.get("failures"):
             lines.append("\n(No interactions - cooldowns active)")
 
-        await self.ui.send_summary("".join(lines))
+        with tracing.span("summary"):
+            await self.ui.send_summary("".join(lines))
 
-    async def _maybe_interact(self, posts: list[Post]) -> dict:
-        """Interact with posts. Returns full interaction details"""
-        details = {
-            "comments": [],
-            "upvotes": [],
-            "follows": [],
-            "failures": []
-        }
-        interacted = False
-        for post in posts:
-            post_url = f"https://www.moltbook.com/post/{post.id}"
-            # Use full title if available, otherwise use content preview
-            post_title = post.title if post.title else (post.content[:50] + "..." if len(post.content) > 50 else post.content)
+    async def _interact_with(
+        self,
+        post: Post,
+        comment: str | None,
+        details: dict,
+        authors: dict[str, AgentProfile] | None = None,
+    ) -> bool:
+        """Comment on and upvote a post and follow an author, concurrently.
 
-            if self.scheduler.can_do("comment"):
-                try:
-                    await self.ui.update_activity(f"🦀 Generating comment for post")
-                    comment = await self._generate_comment(post)
-                    await self.client.comment(post.id, comment)
-                    self.scheduler.record_action("comment")
-                    # Show both the comment content and the post title
-                    await self.ui.send_status(f"💬 Commented: \"{comment}\"\n   on: \"{post_title}\"\n   {post_url}")
-                    # Collect full details for Telegram summary
-                    details["comments"].append({
-                        "content": comment,
-                        "post_title": post_title,
-                        "url": post_url
-                    })
-                    interacted = True
-                except Exception as e:
-                    error_msg = str(e)
-                    if "403" in error_msg or "Forbidden" in error_msg:
-                        failure = "❌ Comment failed: 403 Forbidden - Account not verified"
-                        await self.ui.send_status(failure)
-                        details["failures"].append(failure)
-                    else:
-                        failure = f"❌ Comment failed: {type(e).__name__}: {error_msg}"
-                        await self.ui.send_status(failure)
-                        details["failures"].append(failure)
-
-            if self.scheduler.can_do("upvote"):
-                try:
-                    await self.client.upvote(post.id)
-                    self.scheduler.record_action("upvote")
-                    # Show full title (no truncation needed for upvote)
-                    await self.ui.send_status(f"👍 Upvoted: \"{post_title}\"\n   {post_url}")
-                    # Collect full details for Telegram summary
-                    details["upvotes"].append({
-                        "post_title": post_title,
-                        "url": post_url
-                    })
-                    interacted = True
-                except Exception as e:
-                    failure = f"❌ Upvote failed: {type(e).__name__}: {str(e)}"
-                    await self.ui.send_status(failure)
-                    details["failures"].append(failure)
-
-            if self.scheduler.can_do("follow") and post.author:
-                try:
-                    agent_url = f"https://www.moltbook.com/agents/{post.author.id}"
-                    await self.client.follow(post.author.id)
-                    self.scheduler.record_action("follow")
-                    # Put URL on separate line to prevent truncation
-                    await self.ui.send_status(f"➕ Following {post.author.username}\n   {agent_url}")
-                    # Collect full details for Telegram summary
-                    details["follows"].append({
-                        "username": post.author.username,
-                        "url": agent_url
-                    })
-                    interacted = True
-                except Exception as e:
-                    failure = f"❌ Follow failed: {type(e).__name__}: {str(e)}"
-                    await self.ui.send_status(failure)
-                    details["failures"].append(failure)
-
-            if interacted:
-                break
-
-        if not interacted:
-            await self.ui.send_status(f"⏭️  Skipped interactions (cooldowns active)")
-        return details
+        The comment slot must already be reserved when ``comment`` is given.
+        ``authors`` are other follow candidates from the same browse.
+        Returns True if any action succeeded.
+        """
+        post_url = f"https://www.moltbook.com/post/{post.id}"
+        # Use full title if available, otherwise use content preview
+        post_title = post.title if post.title else (post.content[:50] + "..." if len(post.content) > 50 else post.content)
+
+        actions = []
+        if comment is not None:
+            actions.append(self._post_comment(post, comment, post_title, post_url, details))
+        if self.scheduler.reserve("upvote"):
+            actions.append(self._upvote(post, post_title, post_url, details))
+        if self.scheduler.reserve("follow"):
+            target = await self._follow_target(post, authors)
+            if target is not None:
+                actions.append(self._follow(target, post, details))
+            else:
+                self.scheduler.release("follow")
+        if not actions:
+            return False
+        with tracing.span("interact", post_id=post.id, actions=len(actions)):
+            results = await asyncio.gather(*actions)
+        return any(results)
+
+    async def _follow_target(self, post: Post, authors: dict[str, AgentProfile] | None) -> AgentProfile | None:
+        if self.follow_cache is not None:
+            # Best not-yet-followed author among this browse's candidates.
+            pool = dict(authors or {})
+            if post.author and post.author.id:
+                pool.setdefault(post.author.id, post.author)
+            author_id = self.follow_cache.pick_unfollowed(pool)
+            return pool[author_id] if author_id else None
+        if post.author and post.author.id and not await self._already_followed(post.author.id):
+            return post.author
+        return None
+
+    async def _already_followed(self, author_id: str) -> bool:
+        if self.journal is None:
+            return False
+        return await asyncio.to_thread(self.journal.has_author, author_id, "follow")
+
+    async def _post_comment(self, post: Post, comment: str, post_title: str, post_url: str, details: dict) -> bool:
+        author_id = post.author.id if post.author else None
+        started = self.clock.monotonic()
+        try:
+            await self.client.comment(post.id, comment)
+            self.scheduler.record_action("comment")
+            await self._mark_seen([post.id], "commented")
+            self._journal("comment", post_id=post.id, author_id=author_id, detail=comment)
+            self._activity("comment", started=started, post_id=post.id, author_id=author_id)
+        except Exception as e:
+            self.scheduler.release("comment")
+            error = f"{type(e).__name__}: {e}"
+            self._activity("comment", outcome="error", started=started, post_id=post.id, author_id=author_id, error=error)
+            error_msg = str(e)
+            if "403" in error_msg or "Forbidden" in error_msg:
+                failure = "❌ Comment failed: 403 Forbidden - Account not verified"
+            else:
+                failure = f"❌ Comment failed: {type(e).__name__}: {error_msg}"
+            details["failures"].append(failure)
+            self._journal("failure", post_id=post.id, detail=failure)
+            await self.ui.send_status(failure)
+            return False
+        # Collect full details for Telegram summary
+        details["comments"].append({
+            "content": comment,
+            "post_title": post_title,
+            "url": post_url
+        })
+        # Show both the comment content and the post title
+        await self.ui.send_status(f"💬 Commented: \"{comment}\"\n   on: \"{post_title}\"\n   {post_url}")
+        return True
+
+    async def _upvote(self, post: Post, post_title: str, post_url: str, details: dict) -> bool:
+        author_id = post.author.id if post.author else None
+        started = self.clock.monotonic()
+        try:
+            await self.client.upvote(post.id)
+            self.scheduler.record_action("upvote")
+            await self._mark_seen([post.id], "upvoted")
+            self._journal("upvote", post_id=post.id, author_id=author_id)
+            self._activity("upvote", started=started, post_id=post.id, author_id=author_id)
+        except Exception as e:
+            self.scheduler.release("upvote")
+            error = f"{type(e).__name__}: {e}"
+            self._activity("upvote", outcome="error", started=started, post_id=post.id, author_id=author_id, error=error)
+            failure = f"❌ Upvote failed: {type(e).__name__}: {str(e)}"
+            details["failures"].append(failure)
+            self._journal("failure", post_id=post.id, detail=failure)
+            await self.ui.send_status(failure)
+            return False
+        details["upvotes"].append({
+            "post_title": post_title,
+            "url": post_url
+        })
+        # Show full title (no truncation needed for upvote)
+        await self.ui.send_status(f"👍 Upvoted: \"{post_title}\"\n   {post_url}")
+        return True
+
+    async def _follow(self, author: AgentProfile, post: Post, details: dict) -> bool:
+        agent_url = f"https://www.moltbook.com/agents/{author.id}"
+        own_post = bool(post.author and post.author.id == author.id)
+        started = self.clock.monotonic()
+        try:
+            await self.client.follow(author.id)
+            self.scheduler.record_action("follow")
+            if own_post:
+                await self._mark_seen([post.id], "followed")
+            self._journal("follow", post_id=post.id if own_post else None, author_id=author.id)
+            self._activity("follow", started=started, post_id=post.id, author_id=author.id)
+        except httpx.HTTPStatusError as e:
+            self.scheduler.release("follow")
+            if e.response.status_code == 409 and self.follow_cache is not None:
+                # Already following: remember it instead of retrying next browse.
+                self.follow_cache.add_following(author.id)
+                self._activity("follow", outcome="skipped", started=started, post_id=post.id, author_id=author.id)
+                await self.ui.send_status(f"ℹ️  Already following {author.username}")
+                return False
+            return await self._follow_failed(author, post, details, e, started)
+        except Exception as e:
+            self.scheduler.release("follow")
+            return await self._follow_failed(author, post, details, e, started)
+        if self.follow_cache is not None:
+            self.follow_cache.add_following(author.id)
+        details["follows"].append({
+            "username": author.username,
+            "url": agent_url
+        })
+        # Put URL on separate line to prevent truncation
+        await self.ui.send_status(f"➕ Following {author.username}\n   {agent_url}")
+        return True
+
+    async def _follow_failed(
+        self, author: AgentProfile, post: Post, details: dict, error: Exception, started: float
+    ) -> bool:
+        self._activity(
+            "follow",
+            outcome="error",
+            started=started,
+            post_id=post.id,
+            author_id=author.id,
+            error=f"{type(error).__name__}: {error}",
+        )
+        failure = f"❌ Follow failed: {type(error).__name__}: {str(error)}"
+        details["failures"].append(failure)
+        self._journal("failure", post_id=post.id, author_id=author.id, detail=failure)
+        await self.ui.send_status(failure)
+        return False
+
+    def _journal(self, kind: str, **fields) -> None:
+        if self.journal is not None:
+            self.journal.record(kind, **fields)
+
+    def _activity(self, event: str, outcome: str = "ok", started: float | None = None, **fields) -> None:
+        if self.activity is not None:
+            latency = self.clock.monotonic() - started if started is not None else None
+            self.activity.record(event, agent=self.config.bot.name, outcome=outcome, latency=latency, **fields)
+
+    async def _mark_seen(self, post_ids: list[str], action: str) -> None:
+        if self.seen_index is None or not post_ids:
+            return
+        try:
+            await asyncio.to_thread(self.seen_index.mark_many, post_ids, action)
+        except Exception as e:
+            await self.ui.send_status(f"⚠️  Could not update seen index: {type(e).__name__}: {e}")
 
     async def _maybe_post(self) -> None:
         if not self.scheduler.can_do("post"):
             return
+        with tracing.span("post"):
+            await self._post()
+
+    async def _post(self) -> None:
+        started = self.clock.monotonic()
         try:
             await self.ui.update_activity("🦀 Generating post content")
             content = await self._generate_post()
@@ -433,7 +1030,7 @@ class BotEngine:
             await self.ui.update_activity("🦀 Publishing post")
             response = await self.client.create_post(
                 content=content,
-                submolt=random.choice(self.config.behavior.preferred_submolts)
+                submolt=self.scheduler.rng.choice(self.config.behavior.preferred_submolts)
                 if self.config.behavior.preferred_submolts
                 else None,
             )
@@ -444,6 +1041,8 @@ class BotEngine:
                 raise ValueError(f"API returned success but no post ID: {error_detail}")
 
             self.scheduler.record_action("post")
+            self._journal("post", post_id=response.id, detail=content)
+            self._activity("post", started=started, post_id=response.id)
 
             post_url = f"https://www.moltbook.com/post/{response.id}"
             content_preview = content[:60] + "..." if len(content) > 60 else content
@@ -453,16 +1052,19 @@ class BotEngine:
             await self.ui.send_summary(f"📝 Posted: \"{content_preview}\"\n{post_url}")
             self._post_failures = 0
         except httpx.ReadTimeout:
+            self._activity("post", outcome="error", started=started, error="ReadTimeout")
             error_msg = "❌ Post failed: ReadTimeout"
             await self.ui.send_summary(error_msg)
             await self._handle_post_failure("ReadTimeout")
         except httpx.HTTPStatusError as e:
             status = e.response.status_code
+            self._activity("post", outcome="error", started=started, error=f"HTTP {status}")
             if status == 429:
                 retry_after = self._parse_retry_after(e.response.headers)
                 backoff = retry_after or self.config.behavior.post_cooldown_minutes * 60
                 self.scheduler.record_backoff("post", backoff)
                 error_msg = f"❌ Post failed: 429 Too Many Requests - backing off for {backoff}s"
+                self._journal("failure", detail=error_msg)
                 await self.ui.send_status(error_msg)
                 await self.ui.send_summary(error_msg)
             elif status == 403:
@@ -477,6 +1079,7 @@ class BotEngine:
                 await self.ui.send_summary(f"❌ Post failed: HTTP {status}")
                 await self._handle_post_failure(f"HTTP {status}")
         except Exception as e:
+            self._activity("post", outcome="error", started=started, error=f"{type(e).__name__}: {e}")
             error_msg = str(e)
             full_error_msg = f"❌ Post failed: {type(e).__name__}: {error_msg}"
             await self.ui.send_status(full_error_msg)
@@ -484,6 +1087,12 @@ class BotEngine:
             await self._handle_post_failure(type(e).__name__)
 
     async def _score_posts(self, posts: Iterable[Post]) -> list[Post]:
+        ranked, _ = await self._rank_posts(posts)
+        return ranked
+
+    async def _rank_posts(self, posts: Iterable[Post]) -> tuple[list[Post], dict[str, float]]:
+        """Score posts with the LLM. Returns the top 5 and the raw scores by post id."""
+        posts = list(posts)
         prompt_lines = [
             "Score each post from 0 to 1 for interest given topics of interest.",
             f"Topics: {', '.join(self.config.personality.topics_of_interest)}",
@@ -498,7 +1107,8 @@ class BotEngine:
             '[{"id": "post_id", "score": 0.8}, {"id": "post_id2", "score": 0.5}]'
         ])
         try:
-            response = await self.llm.generate(
+            response = await self.llm.generate_for(
+                "score",
                 "You are a helpful assistant that returns valid JSON.",
                 "\n".join(prompt_lines)
             )
@@ -513,15 +1123,15 @@ class BotEngine:
             data = json.loads(content)
             scores = {item["id"]: float(item["score"]) for item in data}
             ranked = sorted(posts, key=lambda p: scores.get(p.id, 0.0), reverse=True)
-            return ranked[:5]
+            return ranked[:5], scores
         except json.JSONDecodeError as e:
             await self.ui.send_status(f"⚠️  LLM returned invalid JSON, using first 5 posts")
             # Log the actual response for debugging
             await self.ui.send_status(f"   (Response was: {response.content[:100]}...)")
-            return list(posts)[:5]
+            return posts[:5], {}
         except Exception as e:
             await self.ui.send_status(f"⚠️  LLM scoring failed ({type(e).__name__}), using first 5 posts")
-            return list(posts)[:5]
+            return posts[:5], {}
 
     async def _generate_comment(self, post: Post) -> str:
         prompt = (
@@ -529,7 +1139,7 @@ class BotEngine:
             f"Post: {post.content[:500]}"
         )
         try:
-            response = await self.llm.generate(self.config.personality.system_prompt, prompt)
+            response = await self.llm.generate_for("comment", self.config.personality.system_prompt, prompt)
             return response.content.strip()[:400]
         except Exception as e:
             await self.ui.send_status(f"⚠️  LLM comment generation failed ({type(e).__name__}), using fallback")
@@ -544,7 +1154,7 @@ class BotEngine:
             except ValueError:
                 try:
                     dt = parsedate_to_datetime(retry_after)
-                    seconds = int((dt - datetime.utcnow()).total_seconds())
+                    seconds = int((dt - self.clock.utcnow()).total_seconds())
                     return max(0, seconds)
                 except Exception:
                     pass
@@ -552,13 +1162,14 @@ class BotEngine:
         if reset:
             try:
                 reset_ts = int(float(reset))
-                seconds = int(reset_ts - datetime.utcnow().timestamp())
+                seconds = int(reset_ts - self.clock.time())
                 return max(0, seconds)
             except ValueError:
                 return None
         return None
 
     async def _handle_post_failure(self, reason: str) -> None:
+        self._journal("failure", detail=f"❌ Post failed: {reason}")
         self._post_failures += 1
         if self._post_failures >= 3:
             self._post_failures = 0
@@ -592,7 +1203,7 @@ class BotEngine:
         if posts_summary:
             prompt += "\n\nRecent hot posts for context (do not quote verbatim):\n" + "\n".join(posts_summary)
         try:
-            response = await self.llm.generate(self.config.personality.system_prompt, prompt)
+            response = await self.llm.generate_for("post", self.config.personality.system_prompt, prompt)
             return response.content.strip()[:500]
         except Exception as e:
             await self.ui.send_status(f"⚠️  LLM post generation failed ({type(e).__name__}), using fallback")
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+
+
+class Clock:
+    """Real time, as read by the scheduler, the engine and the rate limiter.
+
+    Sleeping is left to asyncio itself: under a ``VirtualClock`` event loop,
+    ``asyncio.sleep`` and ``asyncio.wait_for`` already run on virtual time.
+    """
+
+    def monotonic(self) -> float:
+        return time.monotonic()
+
+    def time(self) -> float:
+        return time.time()
+
+    def utcnow(self) -> datetime:
+        """Naive UTC, like ``datetime.utcnow()``."""
+        return datetime.utcnow()
+
+
+SYSTEM_CLOCK = Clock()
+
+
+class VirtualClock(Clock):
+    """Simulated time that jumps to the next timer whenever the event loop is idle.
+
+    Run code on ``new_event_loop()``: every ``asyncio.sleep``, ``wait_for`` or
+    ``call_later`` then completes as soon as nothing else is runnable, so a day
+    of cooldowns passes in moments. Wall time starts at ``start`` (naive UTC).
+    """
+
+    def __init__(self, start: datetime | None = None) -> None:
+        self.start = start or datetime(2026, 1, 1)
+        self._elapsed = 0.0
+
+    @property
+    def elapsed(self) -> float:
+        return self._elapsed
+
+    def advance(self, seconds: float) -> None:
+        self._elapsed += max(0.0, seconds)
+
+    def monotonic(self) -> float:
+        return self._elapsed
+
+    def time(self) -> float:
+        return self.start.replace(tzinfo=timezone.utc).timestamp() + self._elapsed
+
+    def utcnow(self) -> datetime:
+        return self.start + timedelta(seconds=self._elapsed)
+
+    def new_event_loop(self) -> asyncio.AbstractEventLoop:
+        loop = asyncio.SelectorEventLoop()
+        # BaseEventLoop schedules every timer through loop.time().
+        loop.time = self.monotonic
+        selector = loop._selector
+        select = selector.select
+
+        def _select(timeout: float | None = None):
+            events = select(0)
+            if events or timeout == 0:
+                return events
+            if timeout is None:
+                # No timers at all: only I/O (e.g. a worker thread finishing) can wake us.
+                return select(None)
+            self.advance(timeout)
+            return events
+
+        selector.select = _select
+        return loop
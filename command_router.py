@@ -5,9 +5,13 @@ from typing import Literal
 
 from llm.base import LLMProvider
 
-Command = Literal["pause", "resume", "status", "quit", "help", "none"]
+Command = Literal["pause", "resume", "status", "quit", "help", "profile", "none"]
 Source = Literal["slash", "llm", "empty"]
 
+# Process-wide side effects: only an explicit slash command may start these,
+# never the LLM's reading of a chat message.
+SLASH_ONLY_COMMANDS = {"profile"}
+
 
 @dataclass(slots=True)
 class CommandParseResult:
@@ -27,15 +31,17 @@ class CommandRouter:
         if not text:
             return CommandParseResult(command="none", source="empty", raw=raw)
         if text.startswith("/"):
-            command = text.lstrip("/").split()[0].lower()
+            # Telegram sends "/status@BotName" in group chats.
+            command = text.lstrip("/").split()[0].split("@", 1)[0].lower()
             alias_map = {
                 "exit": "quit",
                 "stop": "quit",
                 "start": "resume",
             }
             command = alias_map.get(command, command)
+            allowed = command in self._allowed() or command in SLASH_ONLY_COMMANDS
             return CommandParseResult(
-                command=command if command in self._allowed() else "none",
+                command=command if allowed else "none",
                 source="slash",
                 raw=raw,
             )
@@ -55,7 +61,7 @@ class CommandRouter:
         )
         user_prompt = f"User: {text}"
         try:
-            response = await self.llm.generate(system_prompt, user_prompt)
+            response = await self.llm.generate_for("command", system_prompt, user_prompt)
         except Exception as exc:
             return CommandParseResult(
                 command="none",
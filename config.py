@@ -6,8 +6,7 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Literal
 
-import keyring
-from pydantic import BaseModel, Field, ValidationError, field_validator
+from pydantic import BaseModel, Field, ValidationError, field_validator, model_validator
 
 
 DEFAULT_CONFIG_PATH = Path("~/.config/tinymolty/config.toml").expanduser()
@@ -40,6 +39,26 @@ class LLMConfig(BaseModel):
 
 class MoltbookConfig(BaseModel):
     credentials_path: str = "~/.config/moltbook/credentials.json"
+    requests_per_minute: int = 100
+    rate_limit_burst: int | None = None  # None: same as requests_per_minute
+    # "shared" coordinates the budget across processes through a SQLite file.
+    rate_limit_backend: Literal["memory", "shared"] = "memory"
+    rate_limit_path: str = ""
+    rate_limit_key: str = "default"
+
+    @field_validator("requests_per_minute")
+    @classmethod
+    def _rpm_positive(cls, value: int) -> int:
+        if value <= 0:
+            raise ValueError("requests_per_minute must be a positive integer")
+        return value
+
+    @field_validator("rate_limit_burst")
+    @classmethod
+    def _burst_positive(cls, value: int | None) -> int | None:
+        if value is not None and value < 1:
+            raise ValueError("rate_limit_burst must be at least 1")
+        return value
 
 
 class TelegramConfig(BaseModel):
@@ -61,6 +80,17 @@ class BehaviorConfig(BaseModel):
     max_comments_per_day: int = 30
     max_posts_per_day: int = 10
     preferred_submolts: list[str] = Field(default_factory=list)
+    # Spread the daily comment/post quota over the rest of the UTC day.
+    pacing: bool = False
+    pacing_reserve_fraction: float = 0.2
+    pacing_high_score: float = 0.8
+    # Scale browse interval and feed_limit with how fast new posts arrive.
+    adaptive_browse: bool = False
+    browse_interval_min_minutes: int = 5
+    browse_interval_max_minutes: int = 60
+    browse_target_new_posts: int = 10
+    feed_limit_min: int = 10
+    feed_limit_max: int = 50
 
     @field_validator("feed_limit")
     @classmethod
@@ -69,6 +99,138 @@ class BehaviorConfig(BaseModel):
             raise ValueError("feed_limit must be a positive integer")
         return value
 
+    @field_validator("pacing_reserve_fraction")
+    @classmethod
+    def _reserve_fraction_range(cls, value: float) -> float:
+        if not 0 <= value < 1:
+            raise ValueError("pacing_reserve_fraction must be between 0 and 1")
+        return value
+
+    @field_validator(
+        "browse_interval_min_minutes",
+        "browse_interval_max_minutes",
+        "browse_target_new_posts",
+        "feed_limit_min",
+        "feed_limit_max",
+    )
+    @classmethod
+    def _adaptive_positive(cls, value: int) -> int:
+        if value <= 0:
+            raise ValueError("adaptive browse settings must be positive integers")
+        return value
+
+    @model_validator(mode="after")
+    def _adaptive_bounds(self) -> "BehaviorConfig":
+        if self.browse_interval_min_minutes > self.browse_interval_max_minutes:
+            raise ValueError("browse_interval_min_minutes must not exceed browse_interval_max_minutes")
+        if self.feed_limit_min > self.feed_limit_max:
+            raise ValueError("feed_limit_min must not exceed feed_limit_max")
+        return self
+
+
+class PipelineConfig(BaseModel):
+    queue_size: int = 4
+    scorer_concurrency: int = 1
+    drafter_concurrency: int = 1
+    actor_concurrency: int = 1
+
+    @field_validator("queue_size", "scorer_concurrency", "drafter_concurrency", "actor_concurrency")
+    @classmethod
+    def _positive(cls, value: int) -> int:
+        if value <= 0:
+            raise ValueError("pipeline settings must be positive integers")
+        return value
+
+
+class StorageConfig(BaseModel):
+    data_dir: str = "~/.local/share/tinymolty"
+    seen_capacity: int = 2_000_000
+    seen_error_rate: float = 0.01
+    journal_batch_size: int = 100
+    journal_flush_seconds: float = 2.0
+    follow_cache_ttl_hours: int = 24
+
+    @field_validator("seen_error_rate")
+    @classmethod
+    def _error_rate_range(cls, value: float) -> float:
+        if not 0 < value < 1:
+            raise ValueError("seen_error_rate must be between 0 and 1")
+        return value
+
+
+class HttpConfig(BaseModel):
+    http2: bool = False  # needs the optional h2 package; falls back to HTTP/1.1 without it
+    max_connections_per_host: int = 10
+    max_keepalive_per_host: int = 5
+    host_max_connections: dict[str, int] = Field(default_factory=dict)
+    keepalive_expiry_seconds: float = 30.0
+    connect_timeout_seconds: float = 10.0
+    api_timeout_seconds: float = 30.0
+    llm_timeout_seconds: float = 120.0
+    telegram_timeout_seconds: float = 20.0
+    poll_timeout_seconds: float = 40.0
+
+    @field_validator(
+        "max_connections_per_host",
+        "max_keepalive_per_host",
+        "keepalive_expiry_seconds",
+        "connect_timeout_seconds",
+        "api_timeout_seconds",
+        "llm_timeout_seconds",
+        "telegram_timeout_seconds",
+        "poll_timeout_seconds",
+    )
+    @classmethod
+    def _positive(cls, value: float) -> float:
+        if value <= 0:
+            raise ValueError("http limits and timeouts must be positive")
+        return value
+
+    @field_validator("host_max_connections")
+    @classmethod
+    def _positive_host_limits(cls, value: dict[str, int]) -> dict[str, int]:
+        if any(limit <= 0 for limit in value.values()):
+            raise ValueError("host_max_connections values must be positive")
+        return value
+
+
+class ObservabilityConfig(BaseModel):
+    metrics_enabled: bool = False
+    metrics_host: str = "127.0.0.1"
+    metrics_port: int = 9464
+    tracing_enabled: bool = False
+    tracing_path: str = ""  # empty: <data_dir>/traces.jsonl
+    tracing_format: Literal["jsonl", "otlp"] = "jsonl"
+    trace_summary_seconds: float = 0.0  # 0: off
+    activity_log_enabled: bool = False
+    activity_log_path: str = ""  # empty: <data_dir>/activity.jsonl
+    activity_log_max_mb: float = 50.0  # 0: no size-based rotation
+    activity_log_rotate_hours: float = 24.0  # 0: no time-based rotation
+    activity_log_compress: Literal["", "zstd", "gzip"] = ""
+    activity_log_keep: int = 10
+    loop_block_seconds: float = 0.0  # report event loop stalls longer than this; 0: off
+
+    @field_validator("metrics_port")
+    @classmethod
+    def _port_range(cls, value: int) -> int:
+        if not 0 <= value <= 65535:
+            raise ValueError("metrics_port must be between 0 and 65535")
+        return value
+
+    @field_validator("trace_summary_seconds", "loop_block_seconds")
+    @classmethod
+    def _non_negative(cls, value: float) -> float:
+        if value < 0:
+            raise ValueError("trace_summary_seconds and loop_block_seconds must not be negative")
+        return value
+
+    @field_validator("activity_log_max_mb", "activity_log_rotate_hours", "activity_log_keep")
+    @classmethod
+    def _activity_log_non_negative(cls, value: float) -> float:
+        if value < 0:
+            raise ValueError("activity log limits must not be negative")
+        return value
+
 
 class AdvancedConfig(BaseModel):
     log_level: str = "INFO"
@@ -82,6 +244,10 @@ class AppConfig(BaseModel):
     moltbook: MoltbookConfig = Field(default_factory=MoltbookConfig)
     telegram: TelegramConfig = Field(default_factory=TelegramConfig)
     behavior: BehaviorConfig = Field(default_factory=BehaviorConfig)
+    pipeline: PipelineConfig = Field(default_factory=PipelineConfig)
+    storage: StorageConfig = Field(default_factory=StorageConfig)
+    http: HttpConfig = Field(default_factory=HttpConfig)
+    observability: ObservabilityConfig = Field(default_factory=ObservabilityConfig)
     advanced: AdvancedConfig = Field(default_factory=AdvancedConfig)
 
 
@@ -114,6 +280,8 @@ def resolve_secret(value: str, key_name: str) -> str | None:
     if not value:
         return None
     if value == "keyring":
+        import keyring  # slow to import; only needed when a secret lives there
+
         return keyring.get_password(KEYRING_SERVICE, key_name)
     if value.startswith("env:"):
         env_key = value.split("env:", 1)[1]
@@ -123,6 +291,8 @@ def resolve_secret(value: str, key_name: str) -> str | None:
 
 def store_secret(value: str, key_name: str, storage: str) -> str:
     if storage == "keyring":
+        import keyring
+
         keyring.set_password(KEYRING_SERVICE, key_name, value)
         return "keyring"
     if storage.startswith("env:"):
@@ -164,7 +334,7 @@ def save_config(config: AppConfig, path: Path | None = None) -> Path:
 
     config_path = path or get_default_config_path()
     ensure_config_permissions(config_path)
-    config_path.write_text(tomli_w.dumps(config.model_dump()))
+    config_path.write_text(tomli_w.dumps(config.model_dump(exclude_none=True)))
     ensure_config_permissions(config_path)
     return config_path
 
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import signal
+from pathlib import Path
+
+from bot_engine import BotEngine
+from config import AppConfig, ResolvedSecrets, load_config
+from http_pool import MOLTBOOK_HOST, TELEGRAM_HOST, HttpPool
+from llm.factory import build_provider
+from moltbook.client import MoltbookClient
+from moltbook.rate_limiter import build_rate_limiter
+from observability import observability_session
+from scheduler import Scheduler
+from storage import open_storage
+from ui.base import UserInterface
+from ui.logging_ui import LoggingUI
+from ui.multi import MultiUI
+
+logger = logging.getLogger("tinymolty")
+
+
+def configure_logging(level: str) -> None:
+    logging.basicConfig(
+        level=getattr(logging, level.upper(), logging.INFO),
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+
+
+def _build_ui(config: AppConfig, secrets: ResolvedSecrets, pool: HttpPool) -> UserInterface:
+    ui: UserInterface = LoggingUI(logger)
+    if config.telegram.enabled and secrets.telegram_token:
+        from ui.telegram_ui import TelegramUI
+
+        telegram_ui = TelegramUI(
+            bot_token=secrets.telegram_token,
+            chat_id=config.telegram.chat_id,
+            on_chat_id=None,
+            http_client=pool.client(TELEGRAM_HOST, "telegram"),
+            poll_timeout=pool.timeout("poll"),
+        )
+        ui = MultiUI(primary=ui, secondary=telegram_ui)
+    return ui
+
+
+def _reload(engine: BotEngine, config_path: Path | None) -> None:
+    try:
+        config = load_config(config_path)
+    except Exception as exc:
+        logger.warning("⚠️  Config reload failed, keeping the current one: %s", exc)
+        return
+    engine.apply_config(config)
+    logger.info("🔄 Config reloaded")
+
+
+def _install_signal_handlers(engine: BotEngine, config_path: Path | None) -> None:
+    loop = asyncio.get_running_loop()
+    handlers = {signal.SIGTERM: engine.stop, signal.SIGINT: engine.stop}
+    if hasattr(signal, "SIGHUP"):
+        handlers[signal.SIGHUP] = lambda: _reload(engine, config_path)
+    for signum, handler in handlers.items():
+        try:
+            loop.add_signal_handler(signum, handler)
+        except (NotImplementedError, RuntimeError):
+            # Windows event loops have no add_signal_handler; Ctrl-C still raises KeyboardInterrupt.
+            pass
+
+
+async def run_engine(config: AppConfig, secrets: ResolvedSecrets, config_path: Path | None = None) -> None:
+    pool = HttpPool(config.http)
+    ui = _build_ui(config, secrets, pool)
+    client = MoltbookClient(
+        config.moltbook.credentials_path,
+        rate_limiter=build_rate_limiter(config.moltbook, config.storage.data_dir),
+        http_client=pool.client(MOLTBOOK_HOST),
+        agent=config.bot.name,
+    )
+    storage = await open_storage(config.storage)
+    scheduler = Scheduler(
+        config.behavior, config.advanced, state_path=storage.scheduler_path, agent=config.bot.name
+    )
+    try:
+        async with observability_session(
+            config.observability, config.storage.data_dir, agent=config.bot.name
+        ) as activity:
+            engine = BotEngine(
+                config,
+                client,
+                build_provider(config.llm, secrets.llm_api_key, pool),
+                scheduler,
+                ui,
+                seen_index=storage.seen_index,
+                journal=storage.journal,
+                follow_cache=storage.follow_cache,
+                activity=activity,
+            )
+            _install_signal_handlers(engine, config_path)
+            await asyncio.gather(ui.start(), engine.prepare())
+            await engine.run_loop()
+    finally:
+        await ui.stop()
+        await client.close()
+        await scheduler.flush()
+        await storage.close()
+        await pool.aclose()
+        logger.info("👋 Stopped")
+
+
+def run_headless(config: AppConfig, secrets: ResolvedSecrets, config_path: Path | None = None) -> None:
+    """Run the bot without Textual: log to stderr, stop on SIGTERM, reload config on SIGHUP."""
+    configure_logging(config.advanced.log_level)
+    try:
+        asyncio.run(run_engine(config, secrets, config_path))
+    except KeyboardInterrupt:
+        pass
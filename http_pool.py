@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+from typing import Literal
+
+import httpx
+
+from config import HttpConfig
+
+Operation = Literal["api", "llm", "telegram", "poll"]
+
+MOLTBOOK_HOST = "www.moltbook.com"
+TELEGRAM_HOST = "api.telegram.org"
+
+
+def http2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
+class HttpPool:
+    """Owns one pooled ``httpx.AsyncClient`` per remote host.
+
+    Every outbound caller (Moltbook, Telegram, the OpenAI SDKs) borrows its
+    host's client, so connections are kept alive and reused across callers
+    instead of each object opening its own pool. Callers must not close a
+    borrowed client; ``aclose`` closes them all.
+    """
+
+    def __init__(self, config: HttpConfig | None = None) -> None:
+        self.config = config or HttpConfig()
+        self.http2 = self.config.http2 and http2_available()
+        self._clients: dict[str, httpx.AsyncClient] = {}
+
+    def limits(self, host: str) -> httpx.Limits:
+        max_connections = self.config.host_max_connections.get(host, self.config.max_connections_per_host)
+        return httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=min(max_connections, self.config.max_keepalive_per_host),
+            keepalive_expiry=self.config.keepalive_expiry_seconds,
+        )
+
+    def timeout(self, operation: Operation) -> httpx.Timeout:
+        seconds = {
+            "api": self.config.api_timeout_seconds,
+            "llm": self.config.llm_timeout_seconds,
+            "telegram": self.config.telegram_timeout_seconds,
+            "poll": self.config.poll_timeout_seconds,
+        }[operation]
+        return httpx.Timeout(seconds, connect=self.config.connect_timeout_seconds)
+
+    def client(self, host: str, operation: Operation = "api") -> httpx.AsyncClient:
+        """The shared client for ``host``; ``operation`` sets its default timeout on first use."""
+        client = self._clients.get(host)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                limits=self.limits(host),
+                timeout=self.timeout(operation),
+                http2=self.http2,
+            )
+            self._clients[host] = client
+        return client
+
+    def for_url(self, url: str, operation: Operation = "api") -> httpx.AsyncClient:
+        return self.client(httpx.URL(url).host, operation)
+
+    @property
+    def hosts(self) -> list[str]:
+        return sorted(host for host, client in self._clients.items() if not client.is_closed)
+
+    async def aclose(self) -> None:
+        clients = list(self._clients.values())
+        self._clients.clear()
+        await asyncio.gather(*(client.aclose() for client in clients))
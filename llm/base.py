@@ -1,8 +1,18 @@
 from __future__ import annotations
 
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 
+from observability import metrics, quantiles, tracing
+
+LLM_SECONDS = metrics.histogram(
+    "tinymolty_llm_request_seconds", "LLM completion latency by call site", ["site"]
+)
+LLM_CALLS = metrics.counter(
+    "tinymolty_llm_requests", "LLM completions by call site and outcome", ["site", "outcome"]
+)
+
 
 @dataclass(slots=True)
 class LLMResponse:
@@ -14,3 +24,25 @@ class LLMProvider(ABC):
     @abstractmethod
     async def generate(self, system_prompt: str, user_prompt: str) -> LLMResponse:
         raise NotImplementedError
+
+    async def generate_for(self, site: str, system_prompt: str, user_prompt: str) -> LLMResponse:
+        """``generate``, recorded in the metrics under the call site ``site`` (score, comment, ...)."""
+        started = time.perf_counter()
+        outcome = "error"
+        try:
+            with tracing.span(f"llm {site}"):
+                response = await self.generate(system_prompt, user_prompt)
+            outcome = "ok"
+            return response
+        finally:
+            elapsed = time.perf_counter() - started
+            LLM_SECONDS.labels(site=site).observe(elapsed)
+            quantiles.observe("llm", site, elapsed)
+            LLM_CALLS.labels(site=site, outcome=outcome).inc()
+
+    async def warmup(self) -> None:
+        """Open the connection to the provider ahead of the first real call.
+
+        Optional; the default does nothing.
+        """
+        return
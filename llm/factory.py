@@ -1,18 +1,42 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING, Any
+
 from config import LLMConfig
 
 from .base import LLMProvider
-from .gemini_provider import GeminiProvider
-from .openai_provider import OpenAIProvider
-from .openrouter_provider import OpenRouterProvider
 
+if TYPE_CHECKING:
+    from http_pool import HttpPool
+
+PROVIDER_HOSTS = {"openai": "api.openai.com", "openrouter": "openrouter.ai"}
+
+
+def _pooled(config: LLMConfig, pool: HttpPool | None) -> dict[str, Any]:
+    if pool is None:
+        return {}
+    return {
+        "http_client": pool.client(PROVIDER_HOSTS[config.provider], "llm"),
+        "timeout": pool.timeout("llm"),
+    }
 
-def build_provider(config: LLMConfig, api_key: str) -> LLMProvider:
+
+def build_provider(config: LLMConfig, api_key: str, pool: HttpPool | None = None) -> LLMProvider:
+    # Provider SDKs are heavy; import only the one that is configured.
     if config.provider == "openai":
-        return OpenAIProvider(api_key=api_key, model=config.model, temperature=config.temperature)
+        from .openai_provider import OpenAIProvider
+
+        return OpenAIProvider(
+            api_key=api_key, model=config.model, temperature=config.temperature, **_pooled(config, pool)
+        )
     if config.provider == "openrouter":
-        return OpenRouterProvider(api_key=api_key, model=config.model, temperature=config.temperature)
+        from .openrouter_provider import OpenRouterProvider
+
+        return OpenRouterProvider(
+            api_key=api_key, model=config.model, temperature=config.temperature, **_pooled(config, pool)
+        )
     if config.provider == "gemini":
+        from .gemini_provider import GeminiProvider
+
         return GeminiProvider(api_key=api_key, model=config.model, temperature=config.temperature)
     raise ValueError(f"Unsupported provider: {config.provider}")
@@ -1,13 +1,25 @@
 from __future__ import annotations
 
+import httpx
 from openai import AsyncOpenAI
 
 from .base import LLMProvider, LLMResponse
 
 
 class OpenRouterProvider(LLMProvider):
-    def __init__(self, api_key: str, model: str, temperature: float) -> None:
-        self.client = AsyncOpenAI(api_key=api_key, base_url="https://openrouter.ai/api/v1")
+    def __init__(
+        self,
+        api_key: str,
+        model: str,
+        temperature: float,
+        http_client: httpx.AsyncClient | None = None,
+        timeout: httpx.Timeout | None = None,
+    ) -> None:
+        # Left unset, the SDK keeps its own default timeout.
+        options = {"timeout": timeout} if timeout is not None else {}
+        self.client = AsyncOpenAI(
+            api_key=api_key, base_url="https://openrouter.ai/api/v1", http_client=http_client, **options
+        )
         self.model = model
         self.temperature = temperature
 
@@ -22,3 +34,7 @@ class OpenRouterProvider(LLMProvider):
         )
         content = response.choices[0].message.content or ""
         return LLMResponse(content=content, raw=response)
+
+    async def warmup(self) -> None:
+        # A cheap authenticated GET leaves a keep-alive connection in the pool.
+        await self.client.models.list()
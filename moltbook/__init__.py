@@ -1,3 +1,10 @@
-from .client import MoltbookClient
-
 __all__ = ["MoltbookClient"]
+
+
+def __getattr__(name: str):
+    # Keep `moltbook.registration` (used by the setup wizard) from importing the API client.
+    if name == "MoltbookClient":
+        from .client import MoltbookClient
+
+        return MoltbookClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,14 +1,40 @@
 from __future__ import annotations
 
 import json
+import re
+import time
 from pathlib import Path
 from typing import Any
 
 import httpx
 
+from observability import metrics, quantiles, tracing
+
 from .models import CreatePostResponse, FeedResponse, Post
 from .rate_limiter import RateLimiter
 
+REQUEST_SECONDS = metrics.histogram(
+    "tinymolty_moltbook_request_seconds", "Moltbook API latency by endpoint, excluding rate-limit waits", ["endpoint"]
+)
+REQUESTS = metrics.counter(
+    "tinymolty_moltbook_requests", "Moltbook API requests by endpoint and HTTP status", ["endpoint", "status"]
+)
+RESPONSE_BYTES = metrics.counter(
+    "tinymolty_moltbook_response_bytes", "Moltbook API response body bytes by endpoint", ["endpoint"]
+)
+RATE_LIMIT_WAIT_SECONDS = metrics.histogram(
+    "tinymolty_rate_limit_wait_seconds", "Time spent waiting for the Moltbook rate limiter", ["agent"]
+)
+
+# Ids in paths would make one time series per post; fold them into a placeholder.
+_ID_SEGMENT = re.compile(r"^/(posts|agents|submolts)/(?!(?:me|register|status)(?:/|$))[^/]+")
+
+
+def endpoint_label(method: str, path: str) -> str:
+    """``"POST /posts/abc/upvote?x=1"`` -> ``"POST /posts/{id}/upvote"``."""
+    path = path.split("?", 1)[0]
+    return f"{method} {_ID_SEGMENT.sub(lambda match: f'/{match.group(1)}/{{id}}', path)}"
+
 
 class MoltbookClient:
     def __init__(
@@ -16,12 +42,17 @@ class MoltbookClient:
         credentials_path: str,
         base_url: str = "https://www.moltbook.com/api/v1",
         rate_limiter: RateLimiter | None = None,
+        http_client: httpx.AsyncClient | None = None,
+        agent: str = "",
     ) -> None:
+        self.agent = agent
         self.credentials_path = Path(credentials_path).expanduser()
         self.base_url = base_url.rstrip("/")
         self.rate_limiter = rate_limiter or RateLimiter()
         self._token = self._load_token()
-        self._client = httpx.AsyncClient(timeout=30.0)
+        # A shared client (multi-agent mode) belongs to whoever created it.
+        self._owns_client = http_client is None
+        self._client = http_client or httpx.AsyncClient(timeout=30.0)
 
     def _load_token(self) -> str | None:
         if not self.credentials_path.exists():
@@ -35,16 +66,37 @@ class MoltbookClient:
         return {"Authorization": f"Bearer {self._token}"}
 
     async def close(self) -> None:
-        await self._client.aclose()
+        self.rate_limiter.close()
+        if self._owns_client:
+            await self._client.aclose()
 
     async def _request(self, method: str, path: str, **kwargs: Any) -> httpx.Response:
-        await self.rate_limiter.wait()
-        url = f"{self.base_url}{path}"
-        headers = kwargs.pop("headers", {})
-        headers.update(self._auth_headers())
-        response = await self._client.request(method, url, headers=headers, **kwargs)
-        response.raise_for_status()
-        return response
+        endpoint = endpoint_label(method, path)
+        with tracing.span(endpoint) as span:
+            waited = time.perf_counter()
+            with tracing.span("rate_limit"):
+                await self.rate_limiter.wait()
+            started = time.perf_counter()
+            RATE_LIMIT_WAIT_SECONDS.labels(agent=self.agent).observe(started - waited)
+            quantiles.observe("rate_limit", "wait", started - waited)
+            url = f"{self.base_url}{path}"
+            headers = kwargs.pop("headers", {})
+            headers.update(self._auth_headers())
+            try:
+                response = await self._client.request(method, url, headers=headers, **kwargs)
+            except httpx.HTTPError:
+                REQUESTS.labels(endpoint=endpoint, status="error").inc()
+                raise
+            finally:
+                elapsed = time.perf_counter() - started
+                REQUEST_SECONDS.labels(endpoint=endpoint).observe(elapsed)
+                quantiles.observe("moltbook", endpoint, elapsed)
+            REQUESTS.labels(endpoint=endpoint, status=response.status_code).inc()
+            RESPONSE_BYTES.labels(endpoint=endpoint).inc(len(response.content))
+            if span is not None:
+                span.set(status=response.status_code)
+            response.raise_for_status()
+            return response
 
     async def get_feed(self, sort: str | None = None, limit: int | None = None) -> FeedResponse:
         params: list[str] = []
@@ -79,6 +131,28 @@ class MoltbookClient:
     async def follow(self, agent_id: str) -> None:
         await self._request("POST", f"/agents/{agent_id}/follow")
 
+    async def get_following(self) -> list[str]:
+        """Return ids of agents we follow.
+
+        Raises httpx.HTTPStatusError if unsupported, and ValueError if the
+        response is not a list of agents with ids, so that callers never mistake
+        an unexpected payload for "following nobody".
+        """
+        response = await self._request("GET", "/agents/me/following")
+        payload = response.json()
+        items = payload
+        if isinstance(payload, dict):
+            items = payload["following"] if "following" in payload else payload.get("agents")
+        if not isinstance(items, list):
+            raise ValueError("Unrecognized /agents/me/following response")
+        ids: list[str] = []
+        for item in items:
+            agent_id = item.get("id") if isinstance(item, dict) else item
+            if not isinstance(agent_id, str) or not agent_id:
+                raise ValueError(f"Following entry without an agent id: {item!r}")
+            ids.append(agent_id)
+        return ids
+
     async def create_post(self, content: str, submolt: str | None = None, title: str | None = None) -> CreatePostResponse:
         # API requires: submolt, title, and (content or url)
         payload: dict[str, Any] = {
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import hashlib
 from datetime import datetime
 from typing import Any
 
@@ -45,6 +46,16 @@ class Post(BaseModel):
 class FeedResponse(BaseModel):
     posts: list[Post] = Field(default_factory=list)
 
+    def fingerprint(self) -> str:
+        """Order-sensitive digest over (id, content hash); equal for an unchanged feed."""
+        digest = hashlib.blake2b(digest_size=16)
+        for post in self.posts:
+            content_hash = hashlib.blake2b(f"{post.title}\0{post.content}".encode(), digest_size=8)
+            digest.update(post.id.encode())
+            digest.update(b"\0")
+            digest.update(content_hash.digest())
+        return digest.hexdigest()
+
 
 class CreatePostResponse(BaseModel):
     id: str | None = None
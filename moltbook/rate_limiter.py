@@ -1,19 +1,26 @@
 from __future__ import annotations
 
 import asyncio
+import sqlite3
+import threading
 import time
+from pathlib import Path
+
+from clock import SYSTEM_CLOCK, Clock
+from config import MoltbookConfig
 
 
 class TokenBucket:
-    def __init__(self, capacity: int, refill_per_second: float) -> None:
+    def __init__(self, capacity: int, refill_per_second: float, clock: Clock | None = None) -> None:
         self.capacity = capacity
         self.refill_per_second = refill_per_second
+        self.clock = clock or SYSTEM_CLOCK
         self.tokens = float(capacity)
-        self.updated_at = time.monotonic()
+        self.updated_at = self.clock.monotonic()
         self._lock = asyncio.Lock()
 
     def _refill(self) -> None:
-        now = time.monotonic()
+        now = self.clock.monotonic()
         elapsed = now - self.updated_at
         if elapsed <= 0:
             return
@@ -33,10 +40,104 @@ class TokenBucket:
 
 
 class RateLimiter:
-    def __init__(self, requests_per_minute: int = 100) -> None:
+    def __init__(
+        self, requests_per_minute: int = 100, burst: int | None = None, clock: Clock | None = None
+    ) -> None:
         self.global_bucket = TokenBucket(
-            capacity=requests_per_minute, refill_per_second=requests_per_minute / 60.0
+            capacity=burst or requests_per_minute,
+            refill_per_second=requests_per_minute / 60.0,
+            clock=clock,
         )
 
     async def wait(self) -> None:
         await self.global_bucket.acquire(1.0)
+
+    def close(self) -> None:
+        return
+
+
+class SharedRateLimiter(RateLimiter):
+    """Token bucket kept in SQLite so several processes draw from one budget.
+
+    Every process (or agent) using the same ``path`` and ``key`` shares the
+    bucket, e.g. all bots behind one API key or egress IP. Each acquisition is
+    a ``BEGIN IMMEDIATE`` transaction, which serializes writers across
+    processes; wall-clock time is used because monotonic clocks are per process.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        key: str = "default",
+        requests_per_minute: int = 100,
+        burst: int | None = None,
+    ) -> None:
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.key = key
+        self.capacity = float(burst or requests_per_minute)
+        self.refill_per_second = requests_per_minute / 60.0
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, timeout=10.0, isolation_level=None, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS buckets ("
+            " key TEXT PRIMARY KEY,"
+            " tokens REAL NOT NULL,"
+            " updated_at REAL NOT NULL"
+            ")"
+        )
+
+    def _try_acquire(self) -> float:
+        """Take a token if one is available; otherwise return the seconds to wait."""
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                now = time.time()
+                row = self._db.execute(
+                    "SELECT tokens, updated_at FROM buckets WHERE key = ?", (self.key,)
+                ).fetchone()
+                if row is None:
+                    tokens = self.capacity
+                else:
+                    elapsed = max(0.0, now - row[1])
+                    tokens = min(self.capacity, row[0] + elapsed * self.refill_per_second)
+                wait_time = 0.0
+                if tokens >= 1.0:
+                    tokens -= 1.0
+                else:
+                    wait_time = (1.0 - tokens) / self.refill_per_second
+                self._db.execute(
+                    "INSERT OR REPLACE INTO buckets (key, tokens, updated_at) VALUES (?, ?, ?)",
+                    (self.key, tokens, now),
+                )
+                self._db.execute("COMMIT")
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+        return wait_time
+
+    async def wait(self) -> None:
+        while True:
+            wait_time = await asyncio.to_thread(self._try_acquire)
+            if wait_time <= 0:
+                return
+            # Other processes may take the token first; re-check after sleeping.
+            await asyncio.sleep(max(wait_time, 0.01))
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
+def build_rate_limiter(config: MoltbookConfig, data_dir: str | Path) -> RateLimiter:
+    """Pick the rate limiter backend configured under [moltbook]."""
+    if config.rate_limit_backend == "shared":
+        path = config.rate_limit_path or Path(data_dir).expanduser() / "ratelimit.db"
+        return SharedRateLimiter(
+            path,
+            key=config.rate_limit_key,
+            requests_per_minute=config.requests_per_minute,
+            burst=config.rate_limit_burst,
+        )
+    return RateLimiter(config.requests_per_minute, burst=config.rate_limit_burst)
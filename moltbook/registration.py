@@ -4,6 +4,7 @@ Moltbook agent registration module
 from __future__ import annotations
 
 import json
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -19,10 +20,21 @@ class RegistrationResponse:
     verification_code: str
 
 
+@asynccontextmanager
+async def _client(http_client: httpx.AsyncClient | None):
+    """Borrow ``http_client`` if given, otherwise open a short-lived one."""
+    if http_client is not None:
+        yield http_client
+        return
+    async with httpx.AsyncClient(timeout=30.0) as client:
+        yield client
+
+
 async def register_agent(
     name: str,
     description: str,
-    base_url: str = "https://www.moltbook.com/api/v1"
+    base_url: str = "https://www.moltbook.com/api/v1",
+    http_client: httpx.AsyncClient | None = None,
 ) -> RegistrationResponse:
     """
     Register a new Moltbook agent
@@ -31,6 +43,7 @@ async def register_agent(
         name: Agent name
         description: Agent description
         base_url: API base URL
+        http_client: Shared client to use (left open); a temporary one otherwise
 
     Returns:
         RegistrationResponse containing api_key, claim_url, verification_code
@@ -38,7 +51,7 @@ async def register_agent(
     Raises:
         httpx.HTTPError: When registration fails
     """
-    async with httpx.AsyncClient(timeout=30.0) as client:
+    async with _client(http_client) as client:
         response = await client.post(
             f"{base_url}/agents/register",
             json={
@@ -77,7 +90,8 @@ async def register_agent(
 
 async def check_claim_status(
     api_key: str,
-    base_url: str = "https://www.moltbook.com/api/v1"
+    base_url: str = "https://www.moltbook.com/api/v1",
+    http_client: httpx.AsyncClient | None = None,
 ) -> dict:
     """
     Check agent claim status
@@ -85,11 +99,12 @@ async def check_claim_status(
     Args:
         api_key: API Key
         base_url: API base URL
+        http_client: Shared client to use (left open); a temporary one otherwise
 
     Returns:
         Status information
     """
-    async with httpx.AsyncClient(timeout=30.0) as client:
+    async with _client(http_client) as client:
         response = await client.get(
             f"{base_url}/agents/status",
             headers={"Authorization": f"Bearer {api_key}"}
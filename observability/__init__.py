@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import logging
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, AsyncIterator, Callable
+
+from .metrics import REGISTRY, Counter, Gauge, Histogram, MetricsServer, Registry, start_metrics_server
+from .activity_log import ActivityLog, open_activity_log
+from .tracing import TRACER, configure_tracing
+from .watchdog import start_watchdog
+
+if TYPE_CHECKING:
+    from config import ObservabilityConfig
+
+__all__ = [
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "MetricsServer",
+    "REGISTRY",
+    "Registry",
+    "observability_session",
+    "start_metrics_server",
+]
+
+logger = logging.getLogger("tinymolty")
+
+
+@asynccontextmanager
+async def observability_session(
+    config: ObservabilityConfig,
+    data_dir: str | Path,
+    agent: str = "",
+    worker: int = 0,
+    notify: Callable[[str], None] | None = None,
+) -> AsyncIterator[ActivityLog | None]:
+    """Tracing, metrics endpoint, activity log and loop watchdog for one process.
+
+    Yields the activity log (None when disabled). ``worker`` offsets the metrics
+    port and suffixes the trace and activity files; ``notify`` receives the
+    metrics URL and loop-block reports, which are logged otherwise. Everything
+    that was started is stopped on exit, also when a later setup step fails.
+    """
+    activity = open_activity_log(config, data_dir, worker)
+    metrics_server = None
+    watchdog = None
+    try:
+        configure_tracing(config, data_dir, worker)
+        metrics_server = await start_metrics_server(config, worker)
+        if metrics_server is not None:
+            if notify is not None:
+                notify(f"📈 Metrics at {metrics_server.url}")
+            else:
+                logger.info("📈 Metrics at %s", metrics_server.url)
+        if activity is not None:
+            await activity.start()
+        watchdog = await start_watchdog(
+            config, activity, agent, notify=None if notify is None else lambda block: notify(block.summary())
+        )
+        yield activity
+    finally:
+        if metrics_server is not None:
+            await metrics_server.stop()
+        if watchdog is not None:
+            await watchdog.stop()
+        await TRACER.flush()
+        if activity is not None:
+            await activity.close()
@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+import logging
+import shutil
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from clock import SYSTEM_CLOCK, Clock
+from observability import metrics
+
+try:
+    import zstandard
+except ImportError:  # optional: rotated segments fall back to gzip
+    zstandard = None
+
+if TYPE_CHECKING:
+    from config import ObservabilityConfig
+
+logger = logging.getLogger("tinymolty")
+
+# Events held in memory while the disk is slower than the engine; older ones are dropped first.
+MAX_PENDING = 10_000
+
+DROPPED = metrics.counter("tinymolty_activity_events_dropped", "Activity events dropped because the writer fell behind")
+WRITE_ERRORS = metrics.counter("tinymolty_activity_write_errors", "Failed activity log writes")
+
+
+def _iso(ts: float) -> str:
+    return datetime.fromtimestamp(ts, timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
+
+
+def _parse_iso(value: str) -> float:
+    return datetime.strptime(value, "%Y-%m-%dT%H:%M:%S.%fZ").replace(tzinfo=timezone.utc).timestamp()
+
+
+class ActivityLog:
+    """Append-only JSONL journal of engine events: one object per line.
+
+    Every line carries ``ts``, ``agent``, ``event`` and ``outcome``, plus
+    ``latency_ms`` and ids (``post_id``, ``author_id``, ...) where they apply.
+    ``record`` only appends to a buffer; a background task started with
+    ``start`` writes batches from a worker thread, so the engine never waits
+    on disk. The live file is rotated once it reaches ``max_bytes`` or is
+    ``rotate_seconds`` old (0 turns either check off). Rotated segments are
+    named after their start time, compressed when ``compress`` is ``"zstd"``
+    or ``"gzip"``, and only the newest ``keep`` are kept.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        max_bytes: int = 50 * 1024 * 1024,
+        rotate_seconds: float = 24 * 3600,
+        compress: str = "",
+        keep: int = 10,
+        batch_size: int = 200,
+        flush_seconds: float = 2.0,
+        clock: Clock | None = None,
+    ) -> None:
+        self.path = Path(path).expanduser()
+        self.max_bytes = max_bytes
+        self.rotate_seconds = rotate_seconds
+        if compress == "zstd" and zstandard is None:
+            logger.warning("⚠️  zstandard is not installed; compressing rotated activity logs with gzip")
+            compress = "gzip"
+        self.compress = compress
+        self.keep = max(0, keep)
+        self.batch_size = max(1, batch_size)
+        self.flush_seconds = flush_seconds
+        self.clock = clock or SYSTEM_CLOCK
+        self.dropped = 0
+        self._pending: list[str] = []
+        self._segment_started: float | None = None
+        self._flush_requested = asyncio.Event()
+        self._flush_task: asyncio.Task | None = None
+        self._write_lock = asyncio.Lock()
+        self._closed = False
+
+    async def start(self) -> None:
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_loop())
+
+    async def close(self) -> None:
+        self._closed = True
+        if self._flush_task is not None:
+            self._flush_requested.set()
+            await self._flush_task
+            self._flush_task = None
+        await self.flush()
+
+    def record(
+        self,
+        event: str,
+        agent: str = "",
+        outcome: str = "ok",
+        latency: float | None = None,
+        **fields: Any,
+    ) -> None:
+        """Queue one event. ``latency`` is in seconds; fields that are None are left out."""
+        entry: dict[str, Any] = {"ts": _iso(self.clock.time()), "agent": agent, "event": event, "outcome": outcome}
+        if latency is not None:
+            entry["latency_ms"] = round(latency * 1000, 1)
+        entry.update((key, value) for key, value in fields.items() if value is not None)
+        self._pending.append(json.dumps(entry, ensure_ascii=False, separators=(",", ":"), default=str))
+        if len(self._pending) > MAX_PENDING:
+            overflow = len(self._pending) - MAX_PENDING
+            del self._pending[:overflow]
+            self.dropped += overflow
+            DROPPED.inc(overflow)
+        if len(self._pending) >= self.batch_size:
+            self._flush_requested.set()
+
+    async def flush(self) -> None:
+        async with self._write_lock:
+            batch, self._pending = self._pending, []
+            if not batch:
+                return
+            try:
+                await asyncio.to_thread(self._write, batch)
+            except OSError as exc:
+                # A full or read-only disk must not stop the bot; the batch is lost.
+                WRITE_ERRORS.inc()
+                logger.warning("⚠️  Could not write activity log %s: %s", self.path, exc)
+
+    async def _flush_loop(self) -> None:
+        while not self._closed:
+            try:
+                await asyncio.wait_for(self._flush_requested.wait(), timeout=self.flush_seconds)
+            except asyncio.TimeoutError:
+                pass
+            self._flush_requested.clear()
+            await self.flush()
+
+    def _write(self, lines: list[str]) -> None:
+        now = self.clock.time()
+        size = self.path.stat().st_size if self.path.exists() else 0
+        if self._segment_started is None:
+            self._segment_started = self._first_timestamp() if size else now
+        too_big = self.max_bytes and size >= self.max_bytes
+        too_old = self.rotate_seconds and now - self._segment_started >= self.rotate_seconds
+        if size and (too_big or too_old):
+            self._rotate()
+            self._segment_started = now
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a", encoding="utf-8") as handle:
+            handle.write("\n".join(lines) + "\n")
+
+    def _first_timestamp(self) -> float:
+        """Start of a segment left over from an earlier run."""
+        try:
+            with self.path.open("r", encoding="utf-8") as handle:
+                return _parse_iso(json.loads(handle.readline())["ts"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return self.path.stat().st_mtime
+
+    def _rotate(self) -> None:
+        stamp = datetime.fromtimestamp(self._segment_started or self.clock.time(), timezone.utc)
+        base = f"{self.path.stem}-{stamp:%Y%m%dT%H%M%S}"
+        target = self.path.with_name(base + self.path.suffix)
+        counter = 1
+        while any(self.path.parent.glob(target.name + "*")):
+            target = self.path.with_name(f"{base}.{counter}{self.path.suffix}")
+            counter += 1
+        self.path.rename(target)
+        if self.compress:
+            self._compress(target)
+        self._prune()
+
+    def _compress(self, source: Path) -> None:
+        if self.compress == "zstd":
+            target = source.with_name(source.name + ".zst")
+            with source.open("rb") as reader, target.open("wb") as writer:
+                zstandard.ZstdCompressor().copy_stream(reader, writer)
+        else:
+            target = source.with_name(source.name + ".gz")
+            with source.open("rb") as reader, gzip.open(target, "wb") as writer:
+                shutil.copyfileobj(reader, writer)
+        source.unlink()
+
+    def segments(self) -> list[Path]:
+        """Rotated segments, oldest first."""
+        return sorted(self.path.parent.glob(f"{self.path.stem}-*{self.path.suffix}*"))
+
+    def _prune(self) -> None:
+        segments = self.segments()
+        for old in segments[: max(0, len(segments) - self.keep)]:
+            old.unlink(missing_ok=True)
+
+
+def open_activity_log(config: ObservabilityConfig, data_dir: str | Path, worker: int = 0) -> ActivityLog | None:
+    """The ``[observability]`` activity log, or None when it is disabled."""
+    if not config.activity_log_enabled:
+        return None
+    path = Path(config.activity_log_path or Path(data_dir) / "activity.jsonl").expanduser()
+    if worker:
+        # Worker processes rotate their own files instead of racing on one; traces do the same.
+        path = path.with_name(f"{path.stem}.worker{worker}{path.suffix}")
+    return ActivityLog(
+        path,
+        max_bytes=int(config.activity_log_max_mb * 1024 * 1024),
+        rotate_seconds=config.activity_log_rotate_hours * 3600,
+        compress=config.activity_log_compress,
+        keep=config.activity_log_keep,
+    )
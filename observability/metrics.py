@@ -0,0 +1,323 @@
+from __future__ import annotations
+
+import asyncio
+import bisect
+import logging
+import math
+import threading
+from contextlib import suppress
+from typing import TYPE_CHECKING, Iterable
+
+if TYPE_CHECKING:
+    from config import ObservabilityConfig
+
+logger = logging.getLogger("tinymolty")
+
+# Seconds; wide enough for both a local API call and a slow LLM completion.
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+    return repr(value)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _label_text(names: Iterable[str], values: Iterable[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class _CounterValue:
+    __slots__ = ("value", "_lock")
+
+    def __init__(self) -> None:
+        self.value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0) -> None:
+        if amount < 0:
+            raise ValueError("counters only go up")
+        with self._lock:
+            self.value += amount
+
+
+class _GaugeValue:
+    __slots__ = ("value", "_lock")
+
+    def __init__(self) -> None:
+        self.value = 0.0
+        self._lock = threading.Lock()
+
+    def set(self, value: float) -> None:
+        self.value = float(value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.inc(-amount)
+
+
+class _HistogramValue:
+    __slots__ = ("buckets", "counts", "sum", "count", "_lock")
+
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            if index < len(self.counts):
+                self.counts[index] += 1
+            self.sum += value
+            self.count += 1
+
+
+class Metric:
+    """A named metric family; ``labels(...)`` returns the child for one label set."""
+
+    kind = ""
+
+    def __init__(self, name: str, help: str, labelnames: Iterable[str] = ()) -> None:
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._children: dict[tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def labels(self, **labels: object):
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+
+    def children(self) -> list[tuple[tuple[str, ...], object]]:
+        with self._lock:
+            return sorted(self._children.items())
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {_escape(self.help)}", f"# TYPE {self.name} {self.kind}"]
+        for key, child in self.children():
+            lines.append(f"{self.name}{_label_text(self.labelnames, key)} {_format_value(child.value)}")
+        return lines
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def _new_child(self) -> _CounterValue:
+        return _CounterValue()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.labels().inc(amount)
+
+    def render(self) -> list[str]:
+        # The text format wants TYPE to name the samples, which carry the _total suffix.
+        name = f"{self.name}_total"
+        lines = [f"# HELP {name} {_escape(self.help)}", f"# TYPE {name} counter"]
+        for key, child in self.children():
+            lines.append(f"{name}{_label_text(self.labelnames, key)} {_format_value(child.value)}")
+        return lines
+
+
+class Gauge(Metric):
+    kind = "gauge"
+
+    def _new_child(self) -> _GaugeValue:
+        return _GaugeValue()
+
+    def set(self, value: float) -> None:
+        self.labels().set(value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.labels().inc(amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.labels().dec(amount)
+
+
+class Histogram(Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: Iterable[str] = (),
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(bucket for bucket in buckets if not math.isinf(bucket)))
+
+    def _new_child(self) -> _HistogramValue:
+        return _HistogramValue(self.buckets)
+
+    def observe(self, value: float) -> None:
+        self.labels().observe(value)
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {_escape(self.help)}", f"# TYPE {self.name} histogram"]
+        for key, child in self.children():
+            with child._lock:
+                counts, total, count = list(child.counts), child.sum, child.count
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                labels = _label_text(self.labelnames, key, f'le="{_format_value(bound)}"')
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _label_text(self.labelnames, key, 'le="+Inf"')
+            lines.append(f"{self.name}_bucket{labels} {count}")
+            lines.append(f"{self.name}_sum{_label_text(self.labelnames, key)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_label_text(self.labelnames, key)} {count}")
+        return lines
+
+
+class Registry:
+    """Process-wide set of metrics. Registering a name twice returns the existing metric."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, Metric] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, cls: type[Metric], name: str, help: str, labelnames: Iterable[str], **kwargs) -> Metric:
+        labelnames = tuple(labelnames)
+        with self._lock:
+            existing = self._metrics.get(name)
+            if existing is not None:
+                if type(existing) is not cls or existing.labelnames != labelnames:
+                    raise ValueError(f"metric {name} already registered with a different type or labels")
+                return existing
+            metric = cls(name, help, labelnames, **kwargs)
+            self._metrics[name] = metric
+            return metric
+
+    def counter(self, name: str, help: str, labelnames: Iterable[str] = ()) -> Counter:
+        return self._register(Counter, name, help, labelnames)
+
+    def gauge(self, name: str, help: str, labelnames: Iterable[str] = ()) -> Gauge:
+        return self._register(Gauge, name, help, labelnames)
+
+    def histogram(
+        self, name: str, help: str, labelnames: Iterable[str] = (), buckets: Iterable[float] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self._register(Histogram, name, help, labelnames, buckets=buckets)
+
+    def get(self, name: str) -> Metric | None:
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        """Every metric in the Prometheus text exposition format (0.0.4)."""
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda metric: metric.name)
+        lines: list[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+
+def counter(name: str, help: str, labelnames: Iterable[str] = ()) -> Counter:
+    return REGISTRY.counter(name, help, labelnames)
+
+
+def gauge(name: str, help: str, labelnames: Iterable[str] = ()) -> Gauge:
+    return REGISTRY.gauge(name, help, labelnames)
+
+
+def histogram(
+    name: str, help: str, labelnames: Iterable[str] = (), buckets: Iterable[float] = DEFAULT_BUCKETS
+) -> Histogram:
+    return REGISTRY.histogram(name, help, labelnames, buckets)
+
+
+class MetricsServer:
+    """Minimal asyncio HTTP server answering ``GET /metrics`` for Prometheus scrapes."""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 9464, registry: Registry | None = None) -> None:
+        self.host = host
+        self.port = port
+        self.registry = registry or REGISTRY
+        self._server: asyncio.AbstractServer | None = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}/metrics"
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        # Port 0 picks a free port; report the real one.
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            request_line = await asyncio.wait_for(reader.readline(), timeout=5.0)
+            while True:
+                header = await asyncio.wait_for(reader.readline(), timeout=5.0)
+                if header in (b"\r\n", b"\n", b""):
+                    break
+            parts = request_line.decode("latin-1").split()
+            method = parts[0] if parts else ""
+            path = parts[1].split("?", 1)[0] if len(parts) > 1 else ""
+            if method in ("GET", "HEAD") and path in ("/", "/metrics"):
+                status, content_type = "200 OK", CONTENT_TYPE
+                body = self.registry.render().encode()
+            else:
+                status, content_type, body = "404 Not Found", "text/plain; charset=utf-8", b"not found\n"
+            head = (
+                f"HTTP/1.1 {status}\r\n"
+                f"Content-Type: {content_type}\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                "Connection: close\r\n\r\n"
+            ).encode()
+            writer.write(head if method == "HEAD" else head + body)
+            await writer.drain()
+        except (asyncio.TimeoutError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+            with suppress(ConnectionError):
+                await writer.wait_closed()
+
+
+async def start_metrics_server(config: ObservabilityConfig, port_offset: int = 0) -> MetricsServer | None:
+    """Serve the default registry if enabled; None when disabled or the port is taken (logged)."""
+    if not config.metrics_enabled:
+        return None
+    port = config.metrics_port + port_offset if config.metrics_port else 0
+    server = MetricsServer(config.metrics_host, port)
+    try:
+        await server.start()
+    except OSError as exc:
+        logger.warning("⚠️  Metrics endpoint %s:%s unavailable: %s", config.metrics_host, port, exc)
+        return None
+    return server
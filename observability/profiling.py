@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import asyncio
+import cProfile
+import os
+import pstats
+import tracemalloc
+from dataclasses import dataclass, field
+from pathlib import Path
+
+TOP_ENTRIES = 10
+MAX_SECONDS = 600.0
+# Allocation stacks deep enough to get past asyncio and pydantic plumbing.
+TRACEMALLOC_FRAMES = 10
+
+_active: str | None = None
+
+
+class ProfilerBusyError(RuntimeError):
+    """Only one capture can run per process: both profilers are process-wide."""
+
+
+@dataclass(slots=True)
+class ProfileReport:
+    kind: str
+    path: Path
+    seconds: float
+    lines: list[str] = field(default_factory=list)
+
+
+def _claim(kind: str) -> None:
+    global _active
+    if _active is not None:
+        raise ProfilerBusyError(f"a {_active} profile is already running")
+    _active = kind
+
+
+def _release() -> None:
+    global _active
+    _active = None
+
+
+def _where(filename: str, line: int, function: str) -> str:
+    if filename == "~":
+        # Built-ins such as {method 'select' of 'select.epoll' objects}.
+        return function
+    return f"{function} ({os.path.basename(filename)}:{line})"
+
+
+def cpu_lines(profile: cProfile.Profile, top: int = TOP_ENTRIES) -> list[str]:
+    """Functions with the most self time, with their cumulative time and call count."""
+    stats = pstats.Stats(profile).stats
+    ranked = sorted(stats.items(), key=lambda item: item[1][2], reverse=True)[:top]
+    return [
+        f"{tottime:.3f}s self, {cumtime:.3f}s cum, {calls} calls: {_where(*key)}"
+        for key, (_, calls, tottime, cumtime, _) in ranked
+    ]
+
+
+async def profile_cpu(seconds: float, path: str | Path, top: int = TOP_ENTRIES) -> ProfileReport:
+    """Profile the event loop thread for ``seconds`` while the bot keeps running.
+
+    cProfile hooks the thread that enables it, so everything the loop runs in
+    the meantime is captured; work handed to ``asyncio.to_thread`` is not.
+    The raw stats are written to ``path`` for ``python -m pstats`` or snakeviz.
+    """
+    seconds = min(max(seconds, 0.1), MAX_SECONDS)
+    _claim("cpu")
+    profile = cProfile.Profile()
+    try:
+        profile.enable()
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            profile.disable()
+    finally:
+        _release()
+    path = Path(path).expanduser()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    await asyncio.to_thread(profile.dump_stats, path)
+    return ProfileReport("cpu", path, seconds, cpu_lines(profile, top))
+
+
+def memory_lines(snapshot: tracemalloc.Snapshot, top: int = TOP_ENTRIES) -> list[str]:
+    """Source lines holding the most traced memory."""
+    stats = snapshot.statistics("lineno")[:top]
+    lines = []
+    for stat in stats:
+        frame = stat.traceback[0]
+        where = f"{os.path.basename(frame.filename)}:{frame.lineno}"
+        lines.append(f"{stat.size / 1024:.1f} KiB in {stat.count} blocks: {where}")
+    return lines
+
+
+async def profile_memory(seconds: float, path: str | Path, top: int = TOP_ENTRIES) -> ProfileReport:
+    """Snapshot Python allocations with tracemalloc and write it to ``path``.
+
+    If tracemalloc is off (the usual case) it is switched on for ``seconds``,
+    so the snapshot shows what was allocated during that window and is still
+    alive, which is where a leak shows up. If it was already tracing (e.g.
+    PYTHONTRACEMALLOC is set) the snapshot is taken right away and covers
+    everything traced so far.
+    """
+    _claim("mem")
+    started = not tracemalloc.is_tracing()
+    try:
+        if started:
+            seconds = min(max(seconds, 0.1), MAX_SECONDS)
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+            await asyncio.sleep(seconds)
+        else:
+            seconds = 0.0
+        snapshot = tracemalloc.take_snapshot()
+    finally:
+        if started:
+            tracemalloc.stop()
+        _release()
+    snapshot = snapshot.filter_traces(
+        (
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+        )
+    )
+    path = Path(path).expanduser()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    await asyncio.to_thread(snapshot.dump, str(path))
+    return ProfileReport("mem", path, seconds, memory_lines(snapshot, top))
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import math
+import threading
+import time
+from typing import Callable, Iterable
+
+# Values at or below this (seconds) count as zero; far below any network latency.
+MIN_VALUE = 1e-6
+QUANTILES = (0.5, 0.95, 0.99)
+
+
+class QuantileSketch:
+    """Streaming quantiles over log-spaced buckets (the DDSketch scheme).
+
+    A value ``x`` lands in bucket ``ceil(log(x) / log(gamma))``, so every
+    quantile comes back within ``accuracy`` relative error. Memory depends
+    only on the range of values: one microsecond to one hour is about 1100
+    buckets at 1%, and ``max_buckets`` caps it by folding the lowest buckets
+    together, which only blurs the smallest values.
+    """
+
+    __slots__ = ("accuracy", "max_buckets", "_gamma", "_log_gamma", "buckets", "zeros", "count", "sum", "min", "max")
+
+    def __init__(self, accuracy: float = 0.01, max_buckets: int = 2048) -> None:
+        if not 0 < accuracy < 1:
+            raise ValueError("accuracy must be between 0 and 1")
+        self.accuracy = accuracy
+        self.max_buckets = max_buckets
+        self._gamma = (1 + accuracy) / (1 - accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self.buckets: dict[int, int] = {}
+        self.zeros = 0
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float) -> None:
+        if value <= MIN_VALUE:
+            self.zeros += 1
+        else:
+            key = math.ceil(math.log(value) / self._log_gamma)
+            self.buckets[key] = self.buckets.get(key, 0) + 1
+            if len(self.buckets) > self.max_buckets:
+                self._collapse()
+        self.count += 1
+        self.sum += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def _collapse(self) -> None:
+        lowest, second = sorted(self.buckets)[:2]
+        self.buckets[second] += self.buckets.pop(lowest)
+
+    def merge(self, other: QuantileSketch) -> None:
+        if other._gamma != self._gamma:
+            raise ValueError("cannot merge sketches with different accuracy")
+        for key, count in other.buckets.items():
+            self.buckets[key] = self.buckets.get(key, 0) + count
+        while len(self.buckets) > self.max_buckets:
+            self._collapse()
+        self.zeros += other.zeros
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def quantile(self, q: float) -> float | None:
+        if not self.count:
+            return None
+        rank = q * (self.count - 1)
+        if rank < self.zeros:
+            return max(0.0, self.min)
+        seen = self.zeros
+        for key in sorted(self.buckets):
+            seen += self.buckets[key]
+            if seen > rank:
+                # Midpoint of the bucket (gamma^(k-1), gamma^k], in relative terms.
+                value = 2 * self._gamma**key / (self._gamma + 1)
+                return min(max(value, self.min), self.max)
+        return self.max
+
+
+class RollingQuantiles:
+    """Quantiles over roughly the last one to two ``window_seconds``.
+
+    Two sketches take turns: values go into the current one, queries merge it
+    with the previous one, and once the current window is full the previous
+    sketch is dropped. Memory stays constant however long the process runs.
+    """
+
+    def __init__(
+        self, window_seconds: float = 3600.0, accuracy: float = 0.01, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self.window_seconds = window_seconds
+        self.accuracy = accuracy
+        self.clock = clock
+        self._current = QuantileSketch(accuracy)
+        self._previous = QuantileSketch(accuracy)
+        self._window_started = clock()
+        self._lock = threading.Lock()
+
+    def _roll(self) -> None:
+        now = self.clock()
+        elapsed = now - self._window_started
+        if elapsed < self.window_seconds:
+            return
+        # After two idle windows, nothing recent is left.
+        self._previous = self._current if elapsed < 2 * self.window_seconds else QuantileSketch(self.accuracy)
+        self._current = QuantileSketch(self.accuracy)
+        self._window_started = now
+
+    def observe(self, value: float) -> None:
+        with self._lock:
+            self._roll()
+            self._current.add(value)
+
+    def sketch(self) -> QuantileSketch:
+        """Merged copy of the recent windows."""
+        with self._lock:
+            self._roll()
+            merged = QuantileSketch(self.accuracy)
+            merged.merge(self._previous)
+            merged.merge(self._current)
+        return merged
+
+
+class QuantileRegistry:
+    """Rolling quantiles by ``(group, label)``, e.g. ``("moltbook", "GET /feed")``."""
+
+    def __init__(self, window_seconds: float = 3600.0) -> None:
+        self.window_seconds = window_seconds
+        self._series: dict[tuple[str, str], RollingQuantiles] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, group: str, label: str, value: float) -> None:
+        series = self._series.get((group, label))
+        if series is None:
+            with self._lock:
+                series = self._series.setdefault((group, label), RollingQuantiles(self.window_seconds))
+        series.observe(value)
+
+    def group(self, group: str) -> dict[str, QuantileSketch]:
+        """Merged sketches of one group by label; labels with no recent values are left out."""
+        with self._lock:
+            items = sorted((label, series) for (name, label), series in self._series.items() if name == group)
+        sketches = ((label, series.sketch()) for label, series in items)
+        return {label: sketch for label, sketch in sketches if sketch.count}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._series.clear()
+
+
+LATENCIES = QuantileRegistry()
+
+
+def observe(group: str, label: str, seconds: float) -> None:
+    LATENCIES.observe(group, label, seconds)
+
+
+def format_seconds(value: float | None) -> str:
+    if value is None:
+        return "-"
+    if value < 1:
+        return f"{value * 1000:.0f}ms"
+    return f"{value:.1f}s"
+
+
+def percentile_line(label: str, sketch: QuantileSketch, quantiles: Iterable[float] = QUANTILES) -> str:
+    """``"GET /feed: p50 120ms, p95 340ms, p99 800ms (n=42)"``."""
+    parts = ", ".join(f"p{q * 100:g} {format_seconds(sketch.quantile(q))}" for q in quantiles)
+    return f"{label}: {parts} (n={sketch.count})"
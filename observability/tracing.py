@@ -0,0 +1,265 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterator
+
+if TYPE_CHECKING:
+    from config import ObservabilityConfig
+
+SERVICE_NAME = "tinymolty"
+# OTLP status codes.
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+
+@dataclass(slots=True)
+class Span:
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: str | None
+    start_ns: int
+    attributes: dict[str, Any] = field(default_factory=dict)
+    children: list[Span] = field(default_factory=list)
+    duration_ns: int | None = None
+    error: str | None = None
+    _started: int = 0
+
+    @property
+    def duration(self) -> float:
+        """Seconds; for a span still open, the time so far."""
+        if self.duration_ns is None:
+            return (time.perf_counter_ns() - self._started) / 1e9
+        return self.duration_ns / 1e9
+
+    def set(self, **attributes: Any) -> None:
+        self.attributes.update(attributes)
+
+    def walk(self) -> Iterator[Span]:
+        yield self
+        for child in self.children:
+            yield from child.walk()
+
+    def to_dict(self) -> dict[str, Any]:
+        """Nested form used by the JSONL export."""
+        data: dict[str, Any] = {
+            "name": self.name,
+            "span_id": self.span_id,
+            "start": self.start_ns / 1e9,
+            "duration": round(self.duration, 6),
+        }
+        if self.parent_id is None:
+            data["trace_id"] = self.trace_id
+        if self.attributes:
+            data["attributes"] = self.attributes
+        if self.error:
+            data["error"] = self.error
+        if self.children:
+            data["children"] = [child.to_dict() for child in self.children]
+        return data
+
+
+def _otlp_value(value: Any) -> dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def to_otlp(root: Span) -> dict[str, Any]:
+    """One trace as an OTLP/JSON ExportTraceServiceRequest (the OpenTelemetry file exporter format)."""
+    spans = []
+    for span in root.walk():
+        end_ns = span.start_ns + (span.duration_ns or 0)
+        item: dict[str, Any] = {
+            "traceId": span.trace_id,
+            "spanId": span.span_id,
+            "name": span.name,
+            "kind": 1,
+            "startTimeUnixNano": str(span.start_ns),
+            "endTimeUnixNano": str(end_ns),
+            "attributes": [{"key": key, "value": _otlp_value(value)} for key, value in span.attributes.items()],
+            "status": {"code": STATUS_ERROR, "message": span.error} if span.error else {"code": STATUS_OK},
+        }
+        if span.parent_id:
+            item["parentSpanId"] = span.parent_id
+        spans.append(item)
+    return {
+        "resourceSpans": [
+            {
+                "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": SERVICE_NAME}}]},
+                "scopeSpans": [{"scope": {"name": SERVICE_NAME}, "spans": spans}],
+            }
+        ]
+    }
+
+
+class TraceFileExporter:
+    """Appends finished traces to a file, one JSON document per line.
+
+    ``format`` is ``"jsonl"`` (nested span trees) or ``"otlp"`` (OTLP/JSON,
+    loadable by OpenTelemetry tooling). Writes happen on a worker thread and
+    coalesce, so exporting never blocks the event loop on disk I/O.
+    """
+
+    def __init__(self, path: str | Path, format: str = "jsonl") -> None:
+        self.path = Path(path).expanduser()
+        self.format = format
+        self._pending: list[str] = []
+        self._write_task: asyncio.Task | None = None
+
+    def export(self, root: Span) -> None:
+        document = to_otlp(root) if self.format == "otlp" else root.to_dict()
+        self._pending.append(json.dumps(document, separators=(",", ":"), default=str))
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            self._write(self._take())
+            return
+        if self._write_task is None or self._write_task.done():
+            self._write_task = asyncio.create_task(self._write_loop())
+
+    def _take(self) -> list[str]:
+        lines, self._pending = self._pending, []
+        return lines
+
+    def _write(self, lines: list[str]) -> None:
+        if not lines:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a", encoding="utf-8") as handle:
+            handle.write("\n".join(lines) + "\n")
+
+    async def _write_loop(self) -> None:
+        while self._pending:
+            try:
+                await asyncio.to_thread(self._write, self._take())
+            except OSError:
+                # Tracing is best effort; drop what could not be written.
+                return
+
+    async def flush(self) -> None:
+        if self._write_task is not None:
+            await self._write_task
+            self._write_task = None
+        self._write(self._take())
+
+
+_current_span: ContextVar[Span | None] = ContextVar("tinymolty_span", default=None)
+
+
+class Tracer:
+    """Builds span trees from ``with tracer.span(...)`` blocks.
+
+    The current span lives in a context variable, so tasks created inside a
+    span (pipeline workers, gathered actions) nest under it. When a root span
+    ends, its whole tree goes to the exporters. Disabled tracers yield None
+    and cost next to nothing.
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.exporters: list[TraceFileExporter] = []
+
+    def configure(self, enabled: bool, exporters: list[TraceFileExporter] | None = None) -> None:
+        self.enabled = enabled
+        self.exporters = list(exporters or [])
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[Span | None]:
+        if not self.enabled:
+            yield None
+            return
+        parent = _current_span.get()
+        span = Span(
+            name=name,
+            trace_id=parent.trace_id if parent else os.urandom(16).hex(),
+            span_id=os.urandom(8).hex(),
+            parent_id=parent.span_id if parent else None,
+            start_ns=time.time_ns(),
+            attributes=attributes,
+            _started=time.perf_counter_ns(),
+        )
+        if parent is not None:
+            parent.children.append(span)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as exc:
+            span.error = type(exc).__name__
+            raise
+        finally:
+            span.duration_ns = time.perf_counter_ns() - span._started
+            _current_span.reset(token)
+            if parent is None:
+                self._finish(span)
+
+    def _finish(self, root: Span) -> None:
+        # A tick that did nothing has no tree worth keeping.
+        if not root.children:
+            return
+        for exporter in self.exporters:
+            exporter.export(root)
+
+    async def flush(self) -> None:
+        for exporter in self.exporters:
+            await exporter.flush()
+
+
+TRACER = Tracer()
+span = TRACER.span
+
+
+def current_span() -> Span | None:
+    return _current_span.get()
+
+
+def configure_tracing(config: ObservabilityConfig, data_dir: str | Path, worker: int = 0) -> None:
+    """Set up the process-wide tracer from ``[observability]``."""
+    exporters = []
+    if config.tracing_enabled:
+        name = "traces.otlp.jsonl" if config.tracing_format == "otlp" else "traces.jsonl"
+        path = Path(config.tracing_path or Path(data_dir) / name).expanduser()
+        if worker:
+            # Same naming as the activity log: each worker process appends to its own file.
+            path = path.with_name(f"{path.stem}.worker{worker}{path.suffix}")
+        exporters.append(TraceFileExporter(path, config.tracing_format))
+    TRACER.configure(config.tracing_enabled or config.trace_summary_seconds > 0, exporters)
+
+
+def flame_lines(root: Span, width: int = 20, max_depth: int = 4) -> list[str]:
+    """Indented flame-style breakdown; siblings with the same name are merged.
+
+    Children that ran concurrently can add up to more than their parent.
+    """
+    total = max(root.duration, 1e-9)
+    lines: list[str] = []
+
+    def _walk(name: str, spans: list[Span], depth: int) -> None:
+        seconds = sum(span.duration for span in spans)
+        bar = "█" * max(1, round(width * min(seconds / total, 1.0)))
+        count = f" ×{len(spans)}" if len(spans) > 1 else ""
+        errors = sum(1 for span in spans if span.error)
+        failed = f" ❌{errors}" if errors else ""
+        lines.append(f"{'  ' * depth}{name}{count} {seconds:.2f}s {bar}{failed}")
+        if depth >= max_depth:
+            return
+        groups: dict[str, list[Span]] = {}
+        for span in spans:
+            for child in span.children:
+                groups.setdefault(child.name, []).append(child)
+        for child_name, children in sorted(groups.items(), key=lambda item: -sum(s.duration for s in item[1])):
+            _walk(child_name, children, depth + 1)
+
+    _walk(root.name, [root], 0)
+    return lines
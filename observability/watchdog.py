@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable
+
+from observability import metrics
+
+if TYPE_CHECKING:
+    from config import ObservabilityConfig
+    from observability.activity_log import ActivityLog
+
+logger = logging.getLogger("tinymolty")
+
+# Frames from these directories are event loop plumbing, not the code that blocked.
+_PLUMBING = (os.path.dirname(asyncio.__file__), os.path.dirname(threading.__file__) + os.sep + "threading.py")
+STACK_DEPTH = 12
+
+LOOP_LAG_SECONDS = metrics.histogram(
+    "tinymolty_event_loop_lag_seconds",
+    "How late the watchdog's periodic wake-up ran, i.e. event loop scheduling lag",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+LOOP_BLOCKS = metrics.counter(
+    "tinymolty_event_loop_blocks", "Times a single step held the event loop longer than the threshold"
+)
+
+
+@dataclass(slots=True)
+class LoopBlock:
+    seconds: float
+    # Formatted frames of the blocking step, innermost last.
+    stack: list[str]
+    # Innermost frame as file:line in function.
+    location: str
+
+    def summary(self) -> str:
+        return f"🐢 Event loop blocked for {self.seconds:.2f}s at {self.location}"
+
+
+class LoopBlockedError(AssertionError):
+    """Raised by a strict watchdog when something blocked the event loop."""
+
+    def __init__(self, blocks: list[LoopBlock]) -> None:
+        self.blocks = blocks
+        details = "\n\n".join(block.summary() + "\n" + "".join(block.stack) for block in blocks)
+        super().__init__(f"event loop blocked {len(blocks)} time(s):\n{details}")
+
+
+def _user_frames(frame) -> list[traceback.FrameSummary]:
+    frames = [entry for entry in traceback.extract_stack(frame) if not entry.filename.startswith(_PLUMBING)]
+    return frames[-STACK_DEPTH:]
+
+
+class LoopWatchdog:
+    """Measures event loop lag and catches steps that block the loop.
+
+    A task wakes every ``interval`` seconds and records how late it ran. A
+    daemon thread checks that task's heartbeat; when it falls more than
+    ``threshold`` behind, the thread samples the loop thread's stack, which
+    points at the blocking call (a sync file read, a keyring lookup, ...).
+    Once the loop is free again the block is counted in the metrics, written
+    to the activity log and passed to ``notify``. With ``strict=True``,
+    ``stop()`` raises LoopBlockedError if any block was seen, which makes the
+    watchdog usable as a test guard::
+
+        async with LoopWatchdog(threshold=0.05, strict=True):
+            await code_under_test()
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.5,
+        interval: float = 0.1,
+        activity: ActivityLog | None = None,
+        agent: str = "",
+        notify: Callable[[LoopBlock], None] | None = None,
+        strict: bool = False,
+    ) -> None:
+        self.threshold = threshold
+        self.interval = interval
+        self.activity = activity
+        self.agent = agent
+        self.notify = notify
+        self.strict = strict
+        self.blocks: list[LoopBlock] = []
+        self._beat = 0.0
+        self._stack: list[traceback.FrameSummary] | None = None
+        self._lock = threading.Lock()
+        self._loop_thread = 0
+        self._task: asyncio.Task | None = None
+        self._sampler: threading.Thread | None = None
+        self._stopped = threading.Event()
+
+    async def start(self) -> None:
+        if self._task is not None:
+            return
+        self._loop_thread = threading.get_ident()
+        self._beat = time.monotonic()
+        self._stopped.clear()
+        self._task = asyncio.create_task(self._monitor())
+        self._sampler = threading.Thread(target=self._sample, name="tinymolty-watchdog", daemon=True)
+        self._sampler.start()
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._stopped.set()
+        if self._sampler is not None:
+            self._sampler.join(timeout=1.0)
+            self._sampler = None
+        # A block that ended right before stop() has not been reported yet.
+        self._report(time.monotonic() - self._beat - self.interval)
+        if self.strict and self.blocks:
+            raise LoopBlockedError(self.blocks)
+
+    async def __aenter__(self) -> LoopWatchdog:
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        try:
+            await self.stop()
+        except LoopBlockedError:
+            # Do not hide the error the guarded block raised itself.
+            if exc_type is None:
+                raise
+
+    async def _monitor(self) -> None:
+        while True:
+            expected = time.monotonic() + self.interval
+            await asyncio.sleep(self.interval)
+            now = time.monotonic()
+            lag = max(0.0, now - expected)
+            LOOP_LAG_SECONDS.observe(lag)
+            self._report(lag)
+            with self._lock:
+                self._beat = now
+
+    def _sample(self) -> None:
+        while not self._stopped.wait(min(self.interval, self.threshold) / 2):
+            with self._lock:
+                stalled = time.monotonic() - self._beat - self.interval
+                if stalled < self.threshold or self._stack is not None:
+                    continue
+                frame = sys._current_frames().get(self._loop_thread)
+                if frame is not None:
+                    self._stack = _user_frames(frame)
+
+    def _report(self, lag: float) -> None:
+        with self._lock:
+            stack, self._stack = self._stack, None
+        if stack is None:
+            return
+        innermost = stack[-1] if stack else None
+        location = f"{os.path.basename(innermost.filename)}:{innermost.lineno} in {innermost.name}" if innermost else "?"
+        block = LoopBlock(max(lag, self.threshold), traceback.format_list(stack), location)
+        self.blocks.append(block)
+        LOOP_BLOCKS.inc()
+        if self.activity is not None:
+            self.activity.record(
+                "loop_blocked",
+                agent=self.agent,
+                outcome="warning",
+                latency=block.seconds,
+                location=block.location,
+                stack="".join(block.stack),
+            )
+        if self.notify is not None:
+            self.notify(block)
+        else:
+            logger.warning(block.summary())
+
+
+async def start_watchdog(
+    config: ObservabilityConfig,
+    activity: ActivityLog | None = None,
+    agent: str = "",
+    notify: Callable[[LoopBlock], None] | None = None,
+) -> LoopWatchdog | None:
+    """Start the ``[observability]`` loop watchdog; None when ``loop_block_seconds`` is 0."""
+    if not config.loop_block_seconds:
+        return None
+    watchdog = LoopWatchdog(config.loop_block_seconds, activity=activity, agent=agent, notify=notify)
+    await watchdog.start()
+    return watchdog
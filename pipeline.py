@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Iterable
+
+Emit = Callable[[Any], Awaitable[None]]
+Handler = Callable[[Any, Emit], Awaitable[None]]
+
+_DONE = object()
+
+
+@dataclass(slots=True)
+class Stage:
+    """One step of a pipeline.
+
+    ``handler(item, emit)`` processes an item from the inbox and awaits ``emit``
+    for every item it wants to hand to the next stage. ``emit`` blocks while the
+    next queue is full, which is what gives the pipeline backpressure.
+    """
+
+    name: str
+    handler: Handler
+    concurrency: int = 1
+
+
+class Pipeline:
+    """Stages connected by bounded queues, each drained by its own workers."""
+
+    def __init__(self, stages: list[Stage], queue_size: int = 4) -> None:
+        if not stages:
+            raise ValueError("pipeline needs at least one stage")
+        self.stages = stages
+        self.queue_size = max(1, queue_size)
+
+    async def run(self, items: Iterable[Any]) -> None:
+        queues: list[asyncio.Queue[Any]] = [
+            asyncio.Queue(maxsize=self.queue_size) for _ in self.stages
+        ]
+        try:
+            async with asyncio.TaskGroup() as group:
+                group.create_task(self._feed(items, queues[0]))
+                for index, stage in enumerate(self.stages):
+                    outbox = queues[index + 1] if index + 1 < len(queues) else None
+                    group.create_task(self._run_stage(stage, queues[index], outbox))
+        except ExceptionGroup as exc:
+            # A failing stage cancels the rest; surface its error as-is so callers
+            # keep reporting e.g. HTTP status errors instead of a group.
+            raise _first_error(exc) from None
+
+    async def _feed(self, items: Iterable[Any], queue: asyncio.Queue[Any]) -> None:
+        for item in items:
+            await queue.put(item)
+        await queue.put(_DONE)
+
+    async def _run_stage(
+        self,
+        stage: Stage,
+        inbox: asyncio.Queue[Any],
+        outbox: asyncio.Queue[Any] | None,
+    ) -> None:
+        async def emit(item: Any) -> None:
+            if outbox is not None:
+                await outbox.put(item)
+
+        async def worker() -> None:
+            while True:
+                item = await inbox.get()
+                if item is _DONE:
+                    # Put the marker back so sibling workers see it too.
+                    await inbox.put(_DONE)
+                    return
+                await stage.handler(item, emit)
+
+        async with asyncio.TaskGroup() as workers:
+            for _ in range(max(1, stage.concurrency)):
+                workers.create_task(worker())
+        if outbox is not None:
+            await outbox.put(_DONE)
+
+
+def _first_error(group: BaseExceptionGroup) -> BaseException:
+    first = group.exceptions[0]
+    if isinstance(first, BaseExceptionGroup):
+        return _first_error(first)
+    return first
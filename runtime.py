@@ -0,0 +1,266 @@
+from __future__ import annotations
+
+import asyncio
+import sys
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TextIO
+
+from bot_engine import BotEngine
+from config import AppConfig, LLMConfig, ResolvedSecrets, load_config, resolve_secrets, validate_config
+from http_pool import MOLTBOOK_HOST, HttpPool
+from llm.base import LLMProvider
+from llm.factory import build_provider
+from moltbook.client import MoltbookClient
+from moltbook.rate_limiter import build_rate_limiter
+from observability import observability_session
+from observability.activity_log import ActivityLog
+from scheduler import Scheduler
+from storage import AgentStorage, open_storage
+from ui.console import ConsoleUI
+
+
+@dataclass(slots=True)
+class AgentSpec:
+    name: str
+    config: AppConfig
+    secrets: ResolvedSecrets
+
+
+@dataclass(slots=True)
+class _Agent:
+    spec: AgentSpec
+    ui: ConsoleUI
+    client: MoltbookClient
+    scheduler: Scheduler
+    storage: AgentStorage
+    engine: BotEngine
+
+
+def agent_config_paths(directory: str | Path) -> list[Path]:
+    directory = Path(directory).expanduser()
+    paths = sorted(directory.glob("*.toml"))
+    if not paths:
+        raise FileNotFoundError(f"No agent configs (*.toml) in {directory}")
+    return paths
+
+
+def load_agents(directory: str | Path) -> list[AgentSpec]:
+    """Load every ``*.toml`` in ``directory`` as one agent, named after the file."""
+    return load_agent_files(agent_config_paths(directory))
+
+
+def load_agent_files(paths: list[Path]) -> list[AgentSpec]:
+    agents: list[AgentSpec] = []
+    credentials: dict[str, str] = {}
+    for path in paths:
+        try:
+            config = load_config(path)
+            secrets = resolve_secrets(config)
+            validate_config(config, secrets)
+        except ValueError as exc:
+            raise ValueError(f"{path.name}: {exc}") from exc
+        owner = credentials.setdefault(config.moltbook.credentials_path, path.stem)
+        if owner != path.stem:
+            raise ValueError(f"{path.name}: same Moltbook credentials as {owner}.toml")
+        agents.append(AgentSpec(path.stem, config, secrets))
+    return agents
+
+
+class AgentRuntime:
+    """Runs one BotEngine per agent on a single event loop.
+
+    Agents share the HTTP connection pools and LLM provider instances; each
+    keeps its own scheduler, rate limiter and storage under
+    ``<data_dir>/agents/<name>``. Lines typed on stdin are routed as commands:
+    ``status`` and ``quit`` apply to the runtime, ``@name /cmd`` goes to one
+    agent and anything else to all of them.
+    """
+
+    def __init__(
+        self,
+        agents: list[AgentSpec],
+        stream: TextIO | None = None,
+        read_stdin: bool = True,
+        metrics_port_offset: int = 0,
+    ) -> None:
+        if not agents:
+            raise ValueError("no agents to run")
+        self.specs = agents
+        self.stream = stream or sys.stdout
+        self.read_stdin = read_stdin
+        self._stopping = False
+        self.agents: dict[str, _Agent] = {}
+        self._providers: dict[tuple, LLMProvider] = {}
+        # One connection pool per host for every agent in this process.
+        self.pool = HttpPool(agents[0].config.http)
+        # Likewise one metrics endpoint; worker processes each add their index to the port.
+        self.metrics_port_offset = metrics_port_offset
+        # And one activity log; every line names its agent.
+        self.activity: ActivityLog | None = None
+
+    def _say(self, message: str) -> None:
+        print(f"[runtime] {message}", file=self.stream, flush=True)
+
+    def _provider(self, config: LLMConfig, api_key: str) -> LLMProvider:
+        key = (config.provider, config.model, config.temperature, api_key)
+        provider = self._providers.get(key)
+        if provider is None:
+            provider = build_provider(config, api_key, self.pool)
+            self._providers[key] = provider
+        return provider
+
+    async def _start_agent(self, spec: AgentSpec) -> _Agent:
+        config = spec.config
+        ui = ConsoleUI(spec.name, self.stream)
+        client = MoltbookClient(
+            config.moltbook.credentials_path,
+            rate_limiter=build_rate_limiter(config.moltbook, config.storage.data_dir),
+            http_client=self.pool.client(MOLTBOOK_HOST),
+            agent=config.bot.name,
+        )
+        storage = await open_storage(
+            config.storage, Path(config.storage.data_dir).expanduser() / "agents" / spec.name
+        )
+        scheduler = Scheduler(
+            config.behavior, config.advanced, state_path=storage.scheduler_path, agent=config.bot.name
+        )
+        engine = BotEngine(
+            config,
+            client,
+            self._provider(config.llm, spec.secrets.llm_api_key),
+            scheduler,
+            ui,
+            seen_index=storage.seen_index,
+            journal=storage.journal,
+            follow_cache=storage.follow_cache,
+            activity=self.activity,
+        )
+        return _Agent(spec, ui, client, scheduler, storage, engine)
+
+    async def run(self) -> None:
+        command_task: asyncio.Task | None = None
+        first = self.specs[0].config
+        try:
+            async with observability_session(
+                first.observability,
+                first.storage.data_dir,
+                # A loop block stalls every agent on this loop.
+                agent=", ".join(spec.config.bot.name for spec in self.specs),
+                worker=self.metrics_port_offset,
+                notify=self._say,
+            ) as activity:
+                self.activity = activity
+                started = await asyncio.gather(
+                    *(self._start_agent(spec) for spec in self.specs), return_exceptions=True
+                )
+                # Keep the agents that did start so the cleanup below closes their storage.
+                self.agents = {agent.spec.name: agent for agent in started if isinstance(agent, _Agent)}
+                for result in started:
+                    if isinstance(result, BaseException):
+                        raise result
+                if self._stopping:
+                    return
+                self._say(f"🦀 Running {len(self.agents)} agents with {len(self._providers)} LLM provider(s)")
+                if self.read_stdin:
+                    command_task = asyncio.create_task(self._command_loop())
+                await asyncio.gather(*(self._run_agent(agent) for agent in self.agents.values()))
+        finally:
+            if command_task is not None:
+                command_task.cancel()
+            for agent in self.agents.values():
+                await agent.client.close()
+                await agent.scheduler.flush()
+                await agent.storage.close()
+            await self.pool.aclose()
+
+    async def _run_agent(self, agent: _Agent) -> None:
+        try:
+            await agent.engine.run_loop()
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            # One broken agent must not take the others down.
+            await agent.ui.send_status(f"❌ Agent stopped: {type(exc).__name__}: {str(exc)[:200]}")
+
+    def stop(self) -> None:
+        self._stopping = True
+        for agent in self.agents.values():
+            agent.engine.stop()
+
+    def status(self) -> dict[str, dict]:
+        return {name: agent.engine.status_snapshot() for name, agent in self.agents.items()}
+
+    def status_lines(self) -> list[str]:
+        snapshots = self.status()
+        running = sum(1 for snapshot in snapshots.values() if snapshot["running"] and not snapshot["paused"])
+        lines = [f"📊 {running}/{len(snapshots)} agents active"]
+        for name, snapshot in snapshots.items():
+            if not snapshot["running"]:
+                state = "⏹️  Stopped"
+            elif snapshot["paused"]:
+                state = "⏸️  Paused"
+            else:
+                state = "🦀 Running"
+            waits = ", ".join(
+                f"{action}={int(wait)}s" if wait > 0 else f"{action}=ready"
+                for action, wait in snapshot["next"].items()
+            )
+            lines.append(f"   {name}: {state} | {waits}")
+        return lines
+
+    def dispatch(self, line: str) -> None:
+        text = line.strip()
+        if not text:
+            return
+        if text.lstrip("/") == "status":
+            for status_line in self.status_lines():
+                self._say(status_line)
+            return
+        if text.lstrip("/") == "quit":
+            self._say("👋 Stopping all agents")
+            self.stop()
+            return
+        if text.startswith("@"):
+            name, _, command = text[1:].partition(" ")
+            agent = self.agents.get(name)
+            if agent is None:
+                self._say(f"❓ Unknown agent: {name}")
+                return
+            agent.ui.push_command(command)
+            return
+        for agent in self.agents.values():
+            agent.ui.push_command(text)
+
+    async def _command_loop(self) -> None:
+        lines: asyncio.Queue[str | None] = asyncio.Queue()
+        loop = asyncio.get_running_loop()
+
+        def _read() -> None:
+            # A daemon thread: blocking readline must not keep the process alive.
+            for line in sys.stdin:
+                try:
+                    loop.call_soon_threadsafe(lines.put_nowait, line)
+                except RuntimeError:
+                    return
+            try:
+                loop.call_soon_threadsafe(lines.put_nowait, None)
+            except RuntimeError:
+                pass
+
+        threading.Thread(target=_read, name="tinymolty-stdin", daemon=True).start()
+        while True:
+            line = await lines.get()
+            if line is None:
+                # stdin closed (e.g. running under a service manager); keep the agents going.
+                return
+            self.dispatch(line)
+
+
+def run_agents(agents: list[AgentSpec]) -> None:
+    runtime = AgentRuntime(agents)
+    try:
+        asyncio.run(runtime.run())
+    except KeyboardInterrupt:
+        pass
@@ -1,19 +1,138 @@
 from __future__ import annotations
 
 import asyncio
+import heapq
+import itertools
+import math
 import random
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Iterable
 
+from clock import SYSTEM_CLOCK, Clock
 from config import AdvancedConfig, BehaviorConfig
+from observability import metrics
+from storage.atomic import read_json, write_json_atomic
+
+
+ARRIVAL_EWMA_ALPHA = 0.3
+FEED_LIMIT_HEADROOM = 1.5
+
+DECISIONS = metrics.counter(
+    "tinymolty_scheduler_decisions",
+    "can_do answers by action and reason (allowed, high_score, cooldown, daily_cap, paced, ...)",
+    ["agent", "action", "decision"],
+)
+ACTIONS = metrics.counter("tinymolty_actions", "Actions recorded as done", ["agent", "action"])
 
 
 class Scheduler:
-    def __init__(self, behavior: BehaviorConfig, advanced: AdvancedConfig) -> None:
+    def __init__(
+        self,
+        behavior: BehaviorConfig,
+        advanced: AdvancedConfig,
+        state_path: str | Path | None = None,
+        clock: Clock | None = None,
+        rng: random.Random | None = None,
+        agent: str = "",
+    ) -> None:
         self.behavior = behavior
+        # Fills the ``agent`` label, so agents sharing a process keep separate series.
+        self.agent = agent
         self.advanced = advanced
+        # Injected by simulations; real runs use wall time and an unseeded RNG.
+        self.clock = clock or SYSTEM_CLOCK
+        self.rng = rng or random.Random()
         self._last_action: dict[str, datetime] = {}
         self._daily_counts: dict[str, tuple[datetime.date, int]] = {}
         self._backoff_until: dict[str, datetime] = {}
+        self.state_path = Path(state_path).expanduser() if state_path else None
+        self._save_task: asyncio.Task | None = None
+        self._save_again = False
+        if self.state_path is not None:
+            self._load_state()
+        self._in_flight: set[str] = set()
+        # Min-heap of (monotonic deadline, seq, action). Entries whose deadline no
+        # longer matches _deadlines are stale and skipped lazily.
+        self._heap: list[tuple[float, int, str]] = []
+        self._deadlines: dict[str, float] = {}
+        self._seq = itertools.count()
+        self._wake = asyncio.Event()
+        self._wake_loop: asyncio.AbstractEventLoop | None = None
+        # Pacing token buckets: tokens and the monotonic time of the last refill.
+        self._pace_tokens: dict[str, float] = {}
+        self._pace_refilled: dict[str, float] = {}
+        # EWMA of new feed posts per minute, and when the last browse was counted.
+        self._arrival_rate: float | None = None
+        self._arrivals_at: float | None = None
+
+    def update_config(self, behavior: BehaviorConfig, advanced: AdvancedConfig) -> None:
+        """Apply reloaded settings; deadlines are recomputed from the new cooldowns."""
+        self.behavior = behavior
+        self.advanced = advanced
+        self._heap.clear()
+        self._deadlines.clear()
+        self.wake()
+
+    def _load_state(self) -> None:
+        data = read_json(self.state_path)
+        if not isinstance(data, dict):
+            return
+        try:
+            for action, value in data.get("last_action", {}).items():
+                self._last_action[action] = datetime.fromisoformat(value)
+            for action, value in data.get("backoff_until", {}).items():
+                self._backoff_until[action] = datetime.fromisoformat(value)
+            # {"2026-10-19": {"post": 3}}: counts from other days are simply stale.
+            for day, counts in sorted(data.get("daily_counts", {}).items()):
+                for action, count in counts.items():
+                    self._daily_counts[action] = (date.fromisoformat(day), int(count))
+        except (TypeError, ValueError, AttributeError):
+            # A damaged state file must not keep the bot from starting.
+            self._last_action.clear()
+            self._backoff_until.clear()
+            self._daily_counts.clear()
+
+    def snapshot(self) -> dict:
+        daily: dict[str, dict[str, int]] = {}
+        for action, (day, count) in self._daily_counts.items():
+            daily.setdefault(day.isoformat(), {})[action] = count
+        return {
+            "last_action": {action: value.isoformat() for action, value in self._last_action.items()},
+            "backoff_until": {action: value.isoformat() for action, value in self._backoff_until.items()},
+            "daily_counts": daily,
+        }
+
+    def _persist(self) -> None:
+        """Write-behind snapshot: at most one write in flight, later changes coalesce into the next."""
+        if self.state_path is None:
+            return
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            write_json_atomic(self.state_path, self.snapshot())
+            return
+        if self._save_task is not None and not self._save_task.done():
+            self._save_again = True
+            return
+        self._save_task = asyncio.create_task(self._save_loop())
+
+    async def _save_loop(self) -> None:
+        while True:
+            self._save_again = False
+            try:
+                await asyncio.to_thread(write_json_atomic, self.state_path, self.snapshot())
+            except OSError:
+                # Persistence is best effort; the in-memory state stays authoritative.
+                return
+            if not self._save_again:
+                return
+
+    async def flush(self) -> None:
+        """Wait for pending state writes; call before shutdown."""
+        if self._save_task is not None:
+            await self._save_task
+            self._save_task = None
 
     def _cooldown_seconds(self, action: str) -> int:
         if action == "post":
@@ -21,11 +140,49 @@ class Scheduler:
         if action == "comment":
             return self.behavior.comment_cooldown_minutes * 60
         if action == "browse":
-            return self.behavior.browse_interval_minutes * 60
+            return int(self.browse_interval_seconds())
         if action == "heartbeat":
             return self.behavior.heartbeat_interval_hours * 3600
         return 0
 
+    def record_feed_arrivals(self, new_posts: int) -> None:
+        """Fold the number of never-seen posts from one browse into the arrival-rate estimate."""
+        now = self.clock.monotonic()
+        last, self._arrivals_at = self._arrivals_at, now
+        if last is None:
+            return
+        minutes = max((now - last) / 60, 1 / 60)
+        rate = new_posts / minutes
+        if self._arrival_rate is None:
+            self._arrival_rate = rate
+        else:
+            self._arrival_rate += ARRIVAL_EWMA_ALPHA * (rate - self._arrival_rate)
+        self._schedule("browse")
+
+    @property
+    def arrival_rate(self) -> float | None:
+        """Estimated new posts per minute, or None before two browses were counted."""
+        return self._arrival_rate
+
+    def browse_interval_seconds(self) -> float:
+        behavior = self.behavior
+        if not behavior.adaptive_browse or self._arrival_rate is None:
+            return behavior.browse_interval_minutes * 60
+        low, high = behavior.browse_interval_min_minutes, behavior.browse_interval_max_minutes
+        if self._arrival_rate <= 0:
+            return high * 60
+        minutes = behavior.browse_target_new_posts / self._arrival_rate
+        return min(max(minutes, low), high) * 60
+
+    def feed_limit(self) -> int:
+        """Posts to request per browse: enough headroom for what arrives in one interval."""
+        behavior = self.behavior
+        if not behavior.adaptive_browse or self._arrival_rate is None:
+            return behavior.feed_limit
+        expected = self._arrival_rate * self.browse_interval_seconds() / 60
+        limit = math.ceil(expected * FEED_LIMIT_HEADROOM)
+        return min(max(limit, behavior.feed_limit_min), behavior.feed_limit_max)
+
     def _max_per_day(self, action: str) -> int | None:
         if action == "comment":
             return self.behavior.max_comments_per_day
@@ -34,68 +191,226 @@ class Scheduler:
         return None
 
     def _ensure_daily_bucket(self, action: str) -> int:
-        today = datetime.utcnow().date()
+        today = self.clock.utcnow().date()
         day, count = self._daily_counts.get(action, (today, 0))
         if day != today:
             count = 0
         self._daily_counts[action] = (today, count)
         return count
 
-    def can_do(self, action: str) -> bool:
+    def daily_usage(self) -> dict[str, tuple[int, int]]:
+        """Today's (used, cap) for each enabled action with a daily cap."""
+        usage = {}
+        for action in ("comment", "post"):
+            cap = self._max_per_day(action)
+            if cap is not None and action in self.behavior.enabled_actions:
+                usage[action] = (self._ensure_daily_bucket(action), cap)
+        return usage
+
+    def _seconds_to_midnight(self) -> float:
+        now = self.clock.utcnow()
+        midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+        return (midnight - now).total_seconds()
+
+    def _paced(self, action: str) -> bool:
+        return self.behavior.pacing and self._max_per_day(action) is not None
+
+    def _pace_rate(self, action: str) -> float:
+        """Tokens per second that spend what is left of today's quota, minus the reserve, by midnight."""
+        max_per_day = self._max_per_day(action) or 0
+        reserve = max_per_day * self.behavior.pacing_reserve_fraction
+        spendable = max_per_day - self._ensure_daily_bucket(action) - reserve
+        if spendable <= 0:
+            return 0.0
+        return spendable / max(1.0, self._seconds_to_midnight())
+
+    def _pace_tokens_now(self, action: str) -> float:
+        # A bucket of one token: the rate adapts to the remaining quota on every
+        # refill, and unused time never accumulates into a burst.
+        now = self.clock.monotonic()
+        tokens = self._pace_tokens.get(action, 1.0)
+        last = self._pace_refilled.get(action)
+        if last is not None:
+            tokens = min(1.0, tokens + (now - last) * self._pace_rate(action))
+        self._pace_tokens[action] = tokens
+        self._pace_refilled[action] = now
+        return tokens
+
+    def _pace_wait(self, action: str) -> float:
+        missing = 1.0 - self._pace_tokens_now(action)
+        if missing <= 0:
+            return 0.0
+        rate = self._pace_rate(action)
+        if rate <= 0:
+            return self._seconds_to_midnight()
+        return missing / rate
+
+    def can_do(self, action: str, score: float | None = None) -> bool:
+        """Whether ``action`` may run now.
+
+        With pacing enabled, ``score`` lets a high-scoring candidate skip the
+        pacing bucket and draw on the reserved part of the daily quota.
+        """
+        decision = self._decide(action, score)
+        DECISIONS.labels(agent=self.agent, action=action, decision=decision).inc()
+        return decision in ("allowed", "high_score")
+
+    def _decide(self, action: str, score: float | None) -> str:
         if action not in self.behavior.enabled_actions:
-            return False
+            return "disabled"
+        if action in self._in_flight:
+            return "in_flight"
         backoff_until = self._backoff_until.get(action)
-        if backoff_until and datetime.utcnow() < backoff_until:
-            return False
+        if backoff_until and self.clock.utcnow() < backoff_until:
+            return "backoff"
         last = self._last_action.get(action)
         if last:
             cooldown = timedelta(seconds=self._cooldown_seconds(action))
-            if datetime.utcnow() - last < cooldown:
-                return False
+            if self.clock.utcnow() - last < cooldown:
+                return "cooldown"
         max_per_day = self._max_per_day(action)
         if max_per_day is not None:
             count = self._ensure_daily_bucket(action)
             if count >= max_per_day:
-                return False
+                return "daily_cap"
+        if self._paced(action):
+            if score is not None and score >= self.behavior.pacing_high_score:
+                return "high_score"
+            return "allowed" if self._pace_tokens_now(action) >= 1.0 else "paced"
+        return "allowed"
+
+    def reserve(self, action: str, score: float | None = None) -> bool:
+        """Claim an action so concurrent callers don't overshoot cooldowns or caps.
+
+        The claim ends with ``record_action`` on success or ``release`` on failure.
+        """
+        if not self.can_do(action, score):
+            return False
+        self._in_flight.add(action)
         return True
 
+    def release(self, action: str) -> None:
+        self._in_flight.discard(action)
+
     def record_action(self, action: str) -> None:
-        self._last_action[action] = datetime.utcnow()
+        ACTIONS.labels(agent=self.agent, action=action).inc()
+        self._in_flight.discard(action)
+        self._last_action[action] = self.clock.utcnow()
         self._backoff_until.pop(action, None)
         max_per_day = self._max_per_day(action)
         if max_per_day is not None:
-            day, count = self._daily_counts.get(action, (datetime.utcnow().date(), 0))
+            day, count = self._daily_counts.get(action, (self.clock.utcnow().date(), 0))
             self._daily_counts[action] = (day, count + 1)
+        if self._paced(action):
+            self._pace_tokens[action] = max(0.0, self._pace_tokens_now(action) - 1.0)
+        self._schedule(action)
+        self._persist()
 
     def record_attempt(self, action: str) -> None:
         # Update last action time without counting toward daily limits.
-        self._last_action[action] = datetime.utcnow()
+        self._last_action[action] = self.clock.utcnow()
+        self._schedule(action)
+        self._persist()
 
     def record_backoff(self, action: str, seconds: int) -> None:
         if seconds <= 0:
             return
-        until = datetime.utcnow() + timedelta(seconds=seconds)
+        until = self.clock.utcnow() + timedelta(seconds=seconds)
         self._backoff_until[action] = until
+        self._schedule(action)
+        self._persist()
+        self.wake()
 
     def clear_backoff(self, action: str) -> None:
         self._backoff_until.pop(action, None)
+        self._schedule(action)
+        self._persist()
+        self.wake()
 
     def next_available_in(self, action: str) -> float:
         backoff_until = self._backoff_until.get(action)
         if backoff_until:
-            remaining = (backoff_until - datetime.utcnow()).total_seconds()
+            remaining = (backoff_until - self.clock.utcnow()).total_seconds()
             if remaining > 0:
                 return remaining
+        max_per_day = self._max_per_day(action)
+        if max_per_day is not None and self._ensure_daily_bucket(action) >= max_per_day:
+            return self._seconds_to_midnight()
+        remaining = 0.0
         last = self._last_action.get(action)
-        if not last:
-            return 0.0
-        cooldown = self._cooldown_seconds(action)
-        remaining = cooldown - (datetime.utcnow() - last).total_seconds()
-        return max(0.0, remaining)
+        if last:
+            cooldown = self._cooldown_seconds(action)
+            remaining = max(0.0, cooldown - (self.clock.utcnow() - last).total_seconds())
+        if self._paced(action):
+            remaining = max(remaining, self._pace_wait(action))
+        return remaining
+
+    def _schedule(self, action: str) -> None:
+        deadline = self.clock.monotonic() + self.next_available_in(action)
+        self._deadlines[action] = deadline
+        heapq.heappush(self._heap, (deadline, next(self._seq), action))
+
+    def next_due(self, actions: Iterable[str]) -> tuple[str | None, float]:
+        """Return the enabled action among ``actions`` that is due first, and the seconds until then.
+
+        Returns ``(None, inf)`` when none of them is enabled.
+        """
+        # A list, not a set: scheduling order breaks deadline ties, so it must not depend on hashing.
+        wanted = [action for action in actions if action in self.behavior.enabled_actions]
+        for action in wanted:
+            if action not in self._deadlines:
+                self._schedule(action)
+        skipped: list[tuple[float, int, str]] = []
+        found: tuple[str | None, float] = (None, float("inf"))
+        while self._heap:
+            deadline, seq, action = self._heap[0]
+            if self._deadlines.get(action) != deadline:
+                heapq.heappop(self._heap)
+                continue
+            if action not in wanted:
+                skipped.append(heapq.heappop(self._heap))
+                continue
+            remaining = deadline - self.clock.monotonic()
+            if remaining <= 0 and self.next_available_in(action) > 0:
+                # Blocked by something that changed after it was scheduled
+                # (e.g. the daily cap); move it to its real deadline.
+                self._schedule(action)
+                continue
+            found = (action, max(0.0, remaining))
+            break
+        for entry in skipped:
+            heapq.heappush(self._heap, entry)
+        return found
+
+    def wake(self) -> None:
+        """Interrupt ``wait`` so the engine re-evaluates what to do next."""
+        self._wake.set()
+
+    async def wait(self, timeout: float | None = None) -> bool:
+        """Sleep until ``timeout`` elapses or ``wake`` is called. Returns True if woken.
+
+        A wake that arrives while nobody is waiting is not lost: the next call
+        returns immediately.
+        """
+        loop = asyncio.get_running_loop()
+        if self._wake_loop is not loop:
+            # asyncio.Event binds to the first loop that waits on it.
+            pending = self._wake.is_set()
+            self._wake = asyncio.Event()
+            if pending:
+                self._wake.set()
+            self._wake_loop = loop
+        if not self._wake.is_set():
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                return False
+        self._wake.clear()
+        return True
 
     def jitter(self) -> float:
         low, high = self.advanced.jitter_range_seconds
-        return random.uniform(low, high)
+        return self.rng.uniform(low, high)
 
     async def sleep_with_jitter(self, base_seconds: float) -> None:
         await asyncio.sleep(base_seconds + self.jitter())
@@ -0,0 +1,298 @@
+from __future__ import annotations
+
+import asyncio
+import math
+import random
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import TextIO
+
+from bot_engine import BotEngine
+from clock import VirtualClock
+from config import AppConfig
+from llm.base import LLMProvider, LLMResponse
+from moltbook.models import AgentProfile, CreatePostResponse, FeedResponse, Post
+from moltbook.rate_limiter import RateLimiter
+from observability import tracing
+from scheduler import Scheduler
+from ui.base import UserInterface
+
+SIMULATION_START = datetime(2026, 1, 1)
+DEFAULT_TOPICS = ["agents", "open source", "philosophy", "tooling", "memes"]
+# Rough chars-per-token ratio of English text, for token estimates without a tokenizer.
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+class FakeMoltbook:
+    """Stand-in for MoltbookClient: a feed that grows at ``posts_per_hour``.
+
+    Requests go through the real RateLimiter and take ``latency`` seconds of
+    simulated time; every call is counted per endpoint.
+    """
+
+    def __init__(
+        self,
+        clock: VirtualClock,
+        rng: random.Random,
+        rate_limiter: RateLimiter,
+        posts_per_hour: float = 30.0,
+        authors: int = 50,
+        topics: list[str] | None = None,
+        latency: float = 0.2,
+    ) -> None:
+        self.clock = clock
+        self.rng = rng
+        self.rate_limiter = rate_limiter
+        self.posts_per_hour = posts_per_hour
+        self.authors = [AgentProfile(id=f"agent-{index}", username=f"molty{index}") for index in range(authors)]
+        self.topics = topics or DEFAULT_TOPICS
+        self.latency = latency
+        self.calls: Counter[str] = Counter()
+        self.rate_limit_wait = 0.0
+        self._posts: list[Post] = []
+        self._votes: dict[str, int] = {}
+        self._next_arrival = self._interarrival()
+        self._own_posts = 0
+
+    def _interarrival(self) -> float:
+        if self.posts_per_hour <= 0:
+            return math.inf
+        return self.rng.expovariate(self.posts_per_hour / 3600)
+
+    def _publish_arrivals(self) -> None:
+        now = self.clock.monotonic()
+        while self._next_arrival <= now:
+            created_at = self.clock.start + timedelta(seconds=self._next_arrival)
+            topic = self.rng.choice(self.topics)
+            index = len(self._posts)
+            self._posts.append(
+                Post(
+                    id=f"sim-{index:06d}",
+                    author=self.rng.choice(self.authors),
+                    title=f"Thoughts on {topic} #{index}",
+                    content=f"Post {index} about {topic}, written at {created_at:%H:%M}.",
+                    created_at=created_at,
+                )
+            )
+            self._votes[self._posts[-1].id] = self.rng.randint(0, 100)
+            self._next_arrival += self._interarrival()
+
+    async def _call(self, endpoint: str) -> None:
+        with tracing.span(endpoint):
+            started = self.clock.monotonic()
+            await self.rate_limiter.wait()
+            self.rate_limit_wait += self.clock.monotonic() - started
+            self.calls[endpoint] += 1
+            await asyncio.sleep(self.latency)
+
+    @property
+    def published(self) -> int:
+        return len(self._posts)
+
+    def _page(self, sort: str | None, limit: int | None) -> FeedResponse:
+        self._publish_arrivals()
+        if sort == "hot":
+            posts = sorted(self._posts, key=lambda post: self._votes[post.id], reverse=True)
+        else:
+            posts = self._posts[::-1]
+        return FeedResponse(posts=posts[: limit or 25])
+
+    async def get_me(self) -> dict:
+        await self._call("GET /agents/me")
+        return {"agent": {"name": "SimMolty", "is_claimed": True, "karma": 0, "stats": {}}}
+
+    async def heartbeat(self) -> None:
+        self.calls["heartbeat"] += 1
+
+    async def get_feed(self, sort: str | None = None, limit: int | None = None) -> FeedResponse:
+        await self._call("GET /feed")
+        return self._page(sort, limit)
+
+    async def get_posts(self, sort: str = "hot", limit: int = 25, submolt: str | None = None) -> FeedResponse:
+        await self._call("GET /posts")
+        return self._page(sort, limit)
+
+    async def get_following(self) -> list[str]:
+        await self._call("GET /agents/me/following")
+        return []
+
+    async def upvote(self, post_id: str) -> None:
+        await self._call("POST /posts/{id}/upvote")
+
+    async def comment(self, post_id: str, content: str) -> None:
+        await self._call("POST /posts/{id}/comments")
+
+    async def follow(self, agent_id: str) -> None:
+        await self._call("POST /agents/{id}/follow")
+
+    async def create_post(self, content: str, submolt: str | None = None, title: str | None = None) -> CreatePostResponse:
+        await self._call("POST /posts")
+        self._own_posts += 1
+        return CreatePostResponse(id=f"own-{self._own_posts:04d}", success=True)
+
+    async def close(self) -> None:
+        self.rate_limiter.close()
+
+
+class FakeLLM(LLMProvider):
+    """Deterministic LLM: random scores for scoring prompts, canned text otherwise."""
+
+    def __init__(self, rng: random.Random, latency: float = 1.5) -> None:
+        self.rng = rng
+        self.latency = latency
+        self.calls = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+
+    async def generate(self, system_prompt: str, user_prompt: str) -> LLMResponse:
+        await asyncio.sleep(self.latency)
+        if "Posts to score:" in user_prompt:
+            listing = user_prompt.split("Posts to score:", 1)[1].split("\n\n", 1)[0]
+            ids = [line.split(":", 1)[0] for line in listing.splitlines() if ":" in line]
+            content = "[" + ", ".join(f'{{"id": "{post_id}", "score": {self.rng.random():.2f}}}' for post_id in ids) + "]"
+        elif "comment" in user_prompt:
+            content = self.rng.choice(["Great point!", "I had not thought of it that way.", "Curious where this leads."])
+        else:
+            content = "A simulated post about something the agent finds interesting today."
+        self.calls += 1
+        self.prompt_tokens += estimate_tokens(system_prompt) + estimate_tokens(user_prompt)
+        self.completion_tokens += estimate_tokens(content)
+        return LLMResponse(content=content)
+
+
+class SimulationUI(UserInterface):
+    """Collects status lines stamped with simulated time; prints them if a stream is given."""
+
+    def __init__(self, clock: VirtualClock, stream: TextIO | None = None) -> None:
+        self.clock = clock
+        self.stream = stream
+        self.messages: list[tuple[datetime, str]] = []
+
+    async def start(self) -> None:
+        return
+
+    async def stop(self) -> None:
+        return
+
+    async def send_status(self, message: str) -> None:
+        now = self.clock.utcnow()
+        self.messages.append((now, message))
+        if self.stream is not None:
+            for line in message.splitlines() or [""]:
+                print(f"[{now:%H:%M:%S}] {line}", file=self.stream)
+
+    async def prompt(self, message: str) -> str:
+        return ""
+
+    async def get_command(self) -> str | None:
+        return None
+
+    async def wait_command(self) -> str:
+        await asyncio.Event().wait()
+        return ""
+
+    async def update_activity(self, message: str, next_action_seconds: float | None = None) -> None:
+        return
+
+
+@dataclass(slots=True)
+class SimulationReport:
+    hours: float
+    seed: int
+    actions: dict[str, int] = field(default_factory=dict)
+    api_calls: dict[str, int] = field(default_factory=dict)
+    rate_limit_wait_seconds: float = 0.0
+    llm_calls: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    posts_published: int = 0
+    wall_seconds: float = 0.0
+
+    def lines(self) -> list[str]:
+        lines = [
+            f"🧪 Simulated {self.hours:g}h (seed {self.seed}) in {self.wall_seconds:.2f}s",
+            f"   Feed: {self.posts_published} posts published by others",
+            "   Actions: " + ", ".join(f"{action}={count}" for action, count in self.actions.items()),
+            f"   API calls: {sum(self.api_calls.values())} total, {self.rate_limit_wait_seconds:.1f}s waiting on the rate limiter",
+        ]
+        lines.extend(f"      {endpoint}: {count}" for endpoint, count in sorted(self.api_calls.items()))
+        lines.append(
+            f"   LLM: {self.llm_calls} calls, ~{self.prompt_tokens} prompt + "
+            f"~{self.completion_tokens} completion tokens"
+        )
+        return lines
+
+
+async def _simulate(
+    config: AppConfig, clock: VirtualClock, hours: float, seed: int, posts_per_hour: float, stream: TextIO | None
+) -> SimulationReport:
+    # Separate streams per component, so a change in one does not shift the others.
+    scheduler = Scheduler(
+        config.behavior, config.advanced, clock=clock, rng=random.Random(f"{seed}:scheduler"), agent=config.bot.name
+    )
+    limiter = RateLimiter(config.moltbook.requests_per_minute, burst=config.moltbook.rate_limit_burst, clock=clock)
+    client = FakeMoltbook(
+        clock,
+        random.Random(f"{seed}:moltbook"),
+        limiter,
+        posts_per_hour=posts_per_hour,
+        topics=config.personality.topics_of_interest or None,
+    )
+    llm = FakeLLM(random.Random(f"{seed}:llm"))
+    ui = SimulationUI(clock, stream)
+    engine = BotEngine(config, client, llm, scheduler, ui)
+    task = asyncio.create_task(engine.run_loop())
+    await asyncio.sleep(hours * 3600)
+    engine.stop()
+    await task
+    await client.close()
+    await tracing.TRACER.flush()
+    actions = {
+        "browse": client.calls["GET /feed"],
+        "comment": client.calls["POST /posts/{id}/comments"],
+        "upvote": client.calls["POST /posts/{id}/upvote"],
+        "follow": client.calls["POST /agents/{id}/follow"],
+        "post": client.calls["POST /posts"],
+        "heartbeat": client.calls["heartbeat"],
+    }
+    api_calls = {endpoint: count for endpoint, count in client.calls.items() if endpoint != "heartbeat"}
+    return SimulationReport(
+        hours=hours,
+        seed=seed,
+        actions=actions,
+        api_calls=api_calls,
+        rate_limit_wait_seconds=client.rate_limit_wait,
+        llm_calls=llm.calls,
+        prompt_tokens=llm.prompt_tokens,
+        completion_tokens=llm.completion_tokens,
+        posts_published=client.published,
+    )
+
+
+def run_simulation(
+    config: AppConfig,
+    hours: float = 24.0,
+    seed: int = 0,
+    posts_per_hour: float = 30.0,
+    stream: TextIO | None = None,
+) -> SimulationReport:
+    """Run the engine against fake Moltbook and LLM backends on a virtual clock.
+
+    The same config and seed always produce the same report (apart from
+    ``wall_seconds``). Pass ``stream`` to see the status log with simulated timestamps.
+    """
+    clock = VirtualClock(SIMULATION_START)
+    loop = clock.new_event_loop()
+    started = time.perf_counter()
+    try:
+        report = loop.run_until_complete(_simulate(config, clock, hours, seed, posts_per_hour, stream))
+    finally:
+        loop.close()
+    report.wall_seconds = time.perf_counter() - started
+    return report
@@ -0,0 +1,7 @@
+from .bloom import BloomFilter
+from .bundle import AgentStorage, open_storage
+from .follow_cache import FollowCache
+from .interactions import InteractionJournal
+from .seen_index import SeenIndex
+
+__all__ = ["AgentStorage", "BloomFilter", "FollowCache", "InteractionJournal", "SeenIndex", "open_storage"]
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import hashlib
+import math
+import mmap
+import struct
+from pathlib import Path
+
+_MAGIC = b"TMBF"
+_VERSION = 1
+# magic, version, hash count, bit count, items added
+_HEADER = struct.Struct("<4sHHQQ")
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter stored in a memory-mapped file.
+
+    A negative answer is exact; a positive one may be a false positive at
+    roughly ``error_rate`` once ``capacity`` items have been added.
+    """
+
+    def __init__(self, path: str | Path, capacity: int, error_rate: float = 0.01) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+        self.path = Path(path).expanduser()
+        self.num_bits = max(8, math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.rebuilt = False
+        self._file = None
+        self._map: mmap.mmap | None = None
+        self._open()
+
+    @property
+    def size_bytes(self) -> int:
+        return _HEADER.size + (self.num_bits + 7) // 8
+
+    @property
+    def count(self) -> int:
+        return _HEADER.unpack_from(self._map, 0)[4]
+
+    def _open(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if self.path.exists() and not self._header_matches():
+            # Sizing changed (or the file is corrupt): start over, caller repopulates.
+            self.path.unlink()
+        if not self.path.exists():
+            with self.path.open("wb") as handle:
+                handle.truncate(self.size_bytes)
+                handle.write(_HEADER.pack(_MAGIC, _VERSION, self.num_hashes, self.num_bits, 0))
+            self.rebuilt = True
+        self._file = self.path.open("r+b")
+        self._map = mmap.mmap(self._file.fileno(), self.size_bytes)
+
+    def _header_matches(self) -> bool:
+        try:
+            with self.path.open("rb") as handle:
+                raw = handle.read(_HEADER.size)
+            if len(raw) < _HEADER.size or self.path.stat().st_size != self.size_bytes:
+                return False
+            magic, version, num_hashes, num_bits, _ = _HEADER.unpack(raw)
+        except (OSError, struct.error):
+            return False
+        return (magic, version, num_hashes, num_bits) == (
+            _MAGIC,
+            _VERSION,
+            self.num_hashes,
+            self.num_bits,
+        )
+
+    def _positions(self, key: str) -> list[int]:
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    def __contains__(self, key: str) -> bool:
+        data = self._map
+        for bit in self._positions(key):
+            if not data[_HEADER.size + (bit >> 3)] & (1 << (bit & 7)):
+                return False
+        return True
+
+    def add(self, key: str) -> None:
+        data = self._map
+        for bit in self._positions(key):
+            offset = _HEADER.size + (bit >> 3)
+            data[offset] |= 1 << (bit & 7)
+        magic, version, num_hashes, num_bits, count = _HEADER.unpack_from(data, 0)
+        _HEADER.pack_into(data, 0, magic, version, num_hashes, num_bits, count + 1)
+
+    def clear(self) -> None:
+        self._map[_HEADER.size:] = bytes(self.size_bytes - _HEADER.size)
+        _HEADER.pack_into(self._map, 0, _MAGIC, _VERSION, self.num_hashes, self.num_bits, 0)
+
+    def flush(self) -> None:
+        if self._map is not None:
+            self._map.flush()
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.flush()
+            self._map.close()
+            self._map = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from pathlib import Path
+
+from config import StorageConfig
+
+from .follow_cache import FollowCache
+from .interactions import InteractionJournal
+from .seen_index import SeenIndex
+
+
+@dataclass(slots=True)
+class AgentStorage:
+    """The on-disk state of one agent, all kept under one directory."""
+
+    directory: Path
+    seen_index: SeenIndex
+    journal: InteractionJournal
+    follow_cache: FollowCache
+
+    @property
+    def scheduler_path(self) -> Path:
+        return self.directory / "scheduler.json"
+
+    async def close(self) -> None:
+        await self.journal.close()
+        await asyncio.to_thread(self.seen_index.close)
+
+
+async def open_storage(settings: StorageConfig, directory: str | Path | None = None) -> AgentStorage:
+    """Open (creating if needed) an agent's storage; defaults to ``settings.data_dir``."""
+    root = Path(directory or settings.data_dir).expanduser()
+    seen_index = await asyncio.to_thread(
+        SeenIndex, root / "seen", settings.seen_capacity, settings.seen_error_rate
+    )
+    journal = await asyncio.to_thread(
+        InteractionJournal,
+        root / "interactions.db",
+        settings.journal_batch_size,
+        settings.journal_flush_seconds,
+    )
+    await journal.start()
+    follow_cache = await asyncio.to_thread(
+        FollowCache, root / "follows.json", settings.follow_cache_ttl_hours * 3600
+    )
+    return AgentStorage(root, seen_index, journal, follow_cache)
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from typing import Iterable
+
+from clock import SYSTEM_CLOCK, Clock
+
+from .atomic import read_json, write_json_atomic
+
+# Authors with the lowest accumulated interest are dropped beyond this many.
+MAX_TRACKED_AUTHORS = 5000
+
+
+class FollowCache:
+    """Local view of which authors we follow, plus how interesting each author has been.
+
+    The followed set is seeded from the API (or history) and revalidated once
+    it is older than ``ttl_seconds``; successful follows are added immediately.
+    Seeding only ever adds: a follow we recorded is kept even when the API
+    list leaves it out, so it is not attempted again.
+    ``write``/``save`` are blocking; run them through ``asyncio.to_thread``.
+    """
+
+    def __init__(self, path: str | Path, ttl_seconds: float = 24 * 3600, clock: Clock | None = None) -> None:
+        self.path = Path(path).expanduser()
+        self.ttl_seconds = ttl_seconds
+        self.clock = clock or SYSTEM_CLOCK
+        self._lock = threading.Lock()
+        data = read_json(self.path) or {}
+        self.validated_at: float = float(data.get("validated_at", 0.0))
+        self._following: dict[str, float] = dict(data.get("following", {}))
+        self._interest: dict[str, float] = dict(data.get("interest", {}))
+
+    def __len__(self) -> int:
+        return len(self._following)
+
+    def is_following(self, author_id: str) -> bool:
+        return author_id in self._following
+
+    def needs_revalidation(self, now: float | None = None) -> bool:
+        now = self.clock.time() if now is None else now
+        return now - self.validated_at >= self.ttl_seconds
+
+    def seed(self, author_ids: Iterable[str], now: float | None = None) -> None:
+        """Merge the followed authors listed by the API into the followed set."""
+        now = self.clock.time() if now is None else now
+        for author_id in author_ids:
+            self._following.setdefault(author_id, now)
+        self.validated_at = now
+
+    def mark_validated(self, now: float | None = None) -> None:
+        self.validated_at = self.clock.time() if now is None else now
+
+    def add_following(self, author_id: str) -> None:
+        self._following[author_id] = self.clock.time()
+
+    def add_interest(self, author_id: str, score: float) -> None:
+        self._interest[author_id] = self._interest.get(author_id, 0.0) + max(0.0, score)
+        if len(self._interest) > MAX_TRACKED_AUTHORS:
+            ranked = sorted(self._interest.items(), key=lambda item: item[1], reverse=True)
+            self._interest = dict(ranked[:MAX_TRACKED_AUTHORS])
+
+    def interest(self, author_id: str) -> float:
+        return self._interest.get(author_id, 0.0)
+
+    def pick_unfollowed(self, author_ids: Iterable[str]) -> str | None:
+        """Return the not-yet-followed author with the highest accumulated interest."""
+        candidates = [author_id for author_id in author_ids if author_id and not self.is_following(author_id)]
+        if not candidates:
+            return None
+        return max(candidates, key=self.interest)
+
+    def snapshot(self) -> dict:
+        """Copy the state; take it on the event loop, then ``write`` it from a thread."""
+        return {
+            "validated_at": self.validated_at,
+            "following": dict(self._following),
+            "interest": dict(self._interest),
+        }
+
+    def write(self, snapshot: dict) -> None:
+        with self._lock:
+            write_json_atomic(self.path, snapshot)
+
+    def save(self) -> None:
+        self.write(self.snapshot())
@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from observability import metrics
+
+logger = logging.getLogger("tinymolty")
+
+WRITE_ERRORS = metrics.counter("tinymolty_journal_write_errors", "Failed interaction journal writes, retried later")
+
+KINDS = ("seen", "scored", "comment", "upvote", "follow", "post", "failure")
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS interactions ("
+    " id INTEGER PRIMARY KEY,"
+    " ts REAL NOT NULL,"
+    " kind TEXT NOT NULL,"
+    " post_id TEXT,"
+    " author_id TEXT,"
+    " score REAL,"
+    " detail TEXT"
+    ")",
+    "CREATE INDEX IF NOT EXISTS idx_interactions_post ON interactions (post_id, kind)",
+    "CREATE INDEX IF NOT EXISTS idx_interactions_author ON interactions (author_id, kind)",
+    "CREATE INDEX IF NOT EXISTS idx_interactions_kind_ts ON interactions (kind, ts)",
+)
+
+
+@dataclass(slots=True)
+class Interaction:
+    ts: float
+    kind: str
+    post_id: str | None = None
+    author_id: str | None = None
+    score: float | None = None
+    detail: str | None = None
+
+
+class InteractionJournal:
+    """SQLite history of everything the bot saw and did.
+
+    ``record`` only appends to an in-memory buffer; a background task started
+    with ``start`` writes buffered rows in batches from a worker thread so the
+    event loop never waits on disk. Query methods are blocking and meant to be
+    called through ``asyncio.to_thread``.
+    """
+
+    def __init__(self, path: str | Path, batch_size: int = 100, flush_seconds: float = 2.0) -> None:
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.batch_size = max(1, batch_size)
+        self.flush_seconds = flush_seconds
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        for statement in _SCHEMA:
+            self._db.execute(statement)
+        self._db.commit()
+        self._pending: list[Interaction] = []
+        # Rows handed to the writer thread but not committed yet.
+        self._writing: list[Interaction] = []
+        self._flush_requested = asyncio.Event()
+        self._flush_task: asyncio.Task | None = None
+        self._closed = False
+
+    async def start(self) -> None:
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_loop())
+
+    async def close(self) -> None:
+        self._closed = True
+        if self._flush_task is not None:
+            self._flush_requested.set()
+            await self._flush_task
+            self._flush_task = None
+        await self.flush()
+        with self._lock:
+            self._db.close()
+
+    def record(
+        self,
+        kind: str,
+        post_id: str | None = None,
+        author_id: str | None = None,
+        score: float | None = None,
+        detail: str | None = None,
+    ) -> None:
+        if kind not in KINDS:
+            raise ValueError(f"Unknown interaction kind: {kind}")
+        self._pending.append(Interaction(time.time(), kind, post_id, author_id, score, detail))
+        if len(self._pending) >= self.batch_size:
+            self._flush_requested.set()
+
+    async def flush(self) -> None:
+        batch = self._take_pending()
+        if not batch:
+            return
+        self._writing = batch
+        try:
+            await asyncio.to_thread(self._write, batch)
+        except (sqlite3.Error, OSError) as exc:
+            # A locked database or a full disk is usually temporary: keep the rows for the next flush.
+            self._pending[:0] = batch
+            WRITE_ERRORS.inc()
+            logger.warning("⚠️  Could not write interaction journal %s: %s", self.path, exc)
+        finally:
+            self._writing = []
+
+    async def _flush_loop(self) -> None:
+        while not self._closed:
+            try:
+                await asyncio.wait_for(self._flush_requested.wait(), timeout=self.flush_seconds)
+            except asyncio.TimeoutError:
+                pass
+            self._flush_requested.clear()
+            await self.flush()
+
+    def _take_pending(self) -> list[Interaction]:
+        batch, self._pending = self._pending, []
+        return batch
+
+    def _unflushed(self) -> list[Interaction]:
+        return self._writing + self._pending
+
+    def _write(self, batch: list[Interaction]) -> None:
+        with self._lock:
+            try:
+                self._db.executemany(
+                    "INSERT INTO interactions (ts, kind, post_id, author_id, score, detail)"
+                    " VALUES (?, ?, ?, ?, ?, ?)",
+                    [(i.ts, i.kind, i.post_id, i.author_id, i.score, i.detail) for i in batch],
+                )
+                self._db.commit()
+            except BaseException:
+                # The batch is retried whole, so none of it may stay in the open transaction.
+                self._db.rollback()
+                raise
+
+    def has_post(self, post_id: str, kind: str) -> bool:
+        if any(i.post_id == post_id and i.kind == kind for i in self._unflushed()):
+            return True
+        with self._lock:
+            row = self._db.execute(
+                "SELECT 1 FROM interactions WHERE post_id = ? AND kind = ? LIMIT 1", (post_id, kind)
+            ).fetchone()
+        return row is not None
+
+    def has_author(self, author_id: str, kind: str) -> bool:
+        if any(i.author_id == author_id and i.kind == kind for i in self._unflushed()):
+            return True
+        with self._lock:
+            row = self._db.execute(
+                "SELECT 1 FROM interactions WHERE author_id = ? AND kind = ? LIMIT 1", (author_id, kind)
+            ).fetchone()
+        return row is not None
+
+    def authors(self, kind: str) -> list[str]:
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT DISTINCT author_id FROM interactions WHERE kind = ? AND author_id IS NOT NULL",
+                (kind,),
+            ).fetchall()
+        found = {row[0] for row in rows}
+        found.update(i.author_id for i in self._unflushed() if i.kind == kind and i.author_id)
+        return sorted(found)
+
+    def counts_since(self, since: float) -> dict[str, int]:
+        counts = {kind: 0 for kind in KINDS}
+        with self._lock:
+            for kind in KINDS:
+                (count,) = self._db.execute(
+                    "SELECT COUNT(*) FROM interactions WHERE kind = ? AND ts >= ?", (kind, since)
+                ).fetchone()
+                counts[kind] = count
+        for item in self._unflushed():
+            if item.ts >= since:
+                counts[item.kind] += 1
+        return counts
+
+    def recent(self, kind: str, limit: int = 10) -> list[Interaction]:
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT ts, kind, post_id, author_id, score, detail FROM interactions"
+                " WHERE kind = ? ORDER BY ts DESC LIMIT ?",
+                (kind, limit),
+            ).fetchall()
+        return [Interaction(*row) for row in rows]
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Iterable
+
+from .bloom import BloomFilter
+
+# Bit flags stored per post id.
+ACTIONS = {
+    "scored": 1,
+    "commented": 2,
+    "upvoted": 4,
+    "followed": 8,
+}
+
+
+class SeenIndex:
+    """Persistent record of which posts the bot has handled and how.
+
+    A memory-mapped Bloom filter answers "never seen" without touching disk;
+    SQLite holds the exact set and the actions taken per post. Methods are
+    blocking; call them through ``asyncio.to_thread`` from the event loop.
+    """
+
+    def __init__(self, directory: str | Path, capacity: int = 2_000_000, error_rate: float = 0.01) -> None:
+        self.directory = Path(directory).expanduser()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.directory / "seen.db", check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS seen_posts ("
+            " post_id TEXT PRIMARY KEY,"
+            " actions INTEGER NOT NULL DEFAULT 0,"
+            " first_seen REAL NOT NULL,"
+            " updated_at REAL NOT NULL"
+            ") WITHOUT ROWID"
+        )
+        self._db.commit()
+        self._bloom = BloomFilter(self.directory / "seen.bloom", capacity, error_rate)
+        self._sync_bloom()
+
+    def _sync_bloom(self) -> None:
+        # The filter may lag the database after a crash or a resize; a filter
+        # missing ids would turn into false negatives, so rebuild it.
+        (rows,) = self._db.execute("SELECT COUNT(*) FROM seen_posts").fetchone()
+        if not self._bloom.rebuilt and self._bloom.count == rows:
+            return
+        self._bloom.clear()
+        for (post_id,) in self._db.execute("SELECT post_id FROM seen_posts"):
+            self._bloom.add(post_id)
+        self._bloom.flush()
+
+    def __len__(self) -> int:
+        return self._bloom.count
+
+    def contains(self, post_id: str) -> bool:
+        if post_id not in self._bloom:
+            return False
+        with self._lock:
+            row = self._db.execute(
+                "SELECT 1 FROM seen_posts WHERE post_id = ?", (post_id,)
+            ).fetchone()
+        return row is not None
+
+    def unseen(self, post_ids: Iterable[str]) -> list[str]:
+        """Return the ids that have never been recorded, preserving order."""
+        return [post_id for post_id in post_ids if not self.contains(post_id)]
+
+    def actions(self, post_id: str) -> set[str]:
+        return self.actions_many([post_id])[post_id]
+
+    def actions_many(self, post_ids: Iterable[str]) -> dict[str, set[str]]:
+        """Recorded actions for each id, in one pass; unknown ids map to an empty set."""
+        found = {post_id: set() for post_id in post_ids}
+        candidates = [post_id for post_id in found if post_id in self._bloom]
+        if not candidates:
+            return found
+        rows = []
+        with self._lock:
+            # Chunked to stay under SQLite's limit on bound parameters.
+            for start in range(0, len(candidates), 500):
+                chunk = candidates[start : start + 500]
+                rows += self._db.execute(
+                    f"SELECT post_id, actions FROM seen_posts WHERE post_id IN ({', '.join('?' * len(chunk))})",
+                    chunk,
+                ).fetchall()
+        for post_id, flags in rows:
+            found[post_id] = {name for name, flag in ACTIONS.items() if flags & flag}
+        return found
+
+    def mark(self, post_id: str, action: str) -> None:
+        self.mark_many([post_id], action)
+
+    def mark_many(self, post_ids: Iterable[str], action: str) -> None:
+        flag = ACTIONS[action]
+        now = time.time()
+        with self._lock:
+            for post_id in post_ids:
+                inserted = self._db.execute(
+                    "INSERT OR IGNORE INTO seen_posts (post_id, actions, first_seen, updated_at)"
+                    " VALUES (?, ?, ?, ?)",
+                    (post_id, flag, now, now),
+                ).rowcount
+                if inserted:
+                    self._bloom.add(post_id)
+                else:
+                    self._db.execute(
+                        "UPDATE seen_posts SET actions = actions | ?, updated_at = ? WHERE post_id = ?",
+                        (flag, now, post_id),
+                    )
+            self._db.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._bloom.close()
+            self._db.close()
@@ -0,0 +1,251 @@
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import signal
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from multiprocessing.connection import Connection, wait
+from pathlib import Path
+from typing import Callable, TextIO
+
+from runtime import AgentRuntime, agent_config_paths, load_agent_files
+
+STATUS_INTERVAL_SECONDS = 30.0
+RESTART_BASE_SECONDS = 1.0
+RESTART_MAX_SECONDS = 300.0
+# A worker that stayed up this long is considered healthy again.
+STABLE_UPTIME_SECONDS = 60.0
+# How long workers get to shut their agents down before they are terminated.
+STOP_GRACE_SECONDS = 30.0
+
+
+def shard_paths(paths: list[Path], workers: int) -> list[list[Path]]:
+    """Split config paths round-robin into at most ``workers`` non-empty shards."""
+    count = max(1, min(workers, len(paths)))
+    return [paths[index::count] for index in range(count)]
+
+
+def restart_delay(failures: int) -> float:
+    return min(RESTART_MAX_SECONDS, RESTART_BASE_SECONDS * 2 ** max(0, failures - 1))
+
+
+def _worker_main(index: int, paths: list[str], conn: Connection) -> None:
+    # Ctrl-C reaches the whole process group; the supervisor decides when workers stop.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    runtime = AgentRuntime(
+        load_agent_files([Path(path) for path in paths]), read_stdin=False, metrics_port_offset=index
+    )
+    asyncio.run(_serve_worker(index, runtime, conn))
+
+
+async def _serve_worker(index: int, runtime: AgentRuntime, conn: Connection) -> None:
+    loop = asyncio.get_running_loop()
+
+    def _listen() -> None:
+        # Connection.recv blocks; a daemon thread hands messages to the loop.
+        while True:
+            try:
+                message = conn.recv()
+            except (EOFError, OSError):
+                message = "stop"
+            try:
+                loop.call_soon_threadsafe(_handle, message)
+            except RuntimeError:
+                return
+            if message == "stop":
+                return
+
+    def _handle(message: str) -> None:
+        if message == "stop":
+            runtime.stop()
+        elif message == "status":
+            _report()
+
+    def _report() -> None:
+        try:
+            conn.send(
+                {
+                    "worker": index,
+                    "agents": runtime.status(),
+                    "cpu_seconds": time.process_time(),
+                }
+            )
+        except (BrokenPipeError, OSError):
+            runtime.stop()
+
+    async def _report_loop() -> None:
+        while True:
+            await asyncio.sleep(STATUS_INTERVAL_SECONDS)
+            _report()
+
+    threading.Thread(target=_listen, name=f"tinymolty-worker-{index}", daemon=True).start()
+    reporter = asyncio.create_task(_report_loop())
+    try:
+        await runtime.run()
+    finally:
+        reporter.cancel()
+
+
+@dataclass(slots=True)
+class _Worker:
+    index: int
+    paths: list[Path]
+    process: multiprocessing.Process | None = None
+    conn: Connection | None = None
+    started_at: float = 0.0
+    failures: int = 0
+    restarts: int = 0
+    restart_at: float | None = None
+    finished: bool = False
+    last_status: dict = field(default_factory=dict)
+
+
+class Supervisor:
+    """Shards agent configs across worker processes, each running an AgentRuntime.
+
+    Workers that crash are restarted with exponential backoff; workers whose
+    agents all quit are left stopped. Status arrives over multiprocessing pipes
+    and is printed as one aggregated report.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        workers: int,
+        stream: TextIO | None = None,
+        worker_main: Callable[[int, list[str], Connection], None] = _worker_main,
+        status_interval: float = STATUS_INTERVAL_SECONDS,
+    ) -> None:
+        paths = agent_config_paths(directory)
+        # Validate every config up front so mistakes surface here, not as crash loops.
+        load_agent_files(paths)
+        self.stream = stream or sys.stdout
+        self.worker_main = worker_main
+        self.status_interval = status_interval
+        self._context = multiprocessing.get_context("spawn")
+        self.workers = [_Worker(index, shard) for index, shard in enumerate(shard_paths(paths, workers))]
+        self._stopping = False
+        self._stop_deadline = 0.0
+
+    def _say(self, message: str) -> None:
+        print(f"[supervisor] {message}", file=self.stream, flush=True)
+
+    def _spawn(self, worker: _Worker) -> None:
+        parent, child = self._context.Pipe()
+        process = self._context.Process(
+            target=self.worker_main,
+            args=(worker.index, [str(path) for path in worker.paths], child),
+            name=f"tinymolty-worker-{worker.index}",
+        )
+        process.start()
+        child.close()
+        worker.process, worker.conn = process, parent
+        worker.started_at = time.monotonic()
+        worker.restart_at = None
+        names = ", ".join(path.stem for path in worker.paths)
+        self._say(f"🚀 Worker {worker.index} (pid {process.pid}): {names}")
+
+    def stop(self) -> None:
+        if not self._stopping:
+            self._stop_deadline = time.monotonic() + STOP_GRACE_SECONDS
+        self._stopping = True
+        for worker in self.workers:
+            if worker.conn is not None:
+                try:
+                    worker.conn.send("stop")
+                except (BrokenPipeError, OSError):
+                    pass
+
+    def status_lines(self) -> list[str]:
+        alive = sum(1 for worker in self.workers if worker.process is not None and worker.process.is_alive())
+        lines = [f"📊 {alive}/{len(self.workers)} workers alive"]
+        now = time.monotonic()
+        for worker in self.workers:
+            if worker.process is None or not worker.process.is_alive():
+                state = "finished" if worker.finished else "restarting"
+                lines.append(f"   worker {worker.index}: {state} (restarts {worker.restarts})")
+                continue
+            status = worker.last_status
+            agents = status.get("agents", {})
+            active = sum(1 for agent in agents.values() if agent["running"] and not agent["paused"])
+            lines.append(
+                f"   worker {worker.index} (pid {worker.process.pid}): up {int(now - worker.started_at)}s, "
+                f"cpu {status.get('cpu_seconds', 0.0):.1f}s, restarts {worker.restarts}, "
+                f"{active}/{len(agents) or len(worker.paths)} agents active"
+            )
+        return lines
+
+    def _reap(self, worker: _Worker) -> None:
+        process = worker.process
+        process.join()
+        uptime = time.monotonic() - worker.started_at
+        if worker.conn is not None:
+            worker.conn.close()
+        worker.process, worker.conn = None, None
+        if process.exitcode == 0 or self._stopping:
+            worker.finished = True
+            self._say(f"⏹️  Worker {worker.index} finished")
+            return
+        worker.failures = 1 if uptime >= STABLE_UPTIME_SECONDS else worker.failures + 1
+        delay = restart_delay(worker.failures)
+        worker.restart_at = time.monotonic() + delay
+        self._say(f"💥 Worker {worker.index} exited with {process.exitcode}; restarting in {delay:.0f}s")
+
+    def run(self) -> None:
+        for worker in self.workers:
+            self._spawn(worker)
+        self.supervise()
+
+    def supervise(self) -> None:
+        """Watch workers until all have finished; returns after ``stop`` once they exit."""
+        next_report = time.monotonic() + self.status_interval
+        while True:
+            now = time.monotonic()
+            for worker in self.workers:
+                if worker.restart_at is not None and now >= worker.restart_at and not self._stopping:
+                    worker.restarts += 1
+                    self._spawn(worker)
+            running = [worker for worker in self.workers if worker.process is not None]
+            pending = [worker for worker in self.workers if worker.restart_at is not None]
+            if not running and (self._stopping or not pending):
+                return
+            if self._stopping and now >= self._stop_deadline:
+                for worker in running:
+                    worker.process.terminate()
+            if now >= next_report:
+                for worker in running:
+                    if worker.conn is None:
+                        continue
+                    try:
+                        worker.conn.send("status")
+                    except (BrokenPipeError, OSError):
+                        pass
+                for line in self.status_lines():
+                    self._say(line)
+                next_report = now + self.status_interval
+            handles = {worker.conn: worker for worker in running if worker.conn is not None}
+            handles.update({worker.process.sentinel: worker for worker in running})
+            for ready in wait(list(handles), timeout=1.0):
+                worker = handles[ready]
+                if ready is worker.conn:
+                    try:
+                        worker.last_status = worker.conn.recv()
+                    except (EOFError, OSError):
+                        # A closed pipe stays "ready" forever; drop it and wait on the process alone.
+                        worker.conn.close()
+                        worker.conn = None
+                elif worker.process is not None:
+                    self._reap(worker)
+
+
+def run_supervisor(supervisor: Supervisor) -> None:
+    if hasattr(signal, "SIGTERM"):
+        signal.signal(signal.SIGTERM, lambda *_: supervisor.stop())
+    try:
+        supervisor.run()
+    except KeyboardInterrupt:
+        supervisor.stop()
+        supervisor.supervise()
@@ -4,13 +4,15 @@ import httpx
 
 
 class TelegramNotifier:
-    def __init__(self, bot_token: str, chat_id: str) -> None:
+    def __init__(self, bot_token: str, chat_id: str, http_client: httpx.AsyncClient | None = None) -> None:
         self.bot_token = bot_token
         self.chat_id = chat_id
-        self._client = httpx.AsyncClient(timeout=20.0)
+        self._owns_client = http_client is None
+        self._client = http_client or httpx.AsyncClient(timeout=20.0)
 
     async def close(self) -> None:
-        await self._client.aclose()
+        if self._owns_client:
+            await self._client.aclose()
 
     async def send(self, text: str) -> None:
         url = f"https://api.telegram.org/bot{self.bot_token}/sendMessage"
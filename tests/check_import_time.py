@@ -0,0 +1,45 @@
+"""Show where startup time goes, using `python -X importtime`.
+
+Usage: python tests/check_import_time.py [module] [--top N]
+"""
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def import_times(module: str) -> list[tuple[int, int, str]]:
+    """Return (self_us, cumulative_us, name) for every module imported by ``module``."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line.split(":", 1)[1].split("|")
+        rows.append((int(self_us), int(cumulative_us), name.rstrip()))
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("module", nargs="?", default="tinymolty_main")
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+    rows = import_times(args.module)
+    total = max((cumulative for _, cumulative, name in rows if name.strip() == args.module), default=0)
+    print(f"import {args.module}: {total / 1000:.1f} ms, {len(rows)} modules")
+    print(f"{'cumulative':>12} {'self':>10}  module")
+    for self_us, cumulative_us, name in sorted(rows, key=lambda row: row[1], reverse=True)[: args.top]:
+        print(f"{cumulative_us / 1000:>10.1f}ms {self_us / 1000:>8.1f}ms  {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+import asyncio
+import gzip
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from bot_engine import BotEngine
+from clock import VirtualClock
+from config import AppConfig
+from llm.base import LLMProvider, LLMResponse
+from moltbook.models import AgentProfile, Post
+from observability.activity_log import ActivityLog, open_activity_log
+from scheduler import Scheduler
+from ui.base import UserInterface
+
+
+class QuietUI(UserInterface):
+    async def start(self) -> None:
+        return None
+
+    async def stop(self) -> None:
+        return None
+
+    async def send_status(self, message: str) -> None:
+        return None
+
+    async def prompt(self, message: str) -> str:
+        return ""
+
+    async def get_command(self) -> str | None:
+        return None
+
+    async def update_activity(self, message: str, next_action_seconds: float | None = None) -> None:
+        return None
+
+
+class UnusedLLM(LLMProvider):
+    async def generate(self, system_prompt: str, user_prompt: str) -> LLMResponse:
+        return LLMResponse(content="")
+
+
+class ActionClient:
+    async def comment(self, post_id: str, content: str) -> None:
+        await asyncio.sleep(0.01)
+
+    async def upvote(self, post_id: str) -> None:
+        raise RuntimeError("upvote down")
+
+    async def follow(self, agent_id: str) -> None:
+        return None
+
+
+def _read(path: Path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+class ActivityLogTests(unittest.TestCase):
+    def test_records_are_batched_in_the_background(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "activity.jsonl"
+            log = ActivityLog(path, batch_size=2, flush_seconds=60)
+
+            async def _run() -> None:
+                await log.start()
+                log.record("browse", agent="molty", latency=0.25, fetched=3, error=None)
+                # Nothing is written from inside record().
+                self.assertFalse(path.exists())
+                log.record("comment", agent="molty", outcome="error", post_id="p1")
+                for _ in range(50):
+                    if path.exists():
+                        break
+                    await asyncio.sleep(0.01)
+                log.record("stop", agent="molty")
+                await log.close()
+
+            asyncio.run(_run())
+            events = _read(path)
+        self.assertEqual([event["event"] for event in events], ["browse", "comment", "stop"])
+        self.assertEqual(events[0]["latency_ms"], 250.0)
+        self.assertEqual(events[0]["fetched"], 3)
+        self.assertNotIn("error", events[0])
+        self.assertEqual(events[1]["outcome"], "error")
+        self.assertTrue(events[0]["ts"].endswith("Z"))
+
+    def test_rotates_by_size_and_age_and_keeps_newest_segments(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "activity.jsonl"
+            clock = VirtualClock()
+            log = ActivityLog(path, max_bytes=200, rotate_seconds=3600, compress="gzip", keep=2, clock=clock)
+
+            async def _run() -> None:
+                for index in range(12):
+                    log.record("heartbeat", agent="molty", index=index)
+                    await log.flush()
+                    clock.advance(60)
+                # An hour later the live file rotates even though it is small.
+                clock.advance(3600)
+                log.record("browse", agent="molty")
+                await log.flush()
+
+            asyncio.run(_run())
+            segments = log.segments()
+            self.assertEqual(len(segments), 2)
+            self.assertTrue(all(segment.name.endswith(".jsonl.gz") for segment in segments))
+            newest = [json.loads(line) for line in gzip.decompress(segments[-1].read_bytes()).splitlines()]
+            self.assertEqual(newest[-1]["index"], 11)
+            self.assertEqual([event["event"] for event in _read(path)], ["browse"])
+
+    def test_engine_logs_interactions_with_latency(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            config = AppConfig()
+            config.bot.name = "molty"
+            config.behavior.enabled_actions = ["comment", "upvote", "follow"]
+            config.observability.activity_log_enabled = True
+            log = open_activity_log(config.observability, tmp)
+            scheduler = Scheduler(config.behavior, config.advanced)
+            engine = BotEngine(config, ActionClient(), UnusedLLM(), scheduler, QuietUI(), activity=log)
+            post = Post(id="p1", content="hello", author=AgentProfile(id="a1", username="alice"))
+            details = {"comments": [], "upvotes": [], "follows": [], "failures": []}
+
+            async def _run() -> None:
+                self.assertTrue(scheduler.reserve("comment"))
+                await engine._interact_with(post, "Nice!", details)
+                await log.close()
+
+            asyncio.run(_run())
+            events = {event["event"]: event for event in _read(Path(tmp) / "activity.jsonl")}
+        self.assertEqual(set(events), {"comment", "upvote", "follow"})
+        self.assertEqual(events["upvote"]["outcome"], "error")
+        self.assertEqual(events["upvote"]["error"], "RuntimeError: upvote down")
+        self.assertEqual(events["comment"]["post_id"], "p1")
+        self.assertEqual(events["follow"]["author_id"], "a1")
+        self.assertTrue(all(event["agent"] == "molty" for event in events.values()))
+        self.assertGreater(events["comment"]["latency_ms"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
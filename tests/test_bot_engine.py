@@ -1,11 +1,18 @@
 import asyncio
+import json
+import tempfile
 import unittest
 
+import httpx
+
+import bot_engine
 from bot_engine import BotEngine
 from config import AppConfig
 from llm.base import LLMProvider, LLMResponse
-from moltbook.models import Post
-from scheduler import Scheduler
+from moltbook.client import MoltbookClient
+from moltbook.models import AgentProfile, FeedResponse, Post
+from scheduler import DECISIONS, Scheduler
+from storage import FollowCache, SeenIndex
 from ui.base import UserInterface
 
 
@@ -55,3 +62,405 @@ class BotEngineTests(unittest.TestCase):
 
         ranked_ids = asyncio.run(_run())
         self.assertEqual(ranked_ids, ["b", "a"])
+
+
+class RecordingLLM(LLMProvider):
+    def __init__(self, events: list[str]) -> None:
+        self.events = events
+
+    async def generate(self, system_prompt: str, user_prompt: str) -> LLMResponse:
+        if "Score each post" in user_prompt:
+            ids = [line.split(":", 1)[0] for line in user_prompt.splitlines() if line.startswith("p")]
+            return LLMResponse(content=json.dumps([{"id": pid, "score": 0.5} for pid in ids]))
+        self.events.append("draft-start")
+        await asyncio.sleep(0.01)
+        self.events.append("draft-end")
+        return LLMResponse(content="Nice post!")
+
+
+class FeedClient:
+    def __init__(self, events: list[str]) -> None:
+        self.events = events
+        self.comments: list[tuple[str, str]] = []
+
+    async def get_feed(self, sort=None, limit=None):
+        self.events.append(f"fetch:{sort}")
+        await asyncio.sleep(0)
+        return FeedResponse(posts=[Post(id=f"p-{sort}", content=f"{sort} post")])
+
+    async def comment(self, post_id: str, content: str) -> None:
+        self.comments.append((post_id, content))
+
+
+class BrowsePipelineTests(unittest.TestCase):
+    def test_browse_overlaps_fetch_and_comment_drafting(self):
+        events: list[str] = []
+        config = AppConfig()
+        config.behavior.enabled_actions = ["browse", "comment"]
+        config.behavior.feed_sort = "both"
+        config.behavior.feed_limit = 2
+        client = FeedClient(events)
+        engine = BotEngine(
+            config=config,
+            client=client,
+            llm=RecordingLLM(events),
+            scheduler=Scheduler(config.behavior, config.advanced),
+            ui=DummyUI(),
+        )
+
+        asyncio.run(engine._maybe_browse())
+
+        self.assertEqual(client.comments, [("p-new", "Nice post!")])
+        self.assertLess(events.index("fetch:hot"), events.index("draft-end"))
+
+
+class SlowActionClient:
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+
+    async def comment(self, post_id: str, content: str) -> None:
+        await asyncio.sleep(0.05)
+        self.calls.append("comment")
+
+    async def upvote(self, post_id: str) -> None:
+        await asyncio.sleep(0.05)
+        raise RuntimeError("upvote down")
+
+    async def follow(self, agent_id: str) -> None:
+        await asyncio.sleep(0.05)
+        self.calls.append("follow")
+
+
+class InteractionTests(unittest.TestCase):
+    def test_actions_run_concurrently_and_collect_failures(self):
+        config = AppConfig()
+        config.behavior.enabled_actions = ["comment", "upvote", "follow"]
+        scheduler = Scheduler(config.behavior, config.advanced)
+        client = SlowActionClient()
+        engine = BotEngine(
+            config=config,
+            client=client,
+            llm=FakeLLM(),
+            scheduler=scheduler,
+            ui=DummyUI(),
+        )
+        post = Post(id="p1", content="hello", author=AgentProfile(id="a1", username="alice"))
+        details = {"comments": [], "upvotes": [], "follows": [], "failures": []}
+
+        async def _run():
+            self.assertTrue(scheduler.reserve("comment"))
+            loop = asyncio.get_running_loop()
+            started = loop.time()
+            result = await engine._interact_with(post, "Nice!", details)
+            return result, loop.time() - started
+
+        interacted, elapsed = asyncio.run(_run())
+
+        self.assertTrue(interacted)
+        self.assertLess(elapsed, 0.12)
+        self.assertEqual(sorted(client.calls), ["comment", "follow"])
+        self.assertEqual(len(details["comments"]), 1)
+        self.assertEqual(len(details["follows"]), 1)
+        self.assertEqual(details["upvotes"], [])
+        self.assertTrue(details["failures"][0].startswith("❌ Upvote failed"))
+        # Failed actions give their reservation back.
+        self.assertTrue(scheduler.can_do("upvote"))
+        self.assertFalse(scheduler.can_do("comment"))
+
+
+class CountingLLM(FakeLLM):
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def generate(self, system_prompt: str, user_prompt: str) -> LLMResponse:
+        self.calls += 1
+        return await super().generate(system_prompt, user_prompt)
+
+
+class StaticFeedClient:
+    async def get_feed(self, sort=None, limit=None):
+        return FeedResponse(posts=[Post(id="a", content="A"), Post(id="b", content="B")])
+
+
+class SeenIndexEngineTests(unittest.TestCase):
+    def test_seen_posts_are_not_rescored_after_restart(self):
+        config = AppConfig()
+        config.behavior.enabled_actions = ["browse"]
+        checks = bot_engine.SEEN_CHECKS.labels(agent=config.bot.name).value
+        hits = bot_engine.SEEN_HITS.labels(agent=config.bot.name).value
+        with tempfile.TemporaryDirectory() as tmp:
+            for expected_calls in (1, 0):
+                index = SeenIndex(tmp, capacity=1000)
+                llm = CountingLLM()
+                engine = BotEngine(
+                    config=config,
+                    client=StaticFeedClient(),
+                    llm=llm,
+                    scheduler=Scheduler(config.behavior, config.advanced),
+                    ui=DummyUI(),
+                    seen_index=index,
+                )
+                asyncio.run(engine._maybe_browse())
+                index.close()
+                self.assertEqual(llm.calls, expected_calls)
+        # Two posts looked up on each run; both were known the second time.
+        self.assertEqual(bot_engine.SEEN_CHECKS.labels(agent=config.bot.name).value - checks, 4)
+        self.assertEqual(bot_engine.SEEN_HITS.labels(agent=config.bot.name).value - hits, 2)
+
+    def test_posts_are_rescored_after_a_failed_scoring_call(self):
+        config = AppConfig()
+        config.behavior.enabled_actions = ["browse"]
+        llm = FlakyLLM()
+        with tempfile.TemporaryDirectory() as tmp:
+            for _ in range(2):
+                index = SeenIndex(tmp, capacity=1000)
+                engine = BotEngine(
+                    config=config,
+                    client=StaticFeedClient(),
+                    llm=llm,
+                    scheduler=Scheduler(config.behavior, config.advanced),
+                    ui=DummyUI(),
+                    seen_index=index,
+                )
+                asyncio.run(engine._maybe_browse())
+                index.close()
+        # The failed call left a and b unseen, so the next browse scored them.
+        self.assertEqual(llm.calls, 2)
+
+
+class FlakyLLM(CountingLLM):
+    """Fails its first call, like a short provider outage."""
+
+    async def generate(self, system_prompt: str, user_prompt: str) -> LLMResponse:
+        if self.calls == 0:
+            self.calls += 1
+            raise RuntimeError("provider down")
+        return await super().generate(system_prompt, user_prompt)
+
+
+class FollowClient:
+    def __init__(self) -> None:
+        self.followed: list[str] = []
+
+    async def get_following(self) -> list[str]:
+        return ["alice"]
+
+    async def follow(self, agent_id: str) -> None:
+        self.followed.append(agent_id)
+
+
+class FollowCacheEngineTests(unittest.TestCase):
+    def test_follows_best_unfollowed_author(self):
+        config = AppConfig()
+        config.behavior.enabled_actions = ["follow"]
+        client = FollowClient()
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = FollowCache(f"{tmp}/follows.json")
+            engine = BotEngine(
+                config=config,
+                client=client,
+                llm=FakeLLM(),
+                scheduler=Scheduler(config.behavior, config.advanced),
+                ui=DummyUI(),
+                follow_cache=cache,
+            )
+            alice = AgentProfile(id="alice", username="alice")
+            bob = AgentProfile(id="bob", username="bob")
+            carol = AgentProfile(id="carol", username="carol")
+            cache.add_interest("bob", 0.2)
+            cache.add_interest("carol", 0.9)
+            details = {"comments": [], "upvotes": [], "follows": [], "failures": []}
+
+            allowed = DECISIONS.labels(agent=engine.scheduler.agent, action="follow", decision="allowed").value
+
+            async def _run():
+                await engine._refresh_follow_cache()
+                post = Post(id="p1", content="x", author=alice)
+                return await engine._interact_with(post, None, details, {"bob": bob, "carol": carol})
+
+            self.assertTrue(asyncio.run(_run()))
+            # One attempt, one decision.
+            self.assertEqual(DECISIONS.labels(agent=engine.scheduler.agent, action="follow", decision="allowed").value - allowed, 1)
+            # alice is already followed according to the API seed.
+            self.assertEqual(client.followed, ["carol"])
+            self.assertTrue(cache.is_following("carol"))
+
+    def test_unrecognized_following_payload_keeps_recorded_follows(self):
+        config = AppConfig()
+        for payload in ({"status": "ok"}, {"following": [{"name": "alice"}]}, {"following": []}):
+            http = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(200, json=payload)))
+            client = MoltbookClient("/nonexistent/credentials.json", http_client=http)
+            with tempfile.TemporaryDirectory() as tmp:
+                cache = FollowCache(f"{tmp}/follows.json")
+                cache.add_following("dave")
+                engine = BotEngine(
+                    config=config,
+                    client=client,
+                    llm=FakeLLM(),
+                    scheduler=Scheduler(config.behavior, config.advanced),
+                    ui=DummyUI(),
+                    follow_cache=cache,
+                )
+
+                async def _run():
+                    await engine._refresh_follow_cache()
+                    await http.aclose()
+
+                asyncio.run(_run())
+                self.assertTrue(cache.is_following("dave"), payload)
+                self.assertFalse(cache.is_following("alice"), payload)
+                self.assertFalse(cache.needs_revalidation(), payload)
+
+
+class GrowingFeedClient:
+    def __init__(self) -> None:
+        self.pages = [
+            [("p2", "2026-01-01T10:02:00Z"), ("p1", "2026-01-01T10:01:00Z")],
+            [("p2", "2026-01-01T10:02:00Z"), ("p1", "2026-01-01T10:01:00Z")],
+            [("p3", "2026-01-01T10:03:00Z"), ("p2", "2026-01-01T10:02:00Z")],
+        ]
+
+    async def get_feed(self, sort=None, limit=None):
+        page = self.pages.pop(0)
+        return FeedResponse(
+            posts=[Post(id=pid, content=pid, created_at=created_at) for pid, created_at in page]
+        )
+
+
+class WatermarkTests(unittest.TestCase):
+    def test_only_posts_newer_than_watermark_are_scored(self):
+        config = AppConfig()
+        config.behavior.enabled_actions = ["browse"]
+        config.behavior.browse_interval_minutes = 0
+        llm = CountingLLM()
+        scored: list[list[str]] = []
+        engine = BotEngine(
+            config=config,
+            client=GrowingFeedClient(),
+            llm=llm,
+            scheduler=Scheduler(config.behavior, config.advanced),
+            ui=DummyUI(),
+        )
+        original = engine._rank_posts
+
+        async def recording_rank(posts):
+            scored.append([post.id for post in posts])
+            return await original(posts)
+
+        engine._rank_posts = recording_rank  # type: ignore[method-assign]
+
+        async def _run():
+            for _ in range(3):
+                await engine._maybe_browse()
+
+        asyncio.run(_run())
+        # The unchanged second page never reaches the LLM.
+        self.assertEqual(scored, [["p2", "p1"], ["p3"]])
+        self.assertEqual(llm.calls, 2)
+
+    def test_post_sharing_the_watermark_timestamp_is_not_lost(self):
+        config = AppConfig()
+        config.behavior.enabled_actions = ["browse"]
+        config.behavior.browse_interval_minutes = 0
+        client = GrowingFeedClient()
+        client.pages = [
+            [("p2", "2026-01-01T10:02:00Z"), ("p1", "2026-01-01T10:01:00Z")],
+            # p2b was created in the same second as the mark and listed after it.
+            [("p2", "2026-01-01T10:02:00Z"), ("p2b", "2026-01-01T10:02:00Z"), ("p1", "2026-01-01T10:01:00Z")],
+            [("p3", "2026-01-01T10:03:00Z"), ("p2b", "2026-01-01T10:02:00Z"), ("p2", "2026-01-01T10:02:00Z")],
+        ]
+        engine = BotEngine(
+            config=config,
+            client=client,
+            llm=CountingLLM(),
+            scheduler=Scheduler(config.behavior, config.advanced),
+            ui=DummyUI(),
+        )
+        scored: list[list[str]] = []
+        original = engine._rank_posts
+
+        async def recording_rank(posts):
+            scored.append([post.id for post in posts])
+            return await original(posts)
+
+        engine._rank_posts = recording_rank  # type: ignore[method-assign]
+
+        async def _run():
+            for _ in range(3):
+                await engine._maybe_browse()
+
+        asyncio.run(_run())
+        self.assertEqual(scored, [["p2", "p1"], ["p2b"], ["p3"]])
+
+
+class FingerprintTests(unittest.TestCase):
+    def test_unchanged_feed_reuses_last_ranking(self):
+        config = AppConfig()
+        config.behavior.enabled_actions = ["browse"]
+        config.behavior.browse_interval_minutes = 0
+        config.behavior.feed_sort = "hot"
+        llm = CountingLLM()
+        engine = BotEngine(
+            config=config,
+            client=StaticFeedClient(),
+            llm=llm,
+            scheduler=Scheduler(config.behavior, config.advanced),
+            ui=DummyUI(),
+        )
+        acted: list[str] = []
+        pages = bot_engine.FEED_PAGES.labels(agent=config.bot.name, sort="hot").value
+        unchanged = bot_engine.FEED_PAGES_UNCHANGED.labels(agent=config.bot.name, sort="hot").value
+
+        async def record_candidate(browse, candidate):
+            acted.append(candidate[0].id)
+
+        engine._act_stage = record_candidate  # type: ignore[method-assign]
+
+        async def _run():
+            await engine._maybe_browse()
+            await engine._maybe_browse()
+
+        asyncio.run(_run())
+        self.assertEqual(llm.calls, 1)
+        self.assertEqual(acted, ["b", "a", "b", "a"])
+        self.assertEqual(engine.feed_skip_rate, 0.5)
+        self.assertEqual(bot_engine.FEED_PAGES.labels(agent=config.bot.name, sort="hot").value - pages, 2)
+        self.assertEqual(bot_engine.FEED_PAGES_UNCHANGED.labels(agent=config.bot.name, sort="hot").value - unchanged, 1)
+
+    def test_unchanged_page_is_rescored_after_a_failed_scoring_call(self):
+        config = AppConfig()
+        config.behavior.enabled_actions = ["browse"]
+        config.behavior.browse_interval_minutes = 0
+        config.behavior.feed_sort = "hot"
+        llm = FlakyLLM()
+        engine = BotEngine(
+            config=config,
+            client=StaticFeedClient(),
+            llm=llm,
+            scheduler=Scheduler(config.behavior, config.advanced),
+            ui=DummyUI(),
+        )
+
+        async def record_candidate(browse, candidate):
+            return None
+
+        engine._act_stage = record_candidate  # type: ignore[method-assign]
+
+        async def _run():
+            for _ in range(3):
+                await engine._maybe_browse()
+
+        asyncio.run(_run())
+        # Failed, then rescored once the LLM was back, then reused.
+        self.assertEqual(llm.calls, 2)
+        self.assertEqual(engine._fingerprint_hits, 1)
+        self.assertEqual([post.id for post in engine._rankings["hot"][1]], ["b", "a"])
+
+    def test_fingerprint_tracks_ids_and_content(self):
+        base = FeedResponse(posts=[Post(id="a", content="A"), Post(id="b", content="B")])
+        same = FeedResponse(posts=[Post(id="a", content="A"), Post(id="b", content="B")])
+        edited = FeedResponse(posts=[Post(id="a", content="A!"), Post(id="b", content="B")])
+        reordered = FeedResponse(posts=[Post(id="b", content="B"), Post(id="a", content="A")])
+        self.assertEqual(base.fingerprint(), same.fingerprint())
+        self.assertNotEqual(base.fingerprint(), edited.fingerprint())
+        self.assertNotEqual(base.fingerprint(), reordered.fingerprint())
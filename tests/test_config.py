@@ -3,8 +3,11 @@ import tempfile
 import unittest
 from pathlib import Path
 
+from pydantic import ValidationError
+
 from config import (
     AppConfig,
+    MoltbookConfig,
     TelegramConfig,
     resolve_secrets,
     save_config,
@@ -30,6 +33,13 @@ class ConfigTests(unittest.TestCase):
             self.assertEqual(loaded.bot.name, config.bot.name)
             self.assertEqual(loaded.llm.provider, config.llm.provider)
 
+    def test_rate_limit_burst_must_be_positive(self):
+        self.assertIsNone(MoltbookConfig().rate_limit_burst)
+        self.assertEqual(MoltbookConfig(rate_limit_burst=5).rate_limit_burst, 5)
+        for burst in (0, -1):
+            with self.assertRaises(ValidationError):
+                MoltbookConfig(rate_limit_burst=burst)
+
     def test_resolve_secrets_env(self):
         os.environ["TINYMOLTY_LLM_API_KEY"] = "test-key"
         config = AppConfig()
@@ -102,3 +102,75 @@ class BotEngineResilienceTests(unittest.TestCase):
         asyncio.run(_run())
         self.assertFalse(engine._running)
 
+
+    def test_paused_loop_resumes_immediately_on_command(self) -> None:
+        config = AppConfig()
+        config.behavior.enabled_actions = []
+        ui = CapturingUI()
+        engine = BotEngine(
+            config=config,
+            client=DummyClient(),
+            llm=FakeLLM(),
+            scheduler=Scheduler(config.behavior, config.advanced),
+            ui=ui,
+        )
+        engine._paused = True
+        ticks = 0
+
+        async def count_tick():
+            nonlocal ticks
+            ticks += 1
+            await engine.handle_command("/quit")
+
+        engine._tick = count_tick  # type: ignore[method-assign]
+
+        async def _run():
+            task = asyncio.create_task(engine.run_loop())
+            await asyncio.sleep(0.05)
+            self.assertEqual(ticks, 0)
+            loop = asyncio.get_running_loop()
+            started = loop.time()
+            await engine.handle_command("/resume")
+            await asyncio.wait_for(task, timeout=1)
+            return loop.time() - started
+
+        elapsed = asyncio.run(_run())
+        self.assertEqual(ticks, 1)
+        self.assertLess(elapsed, 0.1)
+
+    def test_prepare_overlaps_account_check_and_llm_warmup(self) -> None:
+        class SlowClient(DummyClient):
+            async def get_me(self):
+                await asyncio.sleep(0.2)
+                return await super().get_me()
+
+        class SlowWarmupLLM(FakeLLM):
+            warmed = False
+
+            async def warmup(self) -> None:
+                await asyncio.sleep(0.2)
+                self.warmed = True
+
+        config = AppConfig()
+        llm = SlowWarmupLLM()
+        ui = CapturingUI()
+        engine = BotEngine(
+            config=config,
+            client=SlowClient(),
+            llm=llm,
+            scheduler=Scheduler(config.behavior, config.advanced),
+            ui=ui,
+        )
+
+        async def _run():
+            loop = asyncio.get_running_loop()
+            started = loop.time()
+            await engine.prepare()
+            # A second call (from run_loop) must not redo the work.
+            await engine.prepare()
+            return loop.time() - started
+
+        elapsed = asyncio.run(_run())
+        self.assertTrue(llm.warmed)
+        self.assertIn("🦀 Logged in as: Test Agent", ui.status)
+        self.assertLess(elapsed, 0.35)
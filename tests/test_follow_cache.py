@@ -0,0 +1,48 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from clock import VirtualClock
+from storage import FollowCache
+
+
+class FollowCacheTests(unittest.TestCase):
+    def test_picks_most_interesting_unfollowed_author(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = FollowCache(Path(tmp) / "follows.json", ttl_seconds=60)
+            cache.seed(["a"], now=1000.0)
+            cache.add_interest("a", 5.0)
+            cache.add_interest("b", 0.4)
+            cache.add_interest("c", 0.3)
+            cache.add_interest("c", 0.3)
+
+            self.assertEqual(cache.pick_unfollowed(["a", "b", "c"]), "c")
+            self.assertIsNone(cache.pick_unfollowed(["a"]))
+            self.assertFalse(cache.needs_revalidation(now=1059.0))
+            self.assertTrue(cache.needs_revalidation(now=1060.0))
+
+    def test_state_persists(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "follows.json"
+            cache = FollowCache(path)
+            cache.add_following("a")
+            cache.add_interest("b", 0.7)
+            cache.save()
+
+            reopened = FollowCache(path)
+            self.assertTrue(reopened.is_following("a"))
+            self.assertAlmostEqual(reopened.interest("b"), 0.7)
+
+    def test_seed_merges_and_ttl_follows_the_clock(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            clock = VirtualClock()
+            cache = FollowCache(Path(tmp) / "follows.json", ttl_seconds=3600, clock=clock)
+            cache.add_following("a")
+            cache.seed(["b"])
+            # A follow we recorded survives an API list that leaves it out.
+            self.assertTrue(cache.is_following("a"))
+            self.assertTrue(cache.is_following("b"))
+            clock.advance(3599)
+            self.assertFalse(cache.needs_revalidation())
+            clock.advance(1)
+            self.assertTrue(cache.needs_revalidation())
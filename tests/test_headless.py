@@ -0,0 +1,39 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from bot_engine import BotEngine
+from config import AppConfig
+from headless import _reload
+from scheduler import Scheduler
+from ui.logging_ui import LoggingUI
+
+
+class HeadlessReloadTests(unittest.TestCase):
+    def _engine(self) -> BotEngine:
+        config = AppConfig()
+        scheduler = Scheduler(config.behavior, config.advanced)
+        return BotEngine(config, client=None, llm=None, scheduler=scheduler, ui=LoggingUI())
+
+    def test_sighup_reload_applies_new_behavior(self):
+        engine = self._engine()
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "config.toml"
+            path.write_text("[behavior]\nbrowse_interval_minutes = 3\n")
+            _reload(engine, path)
+        self.assertEqual(engine.config.behavior.browse_interval_minutes, 3)
+        self.assertIs(engine.scheduler.behavior, engine.config.behavior)
+
+    def test_invalid_config_keeps_current_one(self):
+        engine = self._engine()
+        before = engine.config
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "config.toml"
+            path.write_text("[behavior]\nfeed_limit = 0\n")
+            with self.assertLogs("tinymolty", level="WARNING"):
+                _reload(engine, path)
+        self.assertIs(engine.config, before)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+import asyncio
+import unittest
+from unittest import mock
+
+from config import HttpConfig
+from http_pool import MOLTBOOK_HOST, TELEGRAM_HOST, HttpPool
+from moltbook.client import MoltbookClient
+from telegram.notifier import TelegramNotifier
+
+
+class HttpPoolTests(unittest.TestCase):
+    def test_one_client_per_host(self):
+        async def _run():
+            pool = HttpPool()
+            try:
+                moltbook = pool.client(MOLTBOOK_HOST)
+                self.assertIs(pool.for_url("https://www.moltbook.com/api/v1/feed"), moltbook)
+                self.assertIsNot(pool.client(TELEGRAM_HOST), moltbook)
+                self.assertEqual(pool.hosts, [TELEGRAM_HOST, MOLTBOOK_HOST])
+            finally:
+                await pool.aclose()
+            self.assertTrue(moltbook.is_closed)
+            self.assertEqual(pool.hosts, [])
+
+        asyncio.run(_run())
+
+    def test_limits_and_timeouts(self):
+        pool = HttpPool(
+            HttpConfig(
+                max_connections_per_host=8,
+                max_keepalive_per_host=4,
+                host_max_connections={MOLTBOOK_HOST: 2},
+                keepalive_expiry_seconds=15.0,
+                connect_timeout_seconds=3.0,
+                llm_timeout_seconds=90.0,
+            )
+        )
+        limits = pool.limits(MOLTBOOK_HOST)
+        self.assertEqual(limits.max_connections, 2)
+        self.assertEqual(limits.max_keepalive_connections, 2)
+        self.assertEqual(limits.keepalive_expiry, 15.0)
+        self.assertEqual(pool.limits(TELEGRAM_HOST).max_connections, 8)
+        timeout = pool.timeout("llm")
+        self.assertEqual(timeout.read, 90.0)
+        self.assertEqual(timeout.connect, 3.0)
+
+    def test_http2_falls_back_without_h2(self):
+        with mock.patch("http_pool.http2_available", return_value=False):
+            self.assertFalse(HttpPool(HttpConfig(http2=True)).http2)
+
+    def test_borrowed_clients_stay_open(self):
+        async def _run():
+            pool = HttpPool()
+            client = MoltbookClient("/nonexistent/credentials.json", http_client=pool.client(MOLTBOOK_HOST))
+            notifier = TelegramNotifier("token", "chat", http_client=pool.client(TELEGRAM_HOST))
+            await client.close()
+            await notifier.close()
+            self.assertEqual(pool.hosts, [TELEGRAM_HOST, MOLTBOOK_HOST])
+            await pool.aclose()
+
+        asyncio.run(_run())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+import asyncio
+import sqlite3
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from storage import InteractionJournal
+
+
+class InteractionJournalTests(unittest.TestCase):
+    def test_batched_writes_and_queries(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "interactions.db"
+
+            async def _run():
+                journal = InteractionJournal(path, batch_size=2, flush_seconds=60)
+                await journal.start()
+                started = time.time()
+                journal.record("seen", post_id="p1", author_id="a1")
+                journal.record("follow", post_id="p1", author_id="a1")
+                journal.record("comment", post_id="p2", author_id="a2", detail="Nice")
+                # Pending rows are visible before they reach disk.
+                self.assertTrue(journal.has_post("p2", "comment"))
+                await journal.close()
+                return started
+
+            started = asyncio.run(_run())
+
+            reopened = InteractionJournal(path)
+            self.assertTrue(reopened.has_author("a1", "follow"))
+            self.assertFalse(reopened.has_author("a2", "follow"))
+            self.assertTrue(reopened.has_post("p2", "comment"))
+            counts = reopened.counts_since(started - 1)
+            self.assertEqual((counts["seen"], counts["follow"], counts["comment"]), (1, 1, 1))
+            self.assertEqual(reopened.recent("comment")[0].detail, "Nice")
+            asyncio.run(reopened.close())
+
+    def test_failed_write_is_retried_without_losing_rows(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "interactions.db"
+
+            async def _run():
+                journal = InteractionJournal(path, batch_size=2, flush_seconds=0.01)
+                write = journal._write
+                calls = []
+
+                def locked_once(batch):
+                    calls.append(len(batch))
+                    if len(calls) == 1:
+                        raise sqlite3.OperationalError("database is locked")
+                    write(batch)
+
+                journal._write = locked_once
+                await journal.start()
+                journal.record("seen", post_id="p1")
+                journal.record("comment", post_id="p1", detail="Nice")
+                for _ in range(100):
+                    if len(calls) >= 2:
+                        break
+                    await asyncio.sleep(0.01)
+                # The flush loop survived the failure and wrote the same rows again.
+                self.assertFalse(journal._flush_task.done())
+                self.assertEqual(calls[:2], [2, 2])
+                journal.record("upvote", post_id="p1")
+                await journal.close()
+
+            asyncio.run(_run())
+
+            reopened = InteractionJournal(path)
+            counts = reopened.counts_since(0)
+            self.assertEqual((counts["seen"], counts["comment"], counts["upvote"]), (1, 1, 1))
+            asyncio.run(reopened.close())
+
+    def test_rejects_unknown_kind(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            journal = InteractionJournal(Path(tmp) / "interactions.db")
+            with self.assertRaises(ValueError):
+                journal.record("retweet")
+            asyncio.run(journal.close())
@@ -0,0 +1,101 @@
+import asyncio
+import tempfile
+import unittest
+
+import httpx
+
+from config import ObservabilityConfig
+from moltbook.client import REQUESTS, MoltbookClient, endpoint_label
+from observability import observability_session
+from observability.metrics import Registry, start_metrics_server
+
+
+class RegistryTests(unittest.TestCase):
+    def test_prometheus_text(self):
+        registry = Registry()
+        calls = registry.counter("demo_calls", "Calls", ["site"])
+        calls.labels(site="score").inc()
+        calls.labels(site="score").inc(2)
+        registry.gauge("demo_queue", "Queue depth").set(4)
+        latency = registry.histogram("demo_seconds", "Latency", buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 3.0):
+            latency.observe(value)
+        text = registry.render()
+        self.assertIn("# TYPE demo_calls_total counter", text)
+        self.assertIn('demo_calls_total{site="score"} 3', text)
+        self.assertIn("demo_queue 4", text)
+        self.assertIn('demo_seconds_bucket{le="0.1"} 1', text)
+        self.assertIn('demo_seconds_bucket{le="1"} 2', text)
+        self.assertIn('demo_seconds_bucket{le="+Inf"} 3', text)
+        self.assertIn("demo_seconds_count 3", text)
+        # Same name and labels: the existing metric; different labels: an error.
+        self.assertIs(registry.counter("demo_calls", "Calls", ["site"]), calls)
+        with self.assertRaises(ValueError):
+            registry.counter("demo_calls", "Calls", ["other"])
+        with self.assertRaises(ValueError):
+            calls.labels(wrong="x")
+
+    def test_endpoint_label_folds_ids(self):
+        self.assertEqual(endpoint_label("POST", "/posts/abc123/comments"), "POST /posts/{id}/comments")
+        self.assertEqual(endpoint_label("GET", "/feed?sort=new&limit=5"), "GET /feed")
+        self.assertEqual(endpoint_label("GET", "/agents/me/following"), "GET /agents/me/following")
+
+
+class InstrumentationTests(unittest.TestCase):
+    def test_client_requests_are_counted_and_served(self):
+        def _handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={"posts": []})
+
+        async def _run() -> str:
+            http = httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+            client = MoltbookClient("/nonexistent/credentials.json", http_client=http, agent="molty")
+            before = REQUESTS.labels(endpoint="GET /feed", status="200").value
+            await client.get_feed(sort="new", limit=3)
+            self.assertEqual(REQUESTS.labels(endpoint="GET /feed", status="200").value, before + 1)
+            await http.aclose()
+            server = await start_metrics_server(ObservabilityConfig(metrics_enabled=True, metrics_port=0))
+            try:
+                reader, writer = await asyncio.open_connection(server.host, server.port)
+                writer.write(b"GET /metrics HTTP/1.1\r\nHost: localhost\r\n\r\n")
+                await writer.drain()
+                response = (await reader.read()).decode()
+                writer.close()
+            finally:
+                await server.stop()
+            return response
+
+        response = asyncio.run(_run())
+        self.assertTrue(response.startswith("HTTP/1.1 200 OK"))
+        self.assertIn('tinymolty_moltbook_requests_total{endpoint="GET /feed",status="200"}', response)
+        self.assertIn('tinymolty_rate_limit_wait_seconds_count{agent="molty"}', response)
+
+    def test_disabled_by_default(self):
+        self.assertIsNone(asyncio.run(start_metrics_server(ObservabilityConfig())))
+
+    def test_session_stops_what_it_started_when_setup_fails(self):
+        config = ObservabilityConfig(
+            metrics_enabled=True, metrics_port=0, activity_log_enabled=True, loop_block_seconds=1.0
+        )
+
+        def _notify(text: str) -> None:
+            raise RuntimeError(text)
+
+        async def _run(data_dir: str) -> tuple[str, set]:
+            with self.assertRaises(RuntimeError) as caught:
+                async with observability_session(config, data_dir, notify=_notify):
+                    self.fail("setup should not have finished")
+            url = str(caught.exception).rsplit(" ", 1)[-1]
+            port = int(url.rsplit(":", 1)[1].split("/", 1)[0])
+            with self.assertRaises(OSError):
+                await asyncio.open_connection("127.0.0.1", port)
+            return url, asyncio.all_tasks() - {asyncio.current_task()}
+
+        with tempfile.TemporaryDirectory() as tmp:
+            url, leftover = asyncio.run(_run(tmp))
+        self.assertTrue(url.startswith("http://"))
+        # The activity log's flush task is gone, so the log was closed.
+        self.assertEqual(leftover, set())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+import asyncio
+import unittest
+
+from pipeline import Pipeline, Stage
+
+
+class PipelineTests(unittest.TestCase):
+    def test_stages_overlap_and_preserve_order(self) -> None:
+        events: list[str] = []
+
+        async def fetch(item, emit):
+            events.append(f"fetch:{item}")
+            await emit(item)
+
+        async def draft(item, emit):
+            events.append(f"draft-start:{item}")
+            await asyncio.sleep(0.01)
+            events.append(f"draft-end:{item}")
+            await emit(item)
+
+        results: list[int] = []
+
+        async def act(item, emit):
+            results.append(item)
+
+        pipeline = Pipeline(
+            [Stage("fetch", fetch), Stage("draft", draft), Stage("act", act)],
+            queue_size=1,
+        )
+        asyncio.run(pipeline.run([1, 2, 3]))
+
+        self.assertEqual(results, [1, 2, 3])
+        # The next item is fetched while the previous one is still being drafted.
+        self.assertLess(events.index("fetch:2"), events.index("draft-end:1"))
+
+    def test_backpressure_bounds_buffered_items(self) -> None:
+        produced = 0
+        max_in_flight = 0
+        consumed = 0
+
+        async def produce(item, emit):
+            nonlocal produced, max_in_flight
+            produced += 1
+            max_in_flight = max(max_in_flight, produced - consumed)
+            await emit(item)
+
+        async def consume(item, emit):
+            nonlocal consumed
+            await asyncio.sleep(0.001)
+            consumed += 1
+
+        pipeline = Pipeline([Stage("produce", produce), Stage("consume", consume)], queue_size=2)
+        asyncio.run(pipeline.run(range(20)))
+
+        self.assertEqual(consumed, 20)
+        # Queue capacity plus the item held by each side.
+        self.assertLessEqual(max_in_flight, 4)
+
+    def test_concurrent_workers_and_errors(self) -> None:
+        active = 0
+        peak = 0
+
+        async def work(item, emit):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+        asyncio.run(Pipeline([Stage("work", work, concurrency=3)]).run(range(6)))
+        self.assertEqual(peak, 3)
+
+        async def boom(item, emit):
+            raise ValueError("boom")
+
+        with self.assertRaises(ValueError):
+            asyncio.run(Pipeline([Stage("boom", boom)]).run([1]))
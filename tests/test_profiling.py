@@ -0,0 +1,141 @@
+import asyncio
+import pstats
+import tempfile
+import tracemalloc
+import unittest
+from pathlib import Path
+
+from bot_engine import BotEngine
+from command_router import CommandRouter
+from config import AppConfig
+from llm.base import LLMProvider, LLMResponse
+from observability import profiling
+from scheduler import Scheduler
+from ui.base import UserInterface
+
+
+def _busy_work() -> int:
+    return sum(index * index for index in range(20_000))
+
+
+class RecordingUI(UserInterface):
+    def __init__(self) -> None:
+        self.messages: list[str] = []
+
+    async def start(self) -> None:
+        return None
+
+    async def stop(self) -> None:
+        return None
+
+    async def send_status(self, message: str) -> None:
+        self.messages.append(message)
+
+    async def prompt(self, message: str) -> str:
+        return ""
+
+    async def get_command(self) -> str | None:
+        return None
+
+    async def update_activity(self, message: str, next_action_seconds: float | None = None) -> None:
+        return None
+
+
+class SilentLLM(LLMProvider):
+    async def generate(self, system_prompt: str, user_prompt: str) -> LLMResponse:
+        return LLMResponse(content="")
+
+
+class ProfileLLM(LLMProvider):
+    async def generate(self, system_prompt: str, user_prompt: str) -> LLMResponse:
+        return LLMResponse(content="profile")
+
+
+class ProfilingTests(unittest.TestCase):
+    def test_cpu_profile_captures_work_running_on_the_loop(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "profiles" / "cpu.pstats"
+
+            async def _worker(stop: asyncio.Event) -> None:
+                while not stop.is_set():
+                    _busy_work()
+                    await asyncio.sleep(0)
+
+            async def _run() -> profiling.ProfileReport:
+                stop = asyncio.Event()
+                worker = asyncio.create_task(_worker(stop))
+                try:
+                    return await profiling.profile_cpu(0.3, path)
+                finally:
+                    stop.set()
+                    await worker
+
+            report = asyncio.run(_run())
+            self.assertTrue(any("_busy_work" in line or "<genexpr>" in line for line in report.lines))
+            self.assertIn("_busy_work", str(pstats.Stats(str(path)).stats))
+
+    def test_memory_profile_shows_allocations_still_held(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "mem.tracemalloc"
+            held: list[bytes] = []
+
+            async def _run() -> profiling.ProfileReport:
+                async def _leak() -> None:
+                    for _ in range(20):
+                        held.append(bytes(64 * 1024))
+                        await asyncio.sleep(0.005)
+
+                leak = asyncio.create_task(_leak())
+                report = await profiling.profile_memory(0.2, path)
+                await leak
+                return report
+
+            report = asyncio.run(_run())
+            self.assertFalse(tracemalloc.is_tracing())
+            self.assertIn("test_profiling.py", report.lines[0])
+            self.assertTrue(tracemalloc.Snapshot.load(str(path)).traces)
+
+    def test_only_one_capture_at_a_time(self):
+        async def _run() -> None:
+            first = asyncio.create_task(profiling.profile_cpu(0.2, Path(tempfile.gettempdir()) / "busy.pstats"))
+            await asyncio.sleep(0.01)
+            with self.assertRaises(profiling.ProfilerBusyError):
+                await profiling.profile_memory(0.1, Path(tempfile.gettempdir()) / "busy.tracemalloc")
+            report = await first
+            report.path.unlink()
+
+        asyncio.run(_run())
+
+    def test_profile_command_replies_without_holding_the_command_pump(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            config = AppConfig()
+            config.storage.data_dir = tmp
+            ui = RecordingUI()
+            engine = BotEngine(config, object(), SilentLLM(), Scheduler(config.behavior, config.advanced), ui)
+
+            async def _run() -> None:
+                await engine.handle_command("/profile cpu 0.2")
+                # The command returns at once; the capture runs on its own task.
+                self.assertFalse(engine._profile_task.done())
+                await engine._profile_task
+                await engine.handle_command("/profile disk")
+
+            asyncio.run(_run())
+            self.assertTrue(ui.messages[0].startswith("🔬 Profiling CPU for 0.2s"))
+            self.assertTrue(ui.messages[1].startswith("🔬 CPU profile (0.2s)"))
+            self.assertEqual(len(list((Path(tmp) / "profiles").glob("*-cpu-*.pstats"))), 1)
+            self.assertTrue(ui.messages[2].startswith("⌨️ Usage: /profile"))
+
+    def test_router_accepts_profile_and_bot_suffix(self):
+        router = CommandRouter(SilentLLM())
+        result = asyncio.run(router.parse("/profile@TinyMoltyBot mem 5"))
+        self.assertEqual((result.command, result.source), ("profile", "slash"))
+
+    def test_chat_cannot_start_a_profile(self):
+        router = CommandRouter(ProfileLLM())
+        result = asyncio.run(router.parse("can you profile yourself?"))
+        self.assertEqual((result.command, result.source), ("none", "llm"))
+
+
+if __name__ == "__main__":
+    unittest.main()
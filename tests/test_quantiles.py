@@ -0,0 +1,117 @@
+import asyncio
+import random
+import unittest
+
+from bot_engine import BotEngine
+from config import AppConfig
+from llm.base import LLMProvider, LLMResponse
+from observability import quantiles
+from observability.quantiles import QuantileRegistry, QuantileSketch, RollingQuantiles
+from scheduler import Scheduler
+from ui.base import UserInterface
+
+
+class RecordingUI(UserInterface):
+    def __init__(self) -> None:
+        self.messages: list[str] = []
+
+    async def start(self) -> None:
+        return None
+
+    async def stop(self) -> None:
+        return None
+
+    async def send_status(self, message: str) -> None:
+        self.messages.append(message)
+
+    async def prompt(self, message: str) -> str:
+        return ""
+
+    async def get_command(self) -> str | None:
+        return None
+
+    async def update_activity(self, message: str, next_action_seconds: float | None = None) -> None:
+        return None
+
+
+class EchoLLM(LLMProvider):
+    async def generate(self, system_prompt: str, user_prompt: str) -> LLMResponse:
+        return LLMResponse(content="ok")
+
+
+class QuantileSketchTests(unittest.TestCase):
+    def test_quantiles_stay_within_relative_accuracy(self):
+        rng = random.Random(7)
+        values = [rng.lognormvariate(-2, 1.5) for _ in range(50_000)]
+        sketch = QuantileSketch(accuracy=0.01)
+        for value in values:
+            sketch.add(value)
+        values.sort()
+        for q in (0.5, 0.95, 0.99):
+            exact = values[int(q * (len(values) - 1))]
+            self.assertAlmostEqual(sketch.quantile(q) / exact, 1.0, delta=0.011)
+        # Constant memory: the bucket count depends on the value range, not the sample count.
+        self.assertLess(len(sketch.buckets), 1200)
+
+    def test_bucket_cap_and_merge(self):
+        sketch = QuantileSketch(accuracy=0.01, max_buckets=50)
+        for exponent in range(-60, 40):
+            sketch.add(1.1**exponent)
+        self.assertLessEqual(len(sketch.buckets), 50)
+        other = QuantileSketch(accuracy=0.01)
+        other.add(0.0)
+        other.add(100.0)
+        sketch.merge(other)
+        self.assertEqual(sketch.count, 102)
+        self.assertEqual(sketch.quantile(0.0), 0.0)
+        self.assertAlmostEqual(sketch.quantile(1.0), 100.0, delta=1.0)
+        self.assertIsNone(QuantileSketch().quantile(0.5))
+
+    def test_rolling_window_forgets_old_values(self):
+        now = [0.0]
+        rolling = RollingQuantiles(window_seconds=60, clock=lambda: now[0])
+        rolling.observe(5.0)
+        now[0] = 61
+        rolling.observe(1.0)
+        self.assertEqual(rolling.sketch().count, 2)
+        now[0] = 125
+        self.assertEqual(rolling.sketch().count, 1)
+        now[0] = 400
+        self.assertEqual(rolling.sketch().count, 0)
+
+
+class StatusLatencyTests(unittest.TestCase):
+    def test_status_reports_percentiles_caches_and_quota(self):
+        config = AppConfig()
+        config.behavior.enabled_actions = ["comment", "post"]
+        ui = RecordingUI()
+        scheduler = Scheduler(config.behavior, config.advanced)
+        engine = BotEngine(config, object(), EchoLLM(), scheduler, ui)
+        saved = quantiles.LATENCIES
+        quantiles.LATENCIES = QuantileRegistry()
+        try:
+            for value in (0.1, 0.2, 0.3, 0.4, 2.0):
+                quantiles.observe("moltbook", "GET /feed", value)
+            quantiles.observe("rate_limit", "wait", 0.5)
+            scheduler.record_action("comment")
+            engine._seen_checks, engine._seen_hits = 10, 4
+
+            async def _run() -> None:
+                await engine.llm.generate_for("score", "", "")
+                await engine._run_command("status", raw="/status")
+
+            asyncio.run(_run())
+        finally:
+            quantiles.LATENCIES = saved
+        text = "\n".join(ui.messages)
+        # Nearest-rank percentiles, each within 1% of the true value.
+        self.assertRegex(text, r"GET /feed: p50 (29\d|30[0-3])ms, p95 (39\d|40[0-4])ms, p99 (39\d|40[0-4])ms \(n=5\)")
+        self.assertIn("LLM latency", text)
+        self.assertIn("      score: p50", text)
+        self.assertIn("Rate limiter wait: p50 500ms", text)
+        self.assertIn("Seen index: 4/10 posts already seen (40% hit rate)", text)
+        self.assertIn(f"Daily quota: comment 1/{config.behavior.max_comments_per_day}, post 0/", text)
+
+
+if __name__ == "__main__":
+    unittest.main()
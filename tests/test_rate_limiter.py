@@ -0,0 +1,109 @@
+import asyncio
+import bisect
+import multiprocessing
+import tempfile
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from moltbook.client import MoltbookClient
+from moltbook.rate_limiter import SharedRateLimiter
+
+REQUESTS_PER_MINUTE = 1200
+BURST = 3
+
+
+class _FeedHandler(BaseHTTPRequestHandler):
+    hits: list[float] = []
+
+    def do_GET(self):
+        _FeedHandler.hits.append(time.monotonic())
+        body = b'{"posts": []}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        return
+
+
+class _RecordingLimiter(SharedRateLimiter):
+    """Notes when each token was granted; the first request's connection setup skews server arrival times."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.granted: list[float] = []
+
+    async def wait(self) -> None:
+        await super().wait()
+        self.granted.append(time.time())
+
+
+def _fetch_feeds(base_url: str, db_path: str, count: int, grants_path: str) -> None:
+    async def _run():
+        limiter = _RecordingLimiter(db_path, key="test", requests_per_minute=REQUESTS_PER_MINUTE, burst=BURST)
+        client = MoltbookClient("/nonexistent/credentials.json", base_url=base_url, rate_limiter=limiter)
+        try:
+            for _ in range(count):
+                await client.get_feed(limit=1)
+        finally:
+            await client.close()
+        Path(grants_path).write_text("\n".join(repr(granted) for granted in limiter.granted))
+
+    asyncio.run(_run())
+
+
+class SharedRateLimiterTests(unittest.TestCase):
+    def test_bucket_is_shared_between_instances(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "ratelimit.db"
+            first = SharedRateLimiter(path, requests_per_minute=60, burst=2)
+            second = SharedRateLimiter(path, requests_per_minute=60, burst=2)
+            self.assertEqual(first._try_acquire(), 0.0)
+            self.assertEqual(second._try_acquire(), 0.0)
+            self.assertGreater(first._try_acquire(), 0.5)
+            # A different key has its own budget.
+            other = SharedRateLimiter(path, key="other", requests_per_minute=60, burst=2)
+            self.assertEqual(other._try_acquire(), 0.0)
+            for limiter in (first, second, other):
+                limiter.close()
+
+    def test_processes_share_one_budget(self):
+        _FeedHandler.hits = []
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _FeedHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        base_url = f"http://127.0.0.1:{server.server_address[1]}"
+        context = multiprocessing.get_context("spawn")
+        try:
+            with tempfile.TemporaryDirectory() as tmp:
+                db_path = str(Path(tmp) / "ratelimit.db")
+                grants_paths = [str(Path(tmp) / f"grants{index}.txt") for index in range(3)]
+                processes = [
+                    context.Process(target=_fetch_feeds, args=(base_url, db_path, 12, grants_path))
+                    for grants_path in grants_paths
+                ]
+                for process in processes:
+                    process.start()
+                for process in processes:
+                    process.join(timeout=30)
+                    self.assertEqual(process.exitcode, 0)
+                grants = sorted(float(line) for path in grants_paths for line in Path(path).read_text().split())
+        finally:
+            server.shutdown()
+            server.server_close()
+        self.assertEqual(len(_FeedHandler.hits), 36)
+        self.assertEqual(len(grants), 36)
+        # Over the time an empty bucket takes to refill, a shared budget grants
+        # at most a full bucket plus one refill, whatever the startup skew.
+        # Unshared buckets overlap and grant up to three times that.
+        window = BURST / (REQUESTS_PER_MINUTE / 60.0)
+        busiest = max(bisect.bisect_left(grants, start + window) - index for index, start in enumerate(grants))
+        self.assertLessEqual(busiest, 2 * BURST)
+
+if __name__ == "__main__":
+    unittest.main()
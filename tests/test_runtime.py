@@ -0,0 +1,107 @@
+import asyncio
+import io
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+from unittest.mock import patch
+
+from runtime import AgentRuntime, load_agents
+from tinymolty_main import main, parse_args
+
+
+def _agent_toml(data_dir: Path, credentials: str) -> str:
+    return (
+        '[llm]\nprovider = "openai"\napi_key = "sk-test"\n\n'
+        f'[moltbook]\ncredentials_path = "{credentials}"\n\n'
+        f'[storage]\ndata_dir = "{data_dir}"\n\n'
+        '[telegram]\nbot_token = ""\n'
+    )
+
+
+class AgentRuntimeTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.agents_dir = self.root / "agents"
+        self.agents_dir.mkdir()
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_load_agents_rejects_shared_credentials(self):
+        (self.agents_dir / "alpha.toml").write_text(_agent_toml(self.root / "data", "/tmp/a.json"))
+        (self.agents_dir / "beta.toml").write_text(_agent_toml(self.root / "data", "/tmp/a.json"))
+        with self.assertRaises(ValueError):
+            load_agents(self.agents_dir)
+
+    def test_agents_share_llm_and_route_commands(self):
+        (self.agents_dir / "alpha.toml").write_text(_agent_toml(self.root / "data", "/tmp/a.json"))
+        (self.agents_dir / "beta.toml").write_text(_agent_toml(self.root / "data", "/tmp/b.json"))
+        specs = load_agents(self.agents_dir)
+        self.assertEqual([spec.name for spec in specs], ["alpha", "beta"])
+        runtime = AgentRuntime(specs, stream=io.StringIO())
+
+        async def _run():
+            import httpx
+
+            runtime._moltbook_http = httpx.AsyncClient()
+            runtime._llm_http = httpx.AsyncClient()
+            try:
+                for spec in specs:
+                    runtime.agents[spec.name] = await runtime._start_agent(spec)
+                runtime.dispatch("@beta /pause")
+                runtime.dispatch("/help")
+                queued = {
+                    name: [agent.ui._command_queue.get_nowait() for _ in range(agent.ui._command_queue.qsize())]
+                    for name, agent in runtime.agents.items()
+                }
+                runtime.dispatch("status")
+                return queued
+            finally:
+                for agent in runtime.agents.values():
+                    await agent.storage.close()
+                await runtime._moltbook_http.aclose()
+                await runtime._llm_http.aclose()
+
+        queued = asyncio.run(_run())
+        self.assertEqual(queued, {"alpha": ["/help"], "beta": ["/pause", "/help"]})
+        self.assertEqual(len(runtime._providers), 1)
+        self.assertIs(runtime.agents["alpha"].engine.llm, runtime.agents["beta"].engine.llm)
+        self.assertTrue((self.root / "data" / "agents" / "beta" / "seen").is_dir())
+        self.assertIn("beta: ", runtime.stream.getvalue())
+
+
+
+class CommandLineTests(unittest.TestCase):
+    def test_workers_need_agents_dir(self):
+        with redirect_stderr(io.StringIO()), self.assertRaises(SystemExit) as raised:
+            parse_args(["--workers", "2"])
+        self.assertEqual(raised.exception.code, 2)
+
+    def test_invalid_agents_exit_with_error(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            output = io.StringIO()
+            with patch("sys.argv", ["tinymolty", "--agents-dir", tmp]), redirect_stdout(output):
+                with self.assertRaises(SystemExit) as raised:
+                    main()
+        self.assertEqual(raised.exception.code, 1)
+        self.assertIn("Agents invalid", output.getvalue())
+
+    def test_runtime_errors_are_not_reported_as_invalid_agents(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "alpha.toml").write_text(_agent_toml(root / "data", "/tmp/a.json"))
+            output = io.StringIO()
+            with (
+                patch("sys.argv", ["tinymolty", "--agents-dir", tmp]),
+                patch("runtime.run_agents", side_effect=ValueError("storage broke")),
+                redirect_stdout(output),
+            ):
+                with self.assertRaises(ValueError):
+                    main()
+        self.assertNotIn("Agents invalid", output.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
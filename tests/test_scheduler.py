@@ -1,7 +1,10 @@
+import asyncio
+import tempfile
 import unittest
+from pathlib import Path
 
 from config import AdvancedConfig, BehaviorConfig
-from scheduler import Scheduler
+from scheduler import ACTIONS, DECISIONS, Scheduler
 
 
 class SchedulerTests(unittest.TestCase):
@@ -21,3 +24,134 @@ class SchedulerTests(unittest.TestCase):
         scheduler.record_action("comment")
         self.assertFalse(scheduler.can_do("comment"))
         self.assertGreater(scheduler.next_available_in("comment"), 0)
+
+    def test_reserve_blocks_concurrent_claims(self):
+        behavior = BehaviorConfig(enabled_actions=["upvote"])
+        scheduler = Scheduler(behavior, AdvancedConfig())
+
+        self.assertTrue(scheduler.reserve("upvote"))
+        self.assertFalse(scheduler.reserve("upvote"))
+        scheduler.release("upvote")
+        self.assertTrue(scheduler.reserve("upvote"))
+        scheduler.record_action("upvote")
+        self.assertTrue(scheduler.can_do("upvote"))
+
+    def test_next_due_only_tracks_enabled_actions(self):
+        behavior = BehaviorConfig(
+            enabled_actions=["browse", "post"],
+            browse_interval_minutes=10,
+            post_cooldown_minutes=60,
+        )
+        scheduler = Scheduler(behavior, AdvancedConfig())
+
+        action, wait = scheduler.next_due(["heartbeat", "browse", "post"])
+        self.assertEqual(wait, 0.0)
+        scheduler.record_action("browse")
+        scheduler.record_action("post")
+        action, wait = scheduler.next_due(["heartbeat", "browse", "post"])
+        self.assertEqual(action, "browse")
+        self.assertAlmostEqual(wait, 600, delta=1)
+
+        scheduler.record_backoff("browse", 7200)
+        action, wait = scheduler.next_due(["heartbeat", "browse", "post"])
+        self.assertEqual(action, "post")
+        self.assertIsNone(scheduler.next_due(["heartbeat"])[0])
+
+    def test_daily_cap_defers_until_midnight(self):
+        behavior = BehaviorConfig(enabled_actions=["post"], post_cooldown_minutes=0, max_posts_per_day=1)
+        scheduler = Scheduler(behavior, AdvancedConfig())
+        scheduler.record_action("post")
+        self.assertGreater(scheduler.next_available_in("post"), 0)
+
+    def test_metrics_are_labelled_by_agent(self):
+        behavior = BehaviorConfig(enabled_actions=["post"], post_cooldown_minutes=0)
+        alpha = Scheduler(behavior, AdvancedConfig(), agent="alpha")
+        beta = Scheduler(behavior, AdvancedConfig(), agent="beta")
+        allowed = DECISIONS.labels(agent="alpha", action="post", decision="allowed").value
+        done = {name: ACTIONS.labels(agent=name, action="post").value for name in ("alpha", "beta")}
+        self.assertTrue(alpha.reserve("post"))
+        alpha.record_action("post")
+        self.assertEqual(DECISIONS.labels(agent="alpha", action="post", decision="allowed").value - allowed, 1)
+        self.assertEqual(ACTIONS.labels(agent="alpha", action="post").value - done["alpha"], 1)
+        self.assertEqual(ACTIONS.labels(agent="beta", action="post").value - done["beta"], 0)
+
+    def test_wait_returns_early_when_woken(self):
+        scheduler = Scheduler(BehaviorConfig(), AdvancedConfig())
+
+        async def _run():
+            loop = asyncio.get_running_loop()
+            loop.call_later(0.01, scheduler.wake)
+            started = loop.time()
+            woken = await scheduler.wait(30)
+            return woken, loop.time() - started
+
+        woken, elapsed = asyncio.run(_run())
+        self.assertTrue(woken)
+        self.assertLess(elapsed, 1)
+        # A wake with nobody waiting is remembered for the next wait.
+        scheduler.wake()
+        self.assertTrue(asyncio.run(scheduler.wait(30)))
+
+    def test_state_survives_restart(self):
+        behavior = BehaviorConfig(enabled_actions=["post"], post_cooldown_minutes=60, max_posts_per_day=1)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "scheduler.json"
+
+            async def _run():
+                scheduler = Scheduler(behavior, AdvancedConfig(), state_path=path)
+                scheduler.record_action("post")
+                scheduler.record_backoff("comment", 600)
+                await scheduler.flush()
+
+            asyncio.run(_run())
+            restarted = Scheduler(behavior, AdvancedConfig(), state_path=path)
+            self.assertFalse(restarted.can_do("post"))
+            self.assertGreater(restarted.next_available_in("comment"), 500)
+
+    def test_corrupt_state_file_is_ignored(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "scheduler.json"
+            path.write_text('{"last_action": {"post": "not a date"}}')
+            scheduler = Scheduler(BehaviorConfig(enabled_actions=["post"]), AdvancedConfig(), state_path=path)
+            self.assertTrue(scheduler.can_do("post"))
+
+    def test_pacing_spreads_quota_and_keeps_reserve(self):
+        behavior = BehaviorConfig(
+            enabled_actions=["comment"],
+            comment_cooldown_minutes=0,
+            max_comments_per_day=10,
+            pacing=True,
+        )
+        scheduler = Scheduler(behavior, AdvancedConfig())
+        self.assertTrue(scheduler.can_do("comment"))
+        scheduler.record_action("comment")
+        # The bucket is empty; normal candidates wait, high scorers use the reserve.
+        self.assertFalse(scheduler.can_do("comment"))
+        self.assertFalse(scheduler.can_do("comment", score=0.5))
+        self.assertTrue(scheduler.reserve("comment", score=0.9))
+        scheduler.record_action("comment")
+        wait = scheduler.next_available_in("comment")
+        self.assertGreater(wait, 0)
+        self.assertLess(wait, 24 * 3600)
+
+    def test_adaptive_browse_tracks_feed_velocity(self):
+        behavior = BehaviorConfig(
+            enabled_actions=["browse"],
+            adaptive_browse=True,
+            browse_interval_min_minutes=5,
+            browse_interval_max_minutes=60,
+            browse_target_new_posts=10,
+            feed_limit_min=10,
+            feed_limit_max=50,
+        )
+        scheduler = Scheduler(behavior, AdvancedConfig())
+        self.assertEqual(scheduler.feed_limit(), behavior.feed_limit)
+        scheduler.record_feed_arrivals(0)
+        scheduler._arrivals_at -= 600
+        scheduler.record_feed_arrivals(0)
+        # A quiet feed backs off to the slowest interval and smallest page.
+        self.assertEqual(scheduler.browse_interval_seconds(), 60 * 60)
+        self.assertEqual(scheduler.feed_limit(), 10)
+        scheduler._arrival_rate = 20.0
+        self.assertEqual(scheduler.browse_interval_seconds(), 5 * 60)
+        self.assertEqual(scheduler.feed_limit(), 50)
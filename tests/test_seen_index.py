@@ -0,0 +1,49 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from storage import BloomFilter, SeenIndex
+
+
+class BloomFilterTests(unittest.TestCase):
+    def test_sizing_and_membership(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            bloom = BloomFilter(Path(tmp) / "f.bloom", capacity=2_000_000, error_rate=0.01)
+            # Two million ids fit in a few MB.
+            self.assertLess(bloom.size_bytes, 3 * 1024 * 1024)
+            for i in range(1000):
+                bloom.add(f"post-{i}")
+            self.assertTrue(all(f"post-{i}" in bloom for i in range(1000)))
+            false_positives = sum(f"other-{i}" in bloom for i in range(1000))
+            self.assertLess(false_positives, 5)
+            bloom.close()
+
+
+class SeenIndexTests(unittest.TestCase):
+    def test_persists_ids_and_actions(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            index = SeenIndex(tmp, capacity=1000)
+            index.mark_many(["a", "b"], "scored")
+            index.mark("a", "upvoted")
+            index.close()
+
+            reopened = SeenIndex(tmp, capacity=1000)
+            self.assertEqual(reopened.unseen(["a", "c", "b", "d"]), ["c", "d"])
+            self.assertEqual(reopened.actions("a"), {"scored", "upvoted"})
+            self.assertEqual(reopened.actions("c"), set())
+            self.assertEqual(
+                reopened.actions_many(["b", "c", "a"]),
+                {"b": {"scored"}, "c": set(), "a": {"scored", "upvoted"}},
+            )
+            self.assertEqual(len(reopened), 2)
+            reopened.close()
+
+    def test_rebuilds_filter_when_resized(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            index = SeenIndex(tmp, capacity=1000)
+            index.mark("a", "scored")
+            index.close()
+
+            resized = SeenIndex(tmp, capacity=5000)
+            self.assertTrue(resized.contains("a"))
+            resized.close()
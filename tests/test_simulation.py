@@ -0,0 +1,64 @@
+import asyncio
+import unittest
+from datetime import datetime
+
+from clock import VirtualClock
+from config import AdvancedConfig, AppConfig, BehaviorConfig
+from scheduler import Scheduler
+from simulation import run_simulation
+
+
+class VirtualClockTests(unittest.TestCase):
+    def test_sleep_advances_virtual_time_only(self):
+        clock = VirtualClock(datetime(2026, 3, 1))
+        loop = clock.new_event_loop()
+
+        async def _run():
+            await asyncio.sleep(3600)
+            with self.assertRaises(asyncio.TimeoutError):
+                await asyncio.wait_for(asyncio.Event().wait(), timeout=60)
+            return clock.monotonic()
+
+        try:
+            elapsed = loop.run_until_complete(_run())
+        finally:
+            loop.close()
+        self.assertAlmostEqual(elapsed, 3660)
+        self.assertEqual(clock.utcnow().replace(microsecond=0), datetime(2026, 3, 1, 1, 1))
+
+    def test_scheduler_cooldown_on_virtual_clock(self):
+        clock = VirtualClock()
+        behavior = BehaviorConfig(enabled_actions=["post"], post_cooldown_minutes=30)
+        scheduler = Scheduler(behavior, AdvancedConfig(), clock=clock)
+        scheduler.record_action("post")
+        self.assertFalse(scheduler.can_do("post"))
+        clock.advance(29 * 60)
+        self.assertAlmostEqual(scheduler.next_available_in("post"), 60)
+        clock.advance(60)
+        self.assertTrue(scheduler.can_do("post"))
+
+
+class SimulationTests(unittest.TestCase):
+    def _config(self) -> AppConfig:
+        config = AppConfig()
+        config.behavior.enabled_actions = ["post", "comment", "upvote", "browse", "heartbeat"]
+        return config
+
+    def test_day_respects_limits_and_is_reproducible(self):
+        config = self._config()
+        first = run_simulation(config, hours=24, seed=7)
+        second = run_simulation(config, hours=24, seed=7)
+        self.assertEqual(first.actions, second.actions)
+        self.assertEqual(first.api_calls, second.api_calls)
+        self.assertEqual(first.prompt_tokens, second.prompt_tokens)
+        self.assertLessEqual(first.actions["comment"], config.behavior.max_comments_per_day)
+        self.assertLessEqual(first.actions["post"], config.behavior.max_posts_per_day)
+        # One browse every 15 minutes, give or take jitter.
+        self.assertGreater(first.actions["browse"], 80)
+        self.assertEqual(first.actions["heartbeat"], 6)
+        self.assertGreater(first.llm_calls, 0)
+        self.assertLess(first.wall_seconds, 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+import json
+import subprocess
+import sys
+import time
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+# Generous enough for slow CI machines; an eager Textual/OpenAI import blows well past it.
+HELP_BUDGET_SECONDS = 1.0
+HEAVY_MODULES = ["textual", "openai", "google.genai", "bot_engine", "keyring", "pydantic"]
+
+
+def _loaded_after(statement: str) -> list[str]:
+    code = (
+        "import json, sys\n"
+        f"{statement}\n"
+        f"print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    return json.loads(result.stdout)
+
+
+class StartupTests(unittest.TestCase):
+    def test_help_stays_under_budget(self):
+        code = "import sys; sys.argv = ['tinymolty', '--help']; import tinymolty_main; tinymolty_main.main()"
+        started = time.perf_counter()
+        result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True)
+        elapsed = time.perf_counter() - started
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertIn("--headless", result.stdout)
+        self.assertLess(elapsed, HELP_BUDGET_SECONDS)
+
+    def test_entry_point_imports_nothing_heavy(self):
+        self.assertEqual(_loaded_after("import tinymolty_main"), [])
+
+    def test_setup_wizard_does_not_load_engine(self):
+        loaded = _loaded_after("import setup, setup.registration_wizard")
+        self.assertNotIn("bot_engine", loaded)
+        self.assertNotIn("textual", loaded)
+        self.assertNotIn("openai", loaded)
+
+    def test_build_provider_loads_only_the_configured_sdk(self):
+        loaded = _loaded_after(
+            "from config import LLMConfig\n"
+            "from llm.factory import build_provider\n"
+            "build_provider(LLMConfig(provider='openai'), 'sk-test')"
+        )
+        self.assertIn("openai", loaded)
+        self.assertNotIn("google.genai", loaded)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+import asyncio
+import io
+import os
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+from supervisor import RESTART_MAX_SECONDS, Supervisor, _serve_worker, restart_delay, shard_paths
+
+
+_AGENT_TOML = (
+    '[llm]\nprovider = "openai"\napi_key = "sk-test"\n\n'
+    '[moltbook]\ncredentials_path = "{root}/alpha.json"\n\n'
+    '[storage]\ndata_dir = "{root}/data"\n\n'
+    '[telegram]\nbot_token = ""\n'
+)
+
+
+class IdleRuntime:
+    """Stands in for AgentRuntime in a worker: reports status until told to stop."""
+
+    def __init__(self) -> None:
+        self._stopped = asyncio.Event()
+
+    def status(self) -> dict:
+        return {"alpha": {"running": True, "paused": False}}
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+    async def run(self) -> None:
+        await self._stopped.wait()
+
+
+def _crash_once_then_serve(index, paths, conn) -> None:
+    marker = Path(paths[0]).with_suffix(".crashed")
+    if not marker.exists():
+        marker.write_text("")
+        os._exit(3)
+    asyncio.run(_serve_worker(index, IdleRuntime(), conn))
+
+
+def _close_pipe_then_linger(index, paths, conn) -> None:
+    conn.close()
+    time.sleep(1.5)
+
+
+def _wait_for(condition, timeout: float = 20.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.05)
+    return False
+
+
+class SupervisorTests(unittest.TestCase):
+    def test_shard_paths_round_robin(self):
+        paths = [Path(f"agent{index}.toml") for index in range(5)]
+        shards = shard_paths(paths, 2)
+        self.assertEqual(shards, [paths[0::2], paths[1::2]])
+        # Never more workers than agents.
+        self.assertEqual(len(shard_paths(paths[:2], 8)), 2)
+
+    def test_restart_delay_backs_off(self):
+        self.assertEqual(restart_delay(1), 1.0)
+        self.assertEqual(restart_delay(3), 4.0)
+        self.assertEqual(restart_delay(50), RESTART_MAX_SECONDS)
+
+    def test_crashed_worker_restarts_and_reports_status(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "alpha.toml").write_text(_AGENT_TOML.format(root=root))
+            output = io.StringIO()
+            supervisor = Supervisor(
+                root, 1, stream=output, worker_main=_crash_once_then_serve, status_interval=0.2
+            )
+            thread = threading.Thread(target=supervisor.run, daemon=True)
+            thread.start()
+            worker = supervisor.workers[0]
+            try:
+                self.assertTrue(_wait_for(lambda: worker.restarts == 1 and worker.last_status), output.getvalue())
+            finally:
+                supervisor.stop()
+                thread.join(timeout=20)
+            self.assertFalse(thread.is_alive())
+        log = output.getvalue()
+        self.assertIn("💥 Worker 0 exited with 3; restarting in 1s", log)
+        self.assertEqual(worker.last_status["worker"], 0)
+        self.assertEqual(worker.last_status["agents"], {"alpha": {"running": True, "paused": False}})
+        self.assertIn("1/1 agents active", log)
+        # The restarted worker shut down cleanly instead of being restarted again.
+        self.assertTrue(worker.finished)
+        self.assertEqual(worker.restarts, 1)
+        self.assertIn("⏹️  Worker 0 finished", log)
+
+    def test_closed_pipe_does_not_spin_the_supervisor(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "alpha.toml").write_text(_AGENT_TOML.format(root=root))
+            supervisor = Supervisor(root, 1, stream=io.StringIO(), worker_main=_close_pipe_then_linger)
+            started = time.process_time()
+            supervisor.run()
+        worker = supervisor.workers[0]
+        self.assertTrue(worker.finished)
+        self.assertIsNone(worker.conn)
+        # Spinning on the dead pipe would burn the whole 1.5s the worker lingers.
+        self.assertLess(time.process_time() - started, 0.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
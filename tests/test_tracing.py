@@ -0,0 +1,89 @@
+import asyncio
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from config import AppConfig, ObservabilityConfig
+from observability.tracing import Tracer, TraceFileExporter, TRACER, configure_tracing, flame_lines
+from simulation import run_simulation
+
+
+class TracerTests(unittest.TestCase):
+    def test_spans_nest_across_tasks_and_export(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            jsonl = TraceFileExporter(Path(tmp) / "traces.jsonl")
+            otlp = TraceFileExporter(Path(tmp) / "traces.otlp.jsonl", "otlp")
+            tracer = Tracer()
+            tracer.configure(True, [jsonl, otlp])
+
+            async def _child(name: str) -> None:
+                with tracer.span(name):
+                    await asyncio.sleep(0)
+
+            async def _run() -> None:
+                with tracer.span("tick") as root:
+                    await asyncio.gather(_child("fetch"), _child("fetch"), _child("score"))
+                    with self.assertRaises(RuntimeError):
+                        with tracer.span("post"):
+                            raise RuntimeError("boom")
+                with tracer.span("idle"):
+                    pass
+                await tracer.flush()
+                lines = flame_lines(root)
+                self.assertTrue(lines[0].startswith("tick "))
+                self.assertTrue(any(line.strip().startswith("fetch ×2") for line in lines))
+                self.assertTrue(any("❌1" in line for line in lines))
+
+            asyncio.run(_run())
+            # The span-less "idle" tick is not exported.
+            trees = [json.loads(line) for line in (Path(tmp) / "traces.jsonl").read_text().splitlines()]
+            self.assertEqual(len(trees), 1)
+            self.assertEqual([child["name"] for child in trees[0]["children"]], ["fetch", "fetch", "score", "post"])
+            self.assertEqual(trees[0]["children"][3]["error"], "RuntimeError")
+            request = json.loads((Path(tmp) / "traces.otlp.jsonl").read_text())
+            spans = request["resourceSpans"][0]["scopeSpans"][0]["spans"]
+            self.assertEqual(len(spans), 5)
+            root = next(span for span in spans if span["name"] == "tick")
+            self.assertTrue(all(span["parentSpanId"] == root["spanId"] for span in spans if span is not root))
+            self.assertEqual(len({span["traceId"] for span in spans}), 1)
+
+    def test_disabled_tracer_yields_none(self):
+        tracer = Tracer()
+        with tracer.span("tick") as span:
+            self.assertIsNone(span)
+
+    def test_workers_write_their_own_trace_file(self):
+        config = ObservabilityConfig(tracing_enabled=True)
+        try:
+            configure_tracing(config, "/data")
+            self.assertEqual(TRACER.exporters[0].path, Path("/data/traces.jsonl"))
+            configure_tracing(config, "/data", worker=2)
+            self.assertEqual(TRACER.exporters[0].path, Path("/data/traces.worker2.jsonl"))
+            configure_tracing(config.model_copy(update={"tracing_format": "otlp"}), "/data", worker=2)
+            self.assertEqual(TRACER.exporters[0].path, Path("/data/traces.otlp.worker2.jsonl"))
+        finally:
+            TRACER.configure(False)
+
+    def test_engine_ticks_produce_trees(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "traces.jsonl"
+            config = AppConfig()
+            config.behavior.enabled_actions = ["comment", "upvote", "browse"]
+            TRACER.configure(True, [TraceFileExporter(path)])
+            try:
+                run_simulation(config, hours=1, seed=2)
+            finally:
+                TRACER.configure(False)
+            trees = [json.loads(line) for line in path.read_text().splitlines()]
+        browses = [child for tree in trees for child in tree["children"] if child["name"] == "browse"]
+        self.assertTrue(browses)
+        self.assertTrue(all(browse["children"][0]["name"] == "GET /feed" for browse in browses))
+        # Once posts have arrived, scoring and its LLM call show up under the browse.
+        scored = [child for browse in browses for child in browse["children"] if child["name"] == "score"]
+        self.assertTrue(scored)
+        self.assertEqual(scored[0]["children"][0]["name"], "llm score")
+
+
+if __name__ == "__main__":
+    unittest.main()
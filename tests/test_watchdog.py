@@ -0,0 +1,69 @@
+import asyncio
+import json
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from observability import REGISTRY
+from observability.activity_log import ActivityLog
+from observability.watchdog import LoopBlockedError, LoopWatchdog
+
+
+def _read_credentials_synchronously() -> None:
+    # Stands in for a blocking call such as a sync file read or keyring lookup.
+    time.sleep(0.3)
+
+
+class LoopWatchdogTests(unittest.TestCase):
+    def test_strict_mode_fails_on_a_blocking_step_with_its_stack(self):
+        async def _run() -> None:
+            async with LoopWatchdog(threshold=0.1, interval=0.02, strict=True):
+                await asyncio.sleep(0.05)
+                _read_credentials_synchronously()
+                await asyncio.sleep(0.05)
+
+        with self.assertRaises(LoopBlockedError) as caught:
+            asyncio.run(_run())
+        block = caught.exception.blocks[0]
+        self.assertGreaterEqual(block.seconds, 0.1)
+        self.assertIn("_read_credentials_synchronously", "".join(block.stack))
+        self.assertTrue(block.location.startswith("test_watchdog.py:"))
+        self.assertIn("time.sleep", block.stack[-1])
+
+    def test_cooperative_code_passes_strict_mode(self):
+        async def _run() -> list:
+            async with LoopWatchdog(threshold=0.1, interval=0.02, strict=True) as watchdog:
+                for _ in range(10):
+                    await asyncio.sleep(0.01)
+            return watchdog.blocks
+
+        self.assertEqual(asyncio.run(_run()), [])
+
+    def test_blocks_are_reported_to_metrics_activity_log_and_notify(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            log = ActivityLog(Path(tmp) / "activity.jsonl")
+            notified = []
+
+            async def _run() -> None:
+                watchdog = LoopWatchdog(threshold=0.1, interval=0.02, activity=log, agent="molty", notify=notified.append)
+                await watchdog.start()
+                time.sleep(0.3)
+                await asyncio.sleep(0.05)
+                await watchdog.stop()
+                await log.close()
+
+            before = REGISTRY.get("tinymolty_event_loop_blocks").labels().value
+            asyncio.run(_run())
+            events = [json.loads(line) for line in (Path(tmp) / "activity.jsonl").read_text().splitlines()]
+        self.assertEqual(len(notified), 1)
+        self.assertTrue(notified[0].summary().startswith("🐢 Event loop blocked"))
+        self.assertEqual(REGISTRY.get("tinymolty_event_loop_blocks").labels().value, before + 1)
+        self.assertEqual(events[0]["event"], "loop_blocked")
+        self.assertEqual(events[0]["agent"], "molty")
+        self.assertIn("test_watchdog.py", events[0]["stack"])
+        self.assertIn("tinymolty_event_loop_lag_seconds_count", REGISTRY.render())
+
+
+if __name__ == "__main__":
+    unittest.main()
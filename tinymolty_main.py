@@ -7,25 +7,85 @@ from __future__ import annotations
 import argparse
 from pathlib import Path
 
-from app import run
-from config import (
-    resolve_secrets,
-    try_load_config,
-    validate_config,
-)
-from setup import run_setup
 
-
-def parse_args() -> argparse.Namespace:
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="TinyMolty - Moltbook AI agent bot")
     parser.add_argument("--setup", action="store_true", help="Run setup wizard")
     parser.add_argument("--config", type=str, help="Path to config TOML")
-    return parser.parse_args()
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="Run without the terminal UI, logging to stderr (for systemd/containers)",
+    )
+    parser.add_argument(
+        "--agents-dir",
+        type=str,
+        help="Run every config TOML in this directory as its own agent, in one process",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="With --agents-dir, spread the agents over this many worker processes",
+    )
+    parser.add_argument(
+        "--simulate",
+        type=float,
+        nargs="?",
+        const=24.0,
+        metavar="HOURS",
+        help="Simulate HOURS (default 24) of bot behavior against fake backends and print a report",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for --simulate")
+    args = parser.parse_args(argv)
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.workers > 1 and not args.agents_dir:
+        parser.error("--workers only applies together with --agents-dir")
+    return args
 
 
 def main() -> None:
+    # Everything past argument parsing is imported on demand, so `--help` and
+    # the setup wizard stay fast and headless runs never load Textual.
     args = parse_args()
+    if args.agents_dir:
+        from runtime import load_agents, run_agents
+
+        try:
+            if args.workers > 1:
+                from supervisor import Supervisor, run_supervisor
+
+                supervisor = Supervisor(args.agents_dir, args.workers)
+            else:
+                agents = load_agents(args.agents_dir)
+        except (FileNotFoundError, ValueError) as exc:
+            print(f"Agents invalid: {exc}")
+            raise SystemExit(1)
+        if args.workers > 1:
+            run_supervisor(supervisor)
+        else:
+            run_agents(agents)
+        return
+    from config import resolve_secrets, try_load_config, validate_config
+
     config_path = Path(args.config).expanduser() if args.config else None
+    if args.simulate is not None:
+        from config import AppConfig
+        from simulation import run_simulation
+
+        config, error = try_load_config(config_path)
+        if config is None:
+            if error != "missing":
+                print(f"Config invalid: {error}")
+                raise SystemExit(1)
+            # No secrets are needed, so the defaults are enough to try things out.
+            config = AppConfig()
+        report = run_simulation(config, hours=args.simulate, seed=args.seed)
+        print("\n".join(report.lines()))
+        return
+    from setup import run_setup
+
     if args.setup:
         config = run_setup(config_path)
     else:
@@ -33,9 +93,21 @@ def main() -> None:
         if config is None:
             if error != "missing":
                 print(f"Config invalid: {error}")
+            if args.headless:
+                # No one to answer the setup wizard.
+                if error == "missing":
+                    print("Config not found; run `tinymolty --setup` first.")
+                raise SystemExit(1)
             config = run_setup(config_path)
     secrets = resolve_secrets(config)
     validate_config(config, secrets)
+    if args.headless:
+        from headless import run_headless
+
+        run_headless(config, secrets, config_path)
+        return
+    from app import run
+
     run(config, secrets)
 
 
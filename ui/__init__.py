@@ -1,9 +1,16 @@
 from .base import UserInterface
-try:
-    from .tui_app import TinyMoltyApp
-except ModuleNotFoundError as exc:
-    if exc.name != "textual":
-        raise
-    TinyMoltyApp = None  # type: ignore[assignment]
 
 __all__ = ["UserInterface", "TinyMoltyApp"]
+
+
+def __getattr__(name: str):
+    # The Textual app pulls in textual and the whole engine; load it on first use only.
+    if name == "TinyMoltyApp":
+        try:
+            from .tui_app import TinyMoltyApp
+        except ModuleNotFoundError as exc:
+            if exc.name != "textual":
+                raise
+            TinyMoltyApp = None  # type: ignore[assignment]
+        return TinyMoltyApp
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
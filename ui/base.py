@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
 
 
@@ -34,6 +35,18 @@ class UserInterface(ABC):
     async def get_command(self) -> str | None:
         raise NotImplementedError
 
+    async def wait_command(self) -> str:
+        """Block until a command arrives.
+
+        The default polls ``get_command``; UIs that receive commands on a queue
+        should override this to await it directly.
+        """
+        while True:
+            command = await self.get_command()
+            if command:
+                return command
+            await asyncio.sleep(0.5)
+
     @abstractmethod
     async def update_activity(self, message: str, next_action_seconds: float | None = None) -> None:
         raise NotImplementedError
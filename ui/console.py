@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import asyncio
+import sys
+from datetime import datetime
+from typing import TextIO
+
+from .base import UserInterface
+
+
+class ConsoleUI(UserInterface):
+    """Plain line output for one agent, used when several agents share a terminal.
+
+    Every line is prefixed with the agent name. Commands are not read here;
+    whoever owns the terminal routes them in with ``push_command``.
+    """
+
+    def __init__(self, name: str, stream: TextIO | None = None, show_summaries: bool = False) -> None:
+        self.name = name
+        self.stream = stream or sys.stdout
+        self.show_summaries = show_summaries
+        self._command_queue: asyncio.Queue[str] = asyncio.Queue()
+
+    async def start(self) -> None:
+        return
+
+    async def stop(self) -> None:
+        return
+
+    def _write(self, message: str) -> None:
+        timestamp = datetime.now().strftime("%H:%M:%S")
+        for line in message.splitlines() or [""]:
+            print(f"[{timestamp}] [{self.name}] {line}", file=self.stream, flush=True)
+
+    async def send_status(self, message: str) -> None:
+        self._write(message)
+
+    async def send_summary(self, message: str) -> None:
+        if self.show_summaries:
+            self._write(message)
+
+    async def prompt(self, message: str) -> str:
+        self._write(message)
+        return ""
+
+    def push_command(self, command: str) -> None:
+        self._command_queue.put_nowait(command)
+
+    async def get_command(self) -> str | None:
+        if self._command_queue.empty():
+            return None
+        return self._command_queue.get_nowait()
+
+    async def wait_command(self) -> str:
+        return await self._command_queue.get()
+
+    async def update_activity(self, message: str, next_action_seconds: float | None = None) -> None:
+        return
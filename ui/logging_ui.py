@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+
+from .base import UserInterface
+
+
+class LoggingUI(UserInterface):
+    """Headless UI: status goes to the ``logging`` module, there is no terminal input.
+
+    Suited to systemd or containers, where stdout/stderr end up in a journal.
+    Commands can still arrive through Telegram when wrapped in ``MultiUI``.
+    """
+
+    def __init__(self, logger: logging.Logger | None = None) -> None:
+        self.logger = logger or logging.getLogger("tinymolty")
+
+    async def start(self) -> None:
+        return
+
+    async def stop(self) -> None:
+        return
+
+    async def send_status(self, message: str) -> None:
+        level = logging.WARNING if message.startswith(("⚠️", "❌")) else logging.INFO
+        self.logger.log(level, message)
+
+    async def prompt(self, message: str) -> str:
+        self.logger.info(message)
+        return ""
+
+    async def get_command(self) -> str | None:
+        return None
+
+    async def wait_command(self) -> str:
+        # Nothing to read from; the engine cancels this when it shuts down.
+        await asyncio.Event().wait()
+        return ""
+
+    async def update_activity(self, message: str, next_action_seconds: float | None = None) -> None:
+        self.logger.debug(message)
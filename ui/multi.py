@@ -9,22 +9,27 @@ class MultiUI(UserInterface):
     def __init__(self, primary: UserInterface, secondary: UserInterface | None = None) -> None:
         self.primary = primary
         self.secondary = secondary
+        self._ready_commands: list[str] = []
 
     async def start(self) -> None:
         import sys
-        print(f"[MultiUI] Starting primary UI...", file=sys.stderr, flush=True)
-        await self.primary.start()
+        if not self.secondary:
+            print(f"[MultiUI] No secondary UI", file=sys.stderr, flush=True)
+            await self.primary.start()
+            return
+        print(f"[MultiUI] Starting primary and secondary (Telegram) UI...", file=sys.stderr, flush=True)
+        # Start both at once: Telegram setup is a network round trip the terminal need not wait for.
+        primary, secondary = await asyncio.gather(
+            self.primary.start(), self.secondary.start(), return_exceptions=True
+        )
+        if isinstance(primary, BaseException):
+            raise primary
         print(f"[MultiUI] Primary UI started", file=sys.stderr, flush=True)
-        if self.secondary:
-            print(f"[MultiUI] Starting secondary UI (Telegram)...", file=sys.stderr, flush=True)
-            try:
-                await self.secondary.start()
-                print(f"[MultiUI] Secondary UI started", file=sys.stderr, flush=True)
-            except Exception as exc:
-                print(f"[MultiUI] ❌ Secondary start failed: {exc}", file=sys.stderr, flush=True)
-                await self.primary.send_status(f"⚠️ Telegram start failed: {type(exc).__name__}: {exc}")
+        if isinstance(secondary, BaseException):
+            print(f"[MultiUI] ❌ Secondary start failed: {secondary}", file=sys.stderr, flush=True)
+            await self.primary.send_status(f"⚠️ Telegram start failed: {type(secondary).__name__}: {secondary}")
         else:
-            print(f"[MultiUI] No secondary UI", file=sys.stderr, flush=True)
+            print(f"[MultiUI] Secondary UI started", file=sys.stderr, flush=True)
 
     async def stop(self) -> None:
         await self.primary.stop()
@@ -58,6 +63,29 @@ class MultiUI(UserInterface):
                 return cmd
         return await self.primary.get_command()
 
+    async def wait_command(self) -> str:
+        if self._ready_commands:
+            return self._ready_commands.pop(0)
+        if not self.secondary:
+            return await self.primary.wait_command()
+        waiters = [
+            asyncio.create_task(self.secondary.wait_command()),
+            asyncio.create_task(self.primary.wait_command()),
+        ]
+        try:
+            await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for waiter in waiters:
+                waiter.cancel()
+        # Both sides may have delivered in the same step; keep the extra one.
+        finished = [waiter for waiter in waiters if waiter.done() and not waiter.cancelled()]
+        for waiter in finished:
+            if waiter.exception() is None:
+                self._ready_commands.append(waiter.result())
+        if not self._ready_commands:
+            raise finished[0].exception()
+        return self._ready_commands.pop(0)
+
     def get_command_sync(self) -> str | None:
         if self.secondary and hasattr(self.secondary, "get_command_sync"):
             cmd = self.secondary.get_command_sync()
@@ -107,6 +135,9 @@ class FilteredUI(UserInterface):
     async def get_command(self) -> str | None:
         return await self.inner.get_command()
 
+    async def wait_command(self) -> str:
+        return await self.inner.wait_command()
+
     async def update_activity(self, message: str, next_action_seconds: float | None = None) -> None:
         if self.should_send(message):
             await self.inner.update_activity(message, next_action_seconds)
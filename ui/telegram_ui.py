@@ -14,11 +14,16 @@ class TelegramUI(UserInterface):
         bot_token: str,
         chat_id: str | None,
         on_chat_id: callable | None = None,
+        http_client: httpx.AsyncClient | None = None,
+        poll_timeout: httpx.Timeout | None = None,
     ) -> None:
         self.bot_token = bot_token
         self.chat_id = chat_id or ""
         self._on_chat_id = on_chat_id
-        self._client = httpx.AsyncClient(timeout=30.0)
+        # A pooled client belongs to the HttpPool that lent it.
+        self._owns_client = http_client is None
+        self._client = http_client or httpx.AsyncClient(timeout=30.0)
+        self._poll_timeout = poll_timeout
         self._poll_task: asyncio.Task | None = None
         self._command_queue: asyncio.Queue[str] = asyncio.Queue()
         self._reply_queue: asyncio.Queue[str] = asyncio.Queue()
@@ -37,7 +42,8 @@ class TelegramUI(UserInterface):
         self._running = False
         if self._poll_task:
             self._poll_task.cancel()
-        await self._client.aclose()
+        if self._owns_client:
+            await self._client.aclose()
 
     async def send_status(self, message: str) -> None:
         await self._send_message(message)
@@ -51,6 +57,9 @@ class TelegramUI(UserInterface):
             return None
         return self._command_queue.get_nowait()
 
+    async def wait_command(self) -> str:
+        return await self._command_queue.get()
+
     def get_command_sync(self) -> str | None:
         if self._command_queue.empty():
             return None
@@ -87,6 +96,7 @@ class TelegramUI(UserInterface):
                 {"command": "resume", "description": "Resume the agent"},
                 {"command": "quit", "description": "Shut down gracefully"},
                 {"command": "help", "description": "Show available commands"},
+                {"command": "profile", "description": "Profile CPU or memory: /profile cpu 10, /profile mem 30"},
             ]
         }
         try:
@@ -103,7 +113,9 @@ class TelegramUI(UserInterface):
             try:
                 print(f"[Telegram] 🔍 Polling... (offset={self._offset})", file=sys.stderr, flush=True)
                 response = await self._client.get(
-                    url, params={"timeout": 5, "offset": self._offset}
+                    url,
+                    params={"timeout": 5, "offset": self._offset},
+                    timeout=self._poll_timeout or httpx.USE_CLIENT_DEFAULT,
                 )
                 response.raise_for_status()
                 data = response.json()
@@ -131,7 +143,8 @@ class TelegramUI(UserInterface):
                     if text.startswith("/"):
                         command = text.lstrip("/").split()[0].lower()
                         print(f"[Telegram] 🎯 Command: {command}", file=sys.stderr, flush=True)
-                        await self._command_queue.put(command)
+                        # The whole text, so commands keep their arguments (/profile cpu 30).
+                        await self._command_queue.put(text)
                         print(f"[Telegram] ✅ Queued (size={self._command_queue.qsize()})", file=sys.stderr, flush=True)
                     else:
                         await self._reply_queue.put(text)
@@ -12,9 +12,13 @@ from textual.widgets import Input, Log, Static
 
 from bot_engine import BotEngine
 from config import AppConfig, ResolvedSecrets
+from http_pool import MOLTBOOK_HOST, TELEGRAM_HOST, HttpPool
 from llm.factory import build_provider
 from moltbook.client import MoltbookClient
+from moltbook.rate_limiter import build_rate_limiter
+from observability import observability_session
 from scheduler import Scheduler
+from storage import open_storage
 from ui.telegram_ui import TelegramUI
 from ui.multi import MultiUI
 
@@ -62,6 +66,11 @@ class _TextualUIAdapter:
         # Commands are handled directly by the TUI, not pulled by the engine.
         return None
 
+    async def wait_command(self) -> str:
+        # Never returns: TinyMoltyApp._command_loop calls BotEngine.handle_command itself.
+        await asyncio.Event().wait()
+        return ""
+
     async def update_activity(self, message: str, next_action_seconds: float | None = None) -> None:
         # For now we don't render activity in the header (keeps UI stable and uncluttered).
         return
@@ -100,6 +109,7 @@ class TinyMoltyApp(App):
         self.secrets = secrets
         self._engine: BotEngine | None = None
         self._client: MoltbookClient | None = None
+        self._pool = HttpPool(config.http)
         self._command_queue: asyncio.Queue[str] = asyncio.Queue()
 
     def compose(self) -> ComposeResult:
@@ -120,6 +130,7 @@ class TinyMoltyApp(App):
     async def on_unmount(self) -> None:
         if self._client:
             await self._client.close()
+        await self._pool.aclose()
 
     def on_worker_state_changed(self, event: Worker.StateChanged) -> None:
         worker = event.worker
@@ -198,6 +209,8 @@ class TinyMoltyApp(App):
                     bot_token=self.secrets.telegram_token,
                     chat_id=self.config.telegram.chat_id,
                     on_chat_id=None,
+                    http_client=self._pool.client(TELEGRAM_HOST, "telegram"),
+                    poll_timeout=self._pool.timeout("poll"),
                 )
                 ui = MultiUI(primary=tui, secondary=telegram_ui)
                 self.post_message(StatusMessage("✅ Telegram UI initialized"))
@@ -207,17 +220,45 @@ class TinyMoltyApp(App):
         else:
             ui = tui
 
-        self._client = MoltbookClient(self.config.moltbook.credentials_path)
-        scheduler = Scheduler(self.config.behavior, self.config.advanced)
-        llm = build_provider(self.config.llm, self.secrets.llm_api_key)
-        self._engine = BotEngine(self.config, self._client, llm, scheduler, ui)
+        self._client = MoltbookClient(
+            self.config.moltbook.credentials_path,
+            rate_limiter=build_rate_limiter(self.config.moltbook, self.config.storage.data_dir),
+            http_client=self._pool.client(MOLTBOOK_HOST),
+            agent=self.config.bot.name,
+        )
+        storage = await open_storage(self.config.storage)
+        scheduler = Scheduler(
+            self.config.behavior, self.config.advanced, state_path=storage.scheduler_path, agent=self.config.bot.name
+        )
+        llm = build_provider(self.config.llm, self.secrets.llm_api_key, self._pool)
         try:
-            # IMPORTANT: Start UI (launches Telegram polling if enabled)
-            await ui.start()
-            await self._engine.run_loop()
+            async with observability_session(
+                self.config.observability,
+                self.config.storage.data_dir,
+                agent=self.config.bot.name,
+                notify=lambda text: self.post_message(StatusMessage(text)),
+            ) as activity:
+                self._engine = BotEngine(
+                    self.config,
+                    self._client,
+                    llm,
+                    scheduler,
+                    ui,
+                    seen_index=storage.seen_index,
+                    journal=storage.journal,
+                    follow_cache=storage.follow_cache,
+                    activity=activity,
+                )
+                # IMPORTANT: Start UI (launches Telegram polling if enabled). The account
+                # check and LLM warm-up run alongside so startup pays one round trip, not three.
+                await asyncio.gather(ui.start(), self._engine.prepare())
+                await self._engine.run_loop()
         finally:
             await ui.stop()
             await self._client.close()
+            await scheduler.flush()
+            await storage.close()
+            await self._pool.aclose()
 
     def set_agent_info(
         self,